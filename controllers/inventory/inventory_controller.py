@@ -11,6 +11,11 @@ generate inventory reports.
 - Update item details such as quantity, price, and supplier information.
 - Delete items when they are no longer needed.
 - Retrieve stock levels and check for low inventory alerts.
+- Search items by name through the FTS5 trigram index, ranked by relevance.
+- Import stock lists and supplier price lists from CSV files of any size, chunk by chunk.
+- Consume the ingredients of sold dishes and take dishes whose ingredients ran out off the menu.
+- Decrement stock with one conditional UPDATE per sale, or per order, so concurrent terminals never oversell.
+- Detect concurrent edits of an item through its version column and retry them on the fresh row.
 - Generate reports on inventory usage and restocking requirements.
 
 🛠️ Dependencies:
@@ -18,22 +23,48 @@ generate inventory reports.
 - SQLAlchemy -> ORM for efficient database interactions.
 - ReportLab -> For generating inventory reports in PDF format.
 - logging -> For logging inventory transactions and errors.
+- WriteQueue -> Routes stock writes through the single database writer thread.
 - datetime -> For timestamping inventory updates.
 """
 
 
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict
-
+from typing import Callable, Optional, List, Dict
+from sqlalchemy import case, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+from controllers.utils.csv_import import ImportReport, RowValidationError, import_csv, price_field, required_field
+from controllers.validation.inventory_validation import validate_expiration_date, validate_item_name, validate_stock_quantity
+from database.bulk import BulkPersistenceService
+from database.menu_catalog import get_menu_catalog
+from database.menu_publisher import get_menu_publisher
+from database.recipes import consumed_ingredients, refresh_stock_state
+from database.search import INVENTORY_INDEX, rank, search_ids
+from database.write_queue import WriteQueue, end_read, run_write
+from models import Inventory, InventoryRecord, Supplier
 
 # Logging setup
 logging.basicConfig(filename="inventory.log", level=logging.INFO, format="%(asctime)s - %(message)s")
 
+# How often an item edit is re-applied after another terminal changed the same row first.
+STALE_EDIT_RETRIES = 3
+
 
 class InventoryController:
-    def __init__(self):
-        pass
+    """
+    Manages inventory items and stock levels in the Restaurant Management System (RMS).
+    """
+
+    def __init__(self, db_session: Session, write_queue: Optional[WriteQueue] = None):
+        """
+        Initializes the InventoryController with a database session.
+
+        :param db_session: The SQLAlchemy session for database interactions.
+        :param write_queue: (Optional) The write queue that stock writes are routed through.
+        """
+        self.session = db_session
+        self.write_queue = write_queue
 
     def add_item(self, name: str, quantity: int, price: float, supplier: Optional[str] = None) -> None:
         """
@@ -56,8 +87,43 @@ class InventoryController:
         :param price: (Optional) New price of the item.
         :param supplier: (Optional) New supplier name.
         :return: True if the update was successful, False if item was not found.
+        :raises StaleDataError: If the item kept changing concurrently for every retry.
         """
-        pass
+        def edit(reload: bool) -> Callable[[Session], Optional[List[int]]]:
+            def work(session: Session) -> Optional[List[int]]:
+                # A retry must not reuse the stale copy held in the session's identity map.
+                item = session.get(Inventory, item_id, populate_existing=reload)
+                if item is None:
+                    return None
+                if name is not None:
+                    item.name = name
+                if quantity is not None:
+                    item.quantity = quantity
+                if price is not None:
+                    item.price = price
+                if supplier is not None:
+                    supplier_id = session.scalar(select(Supplier.supplier_id).where(Supplier.name == supplier))
+                    if supplier_id is None:
+                        raise ValueError(f"Unknown supplier: {supplier}")
+                    item.supplier_id = supplier_id
+                # Flush inside the unit of work so a version conflict surfaces here and can be retried.
+                session.flush()
+                return refresh_stock_state(session, [item_id]) if quantity is not None else []
+            return work
+
+        for attempt in range(STALE_EDIT_RETRIES + 1):
+            try:
+                flipped = run_write(edit(reload=attempt > 0), self.session, self.write_queue)
+                break
+            except StaleDataError:
+                if attempt == STALE_EDIT_RETRIES:
+                    raise
+                logging.info(f"Inventory item {item_id} changed concurrently; retrying the edit")
+        if flipped is None:
+            return False
+        self._sync_menu(flipped)
+        logging.info(f"Inventory item {item_id} updated")
+        return True
 
     def delete_item(self, item_id: int) -> bool:
         """
@@ -68,13 +134,17 @@ class InventoryController:
         """
         pass
 
-    def get_all_items(self) -> List[Dict[str, str | int | float]]:
+    def get_all_items(self) -> List[InventoryRecord]:
         """
         Retrieves all inventory items.
 
-        :return: A list of dictionaries containing inventory item details.
+        :return: A list of InventoryRecord, ordered by name.
         """
-        pass
+        rows = self.session.execute(
+            select(Inventory.item_id, Inventory.name, Inventory.quantity, Inventory.price, Inventory.supplier_id, Inventory.expiration_date)
+            .order_by(Inventory.name)
+        )
+        return [InventoryRecord(*row) for row in rows]
 
     def check_low_stock(self, threshold: int = 5) -> List[Dict[str, str | int]]:
         """
@@ -83,16 +153,25 @@ class InventoryController:
         :param threshold: The quantity limit below which items are considered low in stock (default: 5).
         :return: A list of dictionaries containing low stock item details.
         """
-        pass
+        rows = self.session.execute(
+            select(Inventory.item_id, Inventory.name, Inventory.quantity).where(Inventory.quantity < threshold).order_by(Inventory.quantity)
+        )
+        return [{"item_id": item_id, "name": name, "quantity": quantity} for item_id, name, quantity in rows]
 
-    def search_item_by_name(self, name: str) -> List[Dict[str, str | int | float]]:
+    def search_item_by_name(self, name: str, limit: int = 20) -> List[Dict[str, str | int | float]]:
         """
-        Searches for inventory items by name.
+        Searches for inventory items by name, tolerating partial words and small typos.
 
         :param name: The name of the inventory item to search for.
-        :return: A list of dictionaries containing matching item details.
+        :param limit: The maximum number of results (default: 20).
+        :return: A list of dictionaries containing matching item details, best match first.
         """
-        pass
+        ids = search_ids(self.session, INVENTORY_INDEX, name, limit)
+        rows = self.session.execute(
+            select(Inventory.item_id, Inventory.name, Inventory.quantity, Inventory.price).where(Inventory.item_id.in_(ids))
+        )
+        items = {item_id: {"item_id": item_id, "name": item_name, "quantity": quantity, "price": price} for item_id, item_name, quantity, price in rows}
+        return rank(ids, items)
 
     def update_stock_after_sale(self, item_id: int, quantity_sold: int) -> bool:
         """
@@ -101,8 +180,139 @@ class InventoryController:
         :param item_id: The ID of the item sold.
         :param quantity_sold: The quantity of the item sold.
         :return: True if the stock update was successful, False if item was not found or insufficient stock.
+        :raises ValueError: If the quantity sold is not positive.
         """
-        pass
+        return self.update_stock_after_order({item_id: quantity_sold})
+
+    def update_stock_after_order(self, quantities: Dict[int, int]) -> bool:
+        """
+        Updates the stock of every item used by an order, all or nothing.
+
+        The check and the decrement are one conditional UPDATE (`quantity >= sold`), so two terminals
+        selling the last units of an item cannot both succeed, and no read of the rows is needed.
+
+        :param quantities: The quantity sold per inventory item ID.
+        :return: True if every item was decremented, False if any item was not found or had insufficient stock.
+        :raises ValueError: If any quantity is not positive; nothing is changed.
+        """
+        flipped = run_write(lambda session: self._decrement(session, quantities), self.session, self.write_queue)
+        if flipped is None:
+            logging.warning(f"Stock update failed for items {sorted(quantities)}: not found or insufficient stock")
+            return False
+        self._sync_menu(flipped)
+        logging.info(f"Stock reduced for {len(quantities)} items: {quantities}")
+        return True
+
+    def update_stock_for_dishes(self, dishes: Dict[int, int]) -> bool:
+        """
+        Consumes the ingredients of sold dishes according to their recipes, all or nothing.
+
+        :param dishes: The servings sold per menu item ID; dishes without a recipe consume nothing.
+        :return: True if the stock of every ingredient sufficed and was decremented, False otherwise.
+        :raises ValueError: If any dish would consume a quantity that is not positive; nothing is changed.
+        """
+        flipped = run_write(lambda session: self._decrement(session, consumed_ingredients(session, dishes)), self.session, self.write_queue)
+        if flipped is None:
+            logging.warning(f"Insufficient ingredients for dishes {dishes}")
+            return False
+        self._sync_menu(flipped)
+        logging.info(f"Ingredients consumed for dishes {dishes}")
+        return True
+
+    @staticmethod
+    def _decrement(session: Session, quantities: Dict[int, int]) -> Optional[List[int]]:
+        # Returns the menu items flipped in or out of stock, or None (with nothing changed) on insufficient stock.
+        # A quantity below one would pass the stock check and raise the stock instead.
+        invalid = {item_id: quantity for item_id, quantity in quantities.items() if quantity <= 0}
+        if invalid:
+            raise ValueError(f"Quantities must be positive: {invalid}")
+        if not quantities:
+            return []
+        sold = case(quantities, value=Inventory.item_id)
+        stmt = (
+            update(Inventory)
+            .where(Inventory.item_id.in_(quantities), Inventory.quantity >= sold)
+            .values(quantity=Inventory.quantity - sold, version=Inventory.version + 1, updated_at=datetime.now())
+            .execution_options(synchronize_session="fetch")
+        )
+        savepoint = session.begin_nested()
+        if session.execute(stmt).rowcount != len(quantities):
+            savepoint.rollback()
+            return None
+        savepoint.commit()
+        # Only the dishes using these ingredients are recomputed.
+        return refresh_stock_state(session, quantities)
+
+    def _sync_menu(self, flipped: List[int]) -> None:
+        # Write-through for menu items whose stock state changed with the committed transaction.
+        if not flipped:
+            return
+        get_menu_catalog(self.session).refresh(self.session, flipped)
+        get_menu_publisher(self.session).refresh(self.session)
+        end_read(self.session)
+        logging.info(f"Menu items {flipped} changed stock state")
+
+    def import_inventory_csv(self, file_path: str, chunk_size: int = 5000, progress: Optional[Callable[[ImportReport], None]] = None) -> ImportReport:
+        """
+        Imports inventory items from a CSV file with a name column and any of the columns quantity,
+        price, supplier and expiration_date (YYYY-MM-DD). Items are matched by name; columns missing
+        from the file keep their current values, so a supplier price list only updates prices.
+        Unknown suppliers are created.
+
+        :param file_path: The path to the CSV file.
+        :param chunk_size: The number of rows validated and written at a time (default: 5000).
+        :param progress: (Optional) Called with the running ImportReport after every chunk.
+        :return: The ImportReport with the counts and the rejected rows.
+        """
+        report = import_csv(file_path, ("name",), self._parse_inventory_row, self._write_inventory_chunk, chunk_size, progress)
+        if report.succeeded:
+            self._sync_menu(run_write(refresh_stock_state, self.session, self.write_queue))
+        logging.info(f"Inventory imported from {file_path}: {report.inserted} added, {report.updated} updated, {report.failed} rejected")
+        return report
+
+    @staticmethod
+    def _parse_inventory_row(raw: Dict[str, str]) -> Dict[str, str | int | float | datetime | None]:
+        name = required_field(raw, "name")
+        if not validate_item_name(name):
+            raise RowValidationError(f"invalid name {name!r}")
+        row = {"name": name}
+        if "quantity" in raw:
+            quantity = required_field(raw, "quantity")
+            # isdigit() alone would let through digits such as "²" that int() rejects.
+            if not (quantity.isascii() and quantity.isdigit()) or not validate_stock_quantity(int(quantity)):
+                raise RowValidationError(f"quantity {quantity!r} is not a whole number of zero or more")
+            row["quantity"] = int(quantity)
+        if "price" in raw:
+            price = price_field(raw)
+            row["price"] = float(price)
+        if "supplier" in raw:
+            row["supplier"] = (raw["supplier"] or "").strip() or None
+        if "expiration_date" in raw:
+            expiration_date = (raw["expiration_date"] or "").strip()
+            if expiration_date and not validate_expiration_date(expiration_date):
+                raise RowValidationError(f"expiration_date {expiration_date!r} is not a current YYYY-MM-DD date")
+            row["expiration_date"] = datetime.strptime(expiration_date, "%Y-%m-%d") if expiration_date else None
+        return row
+
+    def _write_inventory_chunk(self, rows: List[Dict]) -> Dict[str, int]:
+        bulk = BulkPersistenceService(self.session, self.write_queue)
+        if "supplier" in rows[0]:
+            suppliers = self._supplier_ids({row["supplier"] for row in rows if row["supplier"]}, bulk)
+            rows = [{key: value for key, value in row.items() if key != "supplier"} | {"supplier_id": suppliers.get(row["supplier"])} for row in rows]
+        return bulk.bulk_upsert(Inventory, rows)
+
+    def _supplier_ids(self, names: set, bulk: BulkPersistenceService) -> Dict[str, int]:
+        if not names:
+            return {}
+        lookup = select(Supplier.name, Supplier.supplier_id).where(Supplier.name.in_(names))
+        suppliers = dict(self.session.execute(lookup).all())
+        missing = names - suppliers.keys()
+        if missing:
+            end_read(self.session)
+            bulk.bulk_upsert(Supplier, [{"name": name} for name in missing], update_columns=[])
+            suppliers = dict(self.session.execute(lookup).all())
+        end_read(self.session)
+        return suppliers
 
     def get_item_by_id(self, item_id: int) -> Optional[Dict[str, str | int | float]]:
         """
@@ -13,9 +13,10 @@ and overtime analysis.
 - Track attendance patterns and generate insights for HR and payroll purposes.
 
 🛠️ Dependencies:
+- database.connection -> Read-only report sessions.
 - SQLAlchemy -> ORM for querying attendance data from the database.
-- ReportLab -> For generating attendance reports in PDF format.
-- openpyxl -> For exporting attendance reports to Excel format.
+- ReportLab -> For generating attendance reports in PDF format (imported on first use).
+- openpyxl -> For exporting attendance reports to Excel format (imported on first use).
 - logging -> For logging report generation events.
 - datetime -> For handling date and time operations when generating reports.
 """
@@ -24,9 +25,6 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from openpyxl import Workbook
 
 class AttendanceReportController:
     """
@@ -34,14 +32,13 @@ class AttendanceReportController:
     Provides methods to generate attendance reports based on different criteria like daily, weekly, or monthly attendance.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Optional[Session] = None):
         """
         Initializes the AttendanceReportController with a database session.
 
-        :param db_session: The SQLAlchemy session for interacting with the attendance database.
+        :param db_session: (Optional) The SQLAlchemy session for interacting with the attendance database (default: a short-lived read-only session per report; see readonly_scope).
         """
-        
-        pass
+        self.session = db_session
 
     def generate_daily_report(self, date: datetime) -> List[Dict[str, str | int]]:
         """
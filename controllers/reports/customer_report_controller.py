@@ -11,14 +11,14 @@ such as order history, frequent visitors, total spending, and feedback analysis.
 - Export reports in PDF format for documentation.
 
 🛠️ Dependencies:
+- database.connection -> Read-only report sessions.
 - SQLAlchemy -> ORM for efficient customer-related database interactions.
-- ReportLab -> For generating customer reports in PDF format.
+- ReportLab -> For generating customer reports in PDF format (imported on first use).
 - logging -> For logging customer report generation events.
 - datetime -> For timestamping reports and customer visits.
 """
 
-from typing import Dict,List
-from reportlab.pdfgen import canvas
+from typing import Dict, List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 import logging
@@ -29,11 +29,13 @@ class CustomerReportController:
     Generates reports on customer activity, frequent visitors, total spending, and feedback analysis.
     """
 
-    def __init__(self):
+    def __init__(self, db_session: Optional[Session] = None):
         """
         Initializes the CustomerReportController and sets up database connection.
+
+        :param db_session: (Optional) The SQLAlchemy session for database interactions (default: a short-lived read-only session per report; see readonly_scope).
         """
-        pass
+        self.session = db_session
 
     def generate_customer_report(self, customer_id: int) -> Dict[str, str | int | float]:
         """
@@ -11,8 +11,9 @@ and generate detailed reports for inventory management.
 - Export inventory reports in PDF format for record-keeping.
 
 🛠️ Dependencies:
+- database.connection -> Read-only report sessions.
 - SQLAlchemy -> ORM for efficient inventory database interactions.
-- ReportLab -> For generating inventory reports in PDF format.
+- ReportLab -> For generating inventory reports in PDF format (imported on first use).
 - logging -> For logging report generation activities.
 - datetime -> For timestamping inventory reports.
 """
@@ -20,7 +21,6 @@ and generate detailed reports for inventory management.
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
-from reportlab.pdfgen import canvas
 from sqlalchemy.orm import Session
 
 class InventoryReportController:
@@ -29,14 +29,13 @@ class InventoryReportController:
     Provides methods for tracking stock levels, identifying low-stock items, and generating inventory reports.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Optional[Session] = None):
         """
         Initializes the InventoryReportController with a database session.
 
-        :param db_session: The SQLAlchemy session for database interactions.
+        :param db_session: (Optional) The SQLAlchemy session for database interactions (default: a short-lived read-only session per report; see readonly_scope).
         """
-        
-        pass
+        self.session = db_session
 
     def get_inventory_status(self) -> List[Dict[str, str | int | float]]:
         """
@@ -13,18 +13,17 @@ availability analysis, and customer behavior.
 - Export reports in PDF format for documentation.
 
 🛠️ Dependencies:
+- database.connection -> Read-only report sessions.
 - SQLAlchemy -> ORM for managing reservation-related database interactions.
-- ReportLab -> For generating reservation reports in PDF format.
+- ReportLab -> For generating reservation reports in PDF format (imported on first use).
 - logging -> For logging report generation events and errors.
 - datetime -> For handling date and time operations related to reservation trends.
 """
 
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 
 
 class ReservationsReportController:
@@ -33,11 +32,11 @@ class ReservationsReportController:
     Provides methods to generate trend analysis, daily/weekly/monthly reports, and export them in PDF format.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Optional[Session] = None):
         """
         Initializes the ReservationsReportController with a database session.
 
-        :param db_session: The SQLAlchemy session for database interactions.
+        :param db_session: (Optional) The SQLAlchemy session for database interactions (default: a short-lived read-only session per report; see readonly_scope).
         """
         self.session = db_session
 
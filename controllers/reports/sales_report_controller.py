@@ -10,21 +10,25 @@ and generate detailed sales reports for business insights.
 - Track total revenue, profits, and average order value.
 - Identify top-selling menu items and best-performing categories.
 - Analyze sales trends over time.
+- Answer totals, trends and top sellers from the hourly sales rollup instead of scanning orders.
 - Export sales reports in PDF format for record-keeping.
 - Generate reports based on specific date ranges or customer spending.
 
 🛠️ Dependencies:
+- database.connection -> Read-only report sessions.
 - SQLAlchemy -> ORM for efficient sales database interactions.
-- ReportLab -> For generating sales reports in PDF format.
+- ReportLab -> For generating sales reports in PDF format (imported on first use).
 - logging -> For logging sales report generation events.
 - datetime -> For timestamping sales data and reports.
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional
-from reportlab.pdfgen import canvas
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session
+from database.connection import readonly_scope
+from models import MenuItem, Order, OrderItem, SalesRollup
 
 
 class SalesReportController:
@@ -33,25 +37,40 @@ class SalesReportController:
     Provides methods for tracking revenue, identifying top-selling items, and generating sales reports.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Optional[Session] = None):
         """
         Initializes the SalesReportController with a database session.
 
-        :param db_session: The SQLAlchemy session for database interactions.
+        :param db_session: (Optional) The SQLAlchemy session for database interactions (default: a short-lived read-only session per report; see readonly_scope).
         """
-        
-        pass
+        self.session = db_session
 
-    def get_total_sales(self, start_date: datetime, end_date: datetime) -> float:
+    def get_total_sales(self, start_date: datetime, end_date: datetime) -> int:
         """
-        Calculates the total sales revenue for a given date range.
+        Calculates the total sales revenue for a given date range, measured like the sales rollup:
+        the menu price of the items sold, before discounts, service charges and tax.
 
         :param start_date: The start date for the sales report.
         :param end_date: The end date for the sales report.
-        :return: The total revenue generated in the given period.
-        """
-        
-        pass
+        :return: The total revenue generated in the given period, in cents.
+        """
+        # Whole hours come from the rollup; only the partial hours at either end read orders.
+        first_hour = start_date.replace(minute=0, second=0, microsecond=0)
+        if first_hour < start_date:
+            first_hour += timedelta(hours=1)
+        last_hour = end_date.replace(minute=0, second=0, microsecond=0)
+        with readonly_scope(self.session) as session:
+            if first_hour >= last_hour:
+                return self._order_sales(session, Order.created_at >= start_date, Order.created_at <= end_date)
+
+            rollup_sales = session.scalar(
+                select(func.coalesce(func.sum(SalesRollup.revenue_cents), 0)).where(self._hours_between(first_hour, last_hour))
+            )
+            return (
+                rollup_sales
+                + self._order_sales(session, Order.created_at >= start_date, Order.created_at < first_hour)
+                + self._order_sales(session, Order.created_at >= last_hour, Order.created_at <= end_date)
+            )
 
     def get_top_selling_items(self, limit: int = 5) -> List[Dict[str, str | int | float]]:
         """
@@ -60,8 +79,19 @@ class SalesReportController:
         :param limit: The number of top-selling items to retrieve (default: 5).
         :return: A list of dictionaries containing top-selling item details.
         """
-        
-        pass
+        quantity = func.sum(SalesRollup.quantity)
+        with readonly_scope(self.session) as session:
+            rows = session.execute(
+                select(SalesRollup.item_id, MenuItem.name, quantity, func.sum(SalesRollup.revenue_cents))
+                .outerjoin(MenuItem, MenuItem.item_id == SalesRollup.item_id)
+                .group_by(SalesRollup.item_id)
+                .order_by(quantity.desc())
+                .limit(limit)
+            )
+            return [
+                {"item_id": item_id, "name": name, "quantity": quantity, "revenue_cents": revenue_cents}
+                for item_id, name, quantity, revenue_cents in rows
+            ]
 
     def generate_sales_report(self, start_date: datetime, end_date: datetime, filename: str = "sales_report.pdf") -> None:
         """
@@ -74,15 +104,23 @@ class SalesReportController:
         
         pass
 
-    def get_sales_trends(self, days: int = 30) -> List[Dict[str, str | float]]:
+    def get_sales_trends(self, days: int = 30) -> List[Dict[str, str | int]]:
         """
         Analyzes sales trends over a specified period.
 
-        :param days: The number of past days to analyze (default: 30).
-        :return: A list of dictionaries containing daily sales revenue.
+        :param days: The number of past days to analyze, counted in whole days including today (default: 30).
+        :return: One dictionary per day, oldest first, with the date and its sales revenue in cents (0 without sales).
         """
-        
-        pass
+        today = date.today()
+        first_day = today - timedelta(days=days - 1)
+        with readonly_scope(self.session) as session:
+            revenue = dict(session.execute(
+                select(SalesRollup.day, func.sum(SalesRollup.revenue_cents))
+                .where(SalesRollup.day.between(first_day, today))
+                .group_by(SalesRollup.day)
+            ).all())
+        days_analyzed = (first_day + timedelta(days=offset) for offset in range(max(days, 0)))
+        return [{"date": day.isoformat(), "revenue_cents": revenue.get(day, 0)} for day in days_analyzed]
 
     def generate_customer_sales_report(self, customer_id: int, filename: Optional[str] = None) -> None:
         """
@@ -114,3 +152,21 @@ class SalesReportController:
         
         pass
 
+    @staticmethod
+    def _order_sales(session: Session, *criteria) -> int:
+        # Same measure as SalesRollup.revenue_cents, so rollup hours and partial hours add up.
+        return session.scalar(
+            select(func.coalesce(func.sum(OrderItem.quantity * OrderItem.unit_price_cents), 0))
+            .join(Order, Order.order_id == OrderItem.order_id)
+            .where(*criteria, Order.status != "Cancelled")
+        )
+
+    @staticmethod
+    def _hours_between(first_hour: datetime, last_hour: datetime):
+        # Rollup buckets from first_hour (inclusive) to last_hour (exclusive); the day range drives the primary key.
+        first_day, last_day = first_hour.date(), last_hour.date()
+        return and_(
+            SalesRollup.day.between(first_day, last_day),
+            or_(SalesRollup.day > first_day, SalesRollup.hour >= first_hour.hour),
+            or_(SalesRollup.day < last_day, SalesRollup.hour < last_hour.hour),
+        )
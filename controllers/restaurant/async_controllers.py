@@ -0,0 +1,250 @@
+"""
+async_controllers.py
+
+This module provides asyncio twins of the restaurant controllers for the Restaurant Management System (RMS).
+UI or API servers running an event loop can use them to serve many terminals from one process without
+blocking the loop on database I/O. The synchronous controllers remain the single source of business logic
+and stay available for scripts.
+
+📌 Features:
+- AsyncOrderController, AsyncReservationController, AsyncMenuController and AsyncBillingController
+  expose the methods of their synchronous counterparts as coroutines. Left out are the methods that
+  keep a cursor open across calls (iter_customer_orders, iter_billing_history) or stream whole files
+  (generate_order_report, generate_invoice, import_menu_csv); scripts use the synchronous controllers
+  for those, and servers use the paged history and submit_invoice instead.
+- Invoices and receipts are rendered in the render service's process pool; their coroutines return
+  the path of the file once it is written, without blocking the loop while they wait.
+- Built on SQLAlchemy's AsyncSession and the aiosqlite driver.
+- Each call runs the synchronous controller method through `AsyncSession.run_sync`, so queries and
+  commits are awaited on the event loop instead of blocking it.
+- Each call is its own transaction: it is committed when the call returns and rolled back if it
+  raises, so read snapshots are released as soon as a call ends.
+
+🛠️ Dependencies:
+- SQLAlchemy (asyncio extension) -> AsyncSession.
+- aiosqlite -> Non-blocking SQLite driver.
+"""
+
+import asyncio
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from controllers.restaurant.billing_controller import BillingController
+from controllers.restaurant.menu_controller import MenuController
+from controllers.restaurant.order_controller import OrderController
+from controllers.restaurant.reservation_controller import ReservationController
+from controllers.utils.payment_utils import OrderTotals
+from controllers.utils.render_service import RenderService
+from database.history import Page
+from models import MenuItemRecord
+
+
+class _AsyncController:
+    """
+    Base class that runs methods of a synchronous controller on an AsyncSession.
+    """
+
+    controller_class: type
+
+    def __init__(self, db_session: AsyncSession):
+        """
+        Initializes the async controller with an asyncio database session.
+
+        :param db_session: The SQLAlchemy AsyncSession for database interactions.
+        """
+        self.session = db_session
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        def call(sync_session):
+            return getattr(self.controller_class(sync_session), method)(*args, **kwargs)
+
+        try:
+            result = await self.session.run_sync(call)
+            if self.session.in_transaction():
+                await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return result
+
+
+class AsyncOrderController(_AsyncController):
+    """
+    Asyncio twin of OrderController.
+    """
+
+    controller_class = OrderController
+
+    async def create_order(self, customer_id: int, items: List[Dict[str, int]], total_price: Optional[float] = None) -> int:
+        """See OrderController.create_order."""
+        return await self._call("create_order", customer_id, items, total_price)
+
+    async def create_orders(self, batch: List[Dict[str, Any]]) -> List[int]:
+        """See OrderController.create_orders."""
+        return await self._call("create_orders", batch)
+
+    async def update_order_status(self, order_id: int, status: str) -> bool:
+        """See OrderController.update_order_status."""
+        return await self._call("update_order_status", order_id, status)
+
+    async def cancel_order(self, order_id: int) -> bool:
+        """See OrderController.cancel_order."""
+        return await self._call("cancel_order", order_id)
+
+    async def get_order_details(self, order_id: int) -> Optional[Dict[str, str | float | datetime]]:
+        """See OrderController.get_order_details."""
+        return await self._call("get_order_details", order_id)
+
+    async def get_customer_orders(self, customer_id: int, include_archive: bool = False) -> List[Dict[str, str | float | datetime]]:
+        """See OrderController.get_customer_orders."""
+        return await self._call("get_customer_orders", customer_id, include_archive)
+
+    async def get_customer_orders_page(self, customer_id: int, cursor: Optional[str] = None, limit: int = 50, include_archive: bool = False) -> Page:
+        """See OrderController.get_customer_orders_page."""
+        return await self._call("get_customer_orders_page", customer_id, cursor, limit, include_archive)
+
+    async def get_orders_by_status(self, status: str) -> List[Dict[str, str | float | datetime]]:
+        """See OrderController.get_orders_by_status."""
+        return await self._call("get_orders_by_status", status)
+
+    async def get_order_history(self, order_id: int) -> List[Dict[str, str | datetime]]:
+        """See OrderController.get_order_history."""
+        return await self._call("get_order_history", order_id)
+
+    async def get_prep_time_stats(self, start_date: datetime, end_date: datetime) -> Dict[str, int | float | None]:
+        """See OrderController.get_prep_time_stats."""
+        return await self._call("get_prep_time_stats", start_date, end_date)
+
+    async def calculate_order_total(self, order_id: int, tax_rates: Optional[Dict[str, float]] = None) -> Optional[OrderTotals]:
+        """See OrderController.calculate_order_total; the OrderTotals are in cents, None if the order was not found."""
+        return await self._call("calculate_order_total", order_id, tax_rates)
+
+    async def price_orders(self, order_ids: List[int], tax_rates: Optional[Dict[str, float]] = None, use_menu_prices: bool = False) -> Dict[int, OrderTotals]:
+        """See OrderController.price_orders."""
+        return await self._call("price_orders", order_ids, tax_rates, use_menu_prices)
+
+
+class AsyncReservationController(_AsyncController):
+    """
+    Asyncio twin of ReservationController.
+    """
+
+    controller_class = ReservationController
+
+    async def create_reservation(self, customer_id: int, reservation_date: datetime, num_guests: int, special_requests: Optional[str] = None) -> int:
+        """See ReservationController.create_reservation."""
+        return await self._call("create_reservation", customer_id, reservation_date, num_guests, special_requests)
+
+    async def update_reservation(self, reservation_id: int, reservation_date: Optional[datetime] = None, num_guests: Optional[int] = None, special_requests: Optional[str] = None) -> bool:
+        """See ReservationController.update_reservation."""
+        return await self._call("update_reservation", reservation_id, reservation_date, num_guests, special_requests)
+
+    async def cancel_reservation(self, reservation_id: int) -> bool:
+        """See ReservationController.cancel_reservation."""
+        return await self._call("cancel_reservation", reservation_id)
+
+    async def get_reservation_details(self, reservation_id: int) -> Optional[Dict[str, str | int | datetime]]:
+        """See ReservationController.get_reservation_details."""
+        return await self._call("get_reservation_details", reservation_id)
+
+    async def get_customer_reservations(self, customer_id: int) -> List[Dict[str, str | int | datetime]]:
+        """See ReservationController.get_customer_reservations."""
+        return await self._call("get_customer_reservations", customer_id)
+
+    async def check_availability(self, reservation_date: datetime, num_guests: int) -> bool:
+        """See ReservationController.check_availability."""
+        return await self._call("check_availability", reservation_date, num_guests)
+
+
+class AsyncMenuController(_AsyncController):
+    """
+    Asyncio twin of MenuController.
+    """
+
+    controller_class = MenuController
+
+    async def add_menu_item(self, name: str, price: float, category: str, available: bool = True) -> int:
+        """See MenuController.add_menu_item."""
+        return await self._call("add_menu_item", name, price, category, available)
+
+    async def update_menu_item(self, item_id: int, name: Optional[str] = None, price: Optional[float] = None, category: Optional[str] = None, available: Optional[bool] = None) -> bool:
+        """See MenuController.update_menu_item."""
+        return await self._call("update_menu_item", item_id, name, price, category, available)
+
+    async def delete_menu_item(self, item_id: int) -> bool:
+        """See MenuController.delete_menu_item."""
+        return await self._call("delete_menu_item", item_id)
+
+    async def get_all_menu_items(self) -> List[MenuItemRecord]:
+        """See MenuController.get_all_menu_items."""
+        return await self._call("get_all_menu_items")
+
+    async def get_menu_items_by_category(self, category: str) -> List[MenuItemRecord]:
+        """See MenuController.get_menu_items_by_category."""
+        return await self._call("get_menu_items_by_category", category)
+
+    async def search_menu_item_by_name(self, name: str) -> List[MenuItemRecord]:
+        """See MenuController.search_menu_item_by_name."""
+        return await self._call("search_menu_item_by_name", name)
+
+    async def update_availability(self, item_id: int, available: bool) -> bool:
+        """See MenuController.update_availability."""
+        return await self._call("update_availability", item_id, available)
+
+    async def set_recipe(self, item_id: int, ingredients: Dict[int, int]) -> bool:
+        """See MenuController.set_recipe."""
+        return await self._call("set_recipe", item_id, ingredients)
+
+    async def get_recipe(self, item_id: int) -> Dict[int, int]:
+        """See MenuController.get_recipe."""
+        return await self._call("get_recipe", item_id)
+
+
+class AsyncBillingController(_AsyncController):
+    """
+    Asyncio twin of BillingController.
+    """
+
+    controller_class = BillingController
+
+    async def create_bill(self, customer_id: int, items: Optional[List[Dict[str, str | int | float]]] = None, tax_rate: float = 0.1, discount: float = 0.0,
+                          service_rate: float = 0.0, order_id: Optional[int] = None, reservation_id: Optional[int] = None) -> int:
+        """See BillingController.create_bill."""
+        return await self._call("create_bill", customer_id, items, tax_rate, discount, service_rate, order_id, reservation_id)
+
+    async def process_payment(self, bill_id: int, payment_method: str, amount_paid: float) -> bool:
+        """See BillingController.process_payment."""
+        return await self._call("process_payment", bill_id, payment_method, amount_paid)
+
+    async def get_billing_history(self, customer_id: int, include_archive: bool = False) -> List[Dict[str, str | float]]:
+        """See BillingController.get_billing_history."""
+        return await self._call("get_billing_history", customer_id, include_archive)
+
+    async def get_billing_history_page(self, customer_id: int, cursor: Optional[str] = None, limit: int = 50, include_archive: bool = False) -> Page:
+        """See BillingController.get_billing_history_page."""
+        return await self._call("get_billing_history_page", customer_id, cursor, limit, include_archive)
+
+    async def cancel_bill(self, bill_id: int) -> bool:
+        """See BillingController.cancel_bill."""
+        return await self._call("cancel_bill", bill_id)
+
+    async def load_invoices_for_date(self, day: date) -> Dict[int, Dict[str, Any]]:
+        """See BillingController.load_invoices_for_date."""
+        return await self._call("load_invoices_for_date", day)
+
+    async def submit_invoice(self, bill_id: int, filename: Optional[str] = None, render_service: Optional[RenderService] = None) -> Optional[str]:
+        """See BillingController.submit_invoice; returns the path of the rendered invoice, None if the bill was not found."""
+        future = await self._call("submit_invoice", bill_id, filename, render_service)
+        return None if future is None else await asyncio.wrap_future(future)
+
+    async def submit_receipt(self, bill_id: int, receipt_data: Dict[str, Any], filename: Optional[str] = None, render_service: Optional[RenderService] = None) -> str:
+        """See BillingController.submit_receipt; returns the path of the rendered receipt."""
+        return await asyncio.wrap_future(await self._call("submit_receipt", bill_id, receipt_data, filename, render_service))
+
+    async def render_invoices_for_date(self, day: date, output_dir: str = ".", render_service: Optional[RenderService] = None) -> Dict[int, str]:
+        """See BillingController.render_invoices_for_date; returns the path of each rendered invoice by bill ID."""
+        futures = await self._call("render_invoices_for_date", day, output_dir, render_service)
+        paths = await asyncio.gather(*(asyncio.wrap_future(future) for future in futures.values()))
+        return dict(zip(futures, paths))
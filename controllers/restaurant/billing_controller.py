@@ -5,25 +5,39 @@ This module manages the billing operations in the Restaurant Management System (
 It provides functionalities to create, update, process, and generate invoices for customer orders.
 
 📌 Features:
-- Create new customer bills and calculate total amounts.
-- Apply taxes, discounts, and service charges.
-- Generate and print invoices in PDF format.
+- Create new customer bills for an order, a reservation or loose items, and calculate total amounts.
+- Apply taxes (per tax class), discounts, and service charges in integer cents through the pricing engine.
+- Generate and print invoices in PDF format, on the calling thread or in the background through
+  the render service (see controllers/utils/render_service.py), including every invoice of a day at once.
 - Process different payment methods (cash, credit card, digital wallets).
-- Retrieve billing history for auditing and record-keeping.
+- Retrieve billing history for auditing and record-keeping, optionally including archived bills.
 - Manage refunds and bill cancellations.
 
 🛠️ Dependencies:
 - SQLAlchemy -> ORM for efficient billing-related database interactions.
-- ReportLab -> For generating invoice receipts in PDF format.
+- WriteQueue -> Routes payment writes through the single database writer thread.
+- ReportLab -> For generating invoice receipts in PDF format (imported on first use).
+- render_service -> Renders invoices and receipts in worker processes.
+- pricing_engine -> Vectorized bill totals (NumPy).
 - logging -> For logging billing transactions.
 - datetime -> For timestamping billing records.
 """
 
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional
+import os
+from concurrent.futures import Future
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import Table, select
 from sqlalchemy.orm import Session
-from reportlab.pdfgen import canvas
+from database.archive import archived_billing, attach_archive
+from database.history import Page, customer_history, fetch_page, stream_rows
+from database.write_queue import WriteQueue, run_write
+from models import Billing, MenuItem, Order, OrderItem, Reservation
+from controllers.utils.pdf_report_utils import generate_invoice_pdf
+from controllers.utils.payment_utils import format_currency, to_cents, validate_payment_method
+from controllers.utils.pricing_engine import DEFAULT_TAX_RATES, lines_from_items, load_order_lines, price_orders
+from controllers.utils.render_service import INVOICE_LOGO_PATH, RenderService, get_render_service
 
 # Logging setup
 logging.basicConfig(filename="billing.log", level=logging.INFO, format="%(asctime)s - %(message)s")
@@ -35,27 +49,62 @@ class BillingController:
     Handles bill creation, payment processing, invoice generation, and billing history retrieval.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, write_queue: Optional[WriteQueue] = None):
         """
         Initializes the BillingController with a database session.
 
         :param db_session: The SQLAlchemy session for database interactions.
+        :param write_queue: (Optional) The write queue that billing writes are routed through.
         """
-        
-        pass
+        self.session = db_session
+        self.write_queue = write_queue
 
-    def create_bill(self, customer_id: int, items: List[Dict[str, str | int | float]], tax_rate: float = 0.1, discount: float = 0.0) -> int:
+    def create_bill(self, customer_id: int, items: Optional[List[Dict[str, str | int | float]]] = None, tax_rate: float = 0.1, discount: float = 0.0,
+                    service_rate: float = 0.0, order_id: Optional[int] = None, reservation_id: Optional[int] = None) -> int:
         """
-        Creates a new bill for a customer.
+        Creates a new bill for a customer. All amounts are computed and stored in integer cents.
+        A bill for an order lists the order's line items on its invoice.
 
         :param customer_id: The ID of the customer placing the order.
-        :param items: A list of dictionaries containing item details (name, quantity, price).
-        :param tax_rate: The applicable tax rate (default: 10%).
-        :param discount: Any applicable discount amount (default: 0.0).
+        :param items: (Optional) A list of dictionaries containing item details (name, quantity, price_cents or price,
+                      and optionally tax_class and discountable; see controllers/utils/pricing_engine.py)
+                      (default: the line items of the order, at the prices they were ordered, with its discount code).
+        :param tax_rate: The applicable tax rate of the standard tax class (default: 10%).
+        :param discount: Any applicable discount amount in currency units (default: 0.0).
+        :param service_rate: The service charge rate (default: 0%).
+        :param order_id: (Optional) The order the bill settles.
+        :param reservation_id: (Optional) The reservation the bill belongs to.
         :return: The generated bill ID.
+        :raises ValueError: If neither items nor an order are given, or the order or reservation does not exist.
         """
-        
-        pass
+        if items is None and order_id is None:
+            raise ValueError("A bill needs items or an order")
+        tax_rates = {**DEFAULT_TAX_RATES, "standard": tax_rate}
+
+        def work(session: Session) -> Tuple[int, int]:
+            if order_id is not None and session.get(Order, order_id) is None:
+                raise ValueError(f"Order {order_id} not found")
+            if reservation_id is not None and session.get(Reservation, reservation_id) is None:
+                raise ValueError(f"Reservation {reservation_id} not found")
+            lines = lines_from_items(items) if items is not None else load_order_lines(session, [order_id])
+            totals = price_orders(lines, tax_rates, discount_cents=to_cents(discount), service_rate=service_rate).totals(0)
+            bill = Billing(
+                customer_id=customer_id,
+                order_id=order_id,
+                reservation_id=reservation_id,
+                subtotal_cents=totals.subtotal_cents,
+                discount_cents=totals.discount_cents,
+                service_charge_cents=totals.service_charge_cents,
+                tax_cents=totals.tax_cents,
+                total_cents=totals.total_cents,
+            )
+            session.add(bill)
+            session.flush()
+            return bill.bill_id, bill.total_cents
+
+        bill_id, total_cents = run_write(work, self.session, self.write_queue)
+        logging.info(f"Bill {bill_id} created for customer {customer_id}: {format_currency(total_cents)}")
+        return bill_id
 
     def process_payment(self, bill_id: int, payment_method: str, amount_paid: float) -> bool:
         """
@@ -63,31 +112,147 @@ class BillingController:
 
         :param bill_id: The ID of the bill being paid.
         :param payment_method: The payment method used (cash, credit card, digital wallet, etc.).
-        :param amount_paid: The amount the customer paid.
+        :param amount_paid: The amount the customer paid, in currency units.
         :return: True if the payment was successful, False if insufficient payment.
         """
-        
-        pass
+        amount_paid_cents = to_cents(amount_paid)
+        if not validate_payment_method(payment_method):
+            logging.warning(f"Rejected payment for bill {bill_id}: invalid payment method {payment_method}")
+            return False
+
+        def work(session: Session) -> bool:
+            bill = session.get(Billing, bill_id)
+            if bill is None or bill.status != "Unpaid" or amount_paid_cents < bill.total_cents:
+                return False
+            bill.amount_paid_cents = amount_paid_cents
+            bill.payment_method = payment_method
+            bill.status = "Paid"
+            bill.paid_at = datetime.now()
+            return True
+
+        paid = run_write(work, self.session, self.write_queue)
+        if paid:
+            logging.info(f"Bill {bill_id} paid by {payment_method}: {format_currency(amount_paid_cents)}")
+        return paid
+
+    def generate_invoice(self, bill_id: int, filename: Optional[str] = None) -> Optional[str]:
+        """
+        Generates a PDF invoice for a given bill on the calling thread. At the POS, prefer
+        submit_invoice, which renders in the background.
+
+        :param bill_id: The ID of the bill to generate the invoice for.
+        :param filename: (Optional) The name of the output PDF file (default: "invoice_<bill_id>.pdf").
+        :return: The path of the invoice, or None if the bill does not exist.
+        """
+        invoices = self._invoice_data(self.session.scalars(select(Billing).where(Billing.bill_id == bill_id)).all())
+        if not invoices:
+            return None
+        path = filename or f"invoice_{bill_id}.pdf"
+        generate_invoice_pdf(invoices[bill_id], path)
+        return path
 
-    def generate_invoice(self, bill_id: int, filename: Optional[str] = None) -> None:
+    def submit_invoice(self, bill_id: int, filename: Optional[str] = None, render_service: Optional[RenderService] = None) -> Optional["Future[str]"]:
         """
-        Generates a PDF invoice for a given bill.
+        Queues the PDF invoice of a bill for rendering in a worker process. Asking again while the
+        invoice is still pending returns the same Future.
 
         :param bill_id: The ID of the bill to generate the invoice for.
-        :param filename: (Optional) The name of the output PDF file.
+        :param filename: (Optional) The name of the output PDF file (default: "invoice_<bill_id>.pdf").
+        :param render_service: (Optional) The render service to use (default: the process-wide one).
+        :return: A Future resolved with the path of the invoice, or None if the bill does not exist.
         """
-        
-        pass
+        invoices = self._invoice_data(self.session.scalars(select(Billing).where(Billing.bill_id == bill_id)).all())
+        if not invoices:
+            return None
+        return (render_service or get_render_service()).submit("invoice", bill_id, invoices[bill_id], filename or f"invoice_{bill_id}.pdf")
 
-    def get_billing_history(self, customer_id: int) -> List[Dict[str, str | float]]:
+    def submit_receipt(self, bill_id: int, receipt_data: Dict[str, Any], filename: Optional[str] = None,
+                       render_service: Optional[RenderService] = None) -> "Future[str]":
         """
-        Retrieves all bills for a specific customer.
+        Queues the PDF receipt of a bill for rendering in a worker process; the receipt is not printed.
+
+        :param bill_id: The ID of the bill the receipt is for.
+        :param receipt_data: The receipt details (see generate_receipt_pdf).
+        :param filename: (Optional) The name of the output PDF file (default: "receipt_<bill_id>.pdf").
+        :param render_service: (Optional) The render service to use (default: the process-wide one).
+        :return: A Future resolved with the path of the receipt.
+        """
+        return (render_service or get_render_service()).submit("receipt", bill_id, receipt_data, filename or f"receipt_{bill_id}.pdf")
+
+    def load_invoices_for_date(self, day: date) -> Dict[int, Dict[str, Any]]:
+        """
+        Loads the invoice data of every bill created on a day, except cancelled ones.
+
+        :param day: The day the bills were created.
+        :return: The invoice data (see generate_invoice_pdf) of each bill, by bill ID.
+        """
+        start = datetime.combine(day, datetime.min.time())
+        bills = self.session.scalars(
+            select(Billing)
+            .where(Billing.created_at >= start, Billing.created_at < start + timedelta(days=1), Billing.status != "Cancelled")
+            .order_by(Billing.created_at)
+        ).all()
+        return self._invoice_data(bills)
+
+    def render_invoices_for_date(self, day: date, output_dir: str = ".", render_service: Optional[RenderService] = None) -> Dict[int, "Future[str]"]:
+        """
+        Renders the invoices of every bill created on a day, spread over all worker processes.
+        Blocks only while the render backlog is full.
+
+        :param day: The day the bills were created.
+        :param output_dir: The directory the invoices are written to, as "invoice_<bill_id>.pdf" (default: ".").
+        :param render_service: (Optional) The render service to use (default: the process-wide one).
+        :return: The Future of each invoice, by bill ID.
+        """
+        invoices = self.load_invoices_for_date(day)
+        os.makedirs(output_dir, exist_ok=True)
+        rendered = (render_service or get_render_service()).render_many(
+            ("invoice", bill_id, data, os.path.join(output_dir, f"invoice_{bill_id}.pdf")) for bill_id, data in invoices.items()
+        )
+        futures = {bill_id: future for (_, bill_id), future in rendered.items()}
+        logging.info(f"Queued {len(futures)} invoices of {day} for rendering")
+        return futures
+
+    def get_billing_history(self, customer_id: int, include_archive: bool = False) -> List[Dict[str, str | float]]:
+        """
+        Retrieves all bills for a specific customer. For long histories, prefer
+        get_billing_history_page or iter_billing_history.
 
         :param customer_id: The ID of the customer.
-        :return: A list of dictionaries containing billing details.
+        :param include_archive: Whether to include bills moved to the archive database (default: False).
+        :return: A list of dictionaries containing billing details, newest first.
+        """
+        return list(self.iter_billing_history(customer_id, include_archive))
+
+    def get_billing_history_page(self, customer_id: int, cursor: Optional[str] = None, limit: int = 50, include_archive: bool = False) -> Page:
         """
-        
-        pass
+        Retrieves one page of a customer's bills, newest first. Every page costs the same,
+        however deep into the history it is.
+
+        :param customer_id: The ID of the customer.
+        :param cursor: (Optional) The next_cursor of the previous page (default: the first page).
+        :param limit: The maximum number of bills on the page (default: 50).
+        :param include_archive: Whether to include bills moved to the archive database (default: False).
+        :return: The Page of billing dictionaries and the cursor of the next page.
+        """
+        archived = self._archived_billing(include_archive)
+        rows, next_cursor = fetch_page(
+            self.session, lambda after: customer_history(Billing.__table__, archived, "bill_id", customer_id, after), "bill_id", cursor, limit
+        )
+        return Page([self._bill_to_dict(row) for row in rows], next_cursor)
+
+    def iter_billing_history(self, customer_id: int, include_archive: bool = False, batch_size: int = 1000) -> Iterator[Dict[str, str | float]]:
+        """
+        Streams all bills of a customer, newest first, holding one batch of rows in memory at a time.
+
+        :param customer_id: The ID of the customer.
+        :param include_archive: Whether to include bills moved to the archive database (default: False).
+        :param batch_size: The number of rows fetched at a time (default: 1000).
+        :return: An iterator over billing dictionaries.
+        """
+        query = customer_history(Billing.__table__, self._archived_billing(include_archive), "bill_id", customer_id)
+        for row in stream_rows(self.session, query, batch_size):
+            yield self._bill_to_dict(row)
 
     def cancel_bill(self, bill_id: int) -> bool:
         """
@@ -96,5 +261,55 @@ class BillingController:
         :param bill_id: The ID of the bill to cancel.
         :return: True if the bill was successfully canceled, False otherwise.
         """
-        
-        pass
+        def work(session: Session) -> bool:
+            bill = session.get(Billing, bill_id)
+            if bill is None or bill.status != "Unpaid":
+                return False
+            bill.status = "Cancelled"
+            return True
+
+        cancelled = run_write(work, self.session, self.write_queue)
+        if cancelled:
+            logging.info(f"Bill {bill_id} cancelled")
+        return cancelled
+
+    def _archived_billing(self, include_archive: bool) -> Optional[Table]:
+        return archived_billing if include_archive and attach_archive(self.session) else None
+
+    @staticmethod
+    def _bill_to_dict(bill) -> Dict[str, str | float]:
+        return {
+            "bill_id": bill.bill_id,
+            "total_cents": bill.total_cents,
+            "amount_paid_cents": bill.amount_paid_cents,
+            "payment_method": bill.payment_method,
+            "status": bill.status,
+            "created_at": bill.created_at,
+        }
+
+    def _invoice_data(self, bills: Sequence[Billing]) -> Dict[int, Dict[str, Any]]:
+        # Builds the data of generate_invoice_pdf, loading the line items of all the bills' orders in one query.
+        lines: Dict[int, List[Dict[str, str]]] = {}
+        order_ids = {bill.order_id for bill in bills if bill.order_id is not None}
+        if order_ids:
+            rows = self.session.execute(
+                select(OrderItem.order_id, MenuItem.name, OrderItem.quantity, OrderItem.unit_price_cents)
+                .join(MenuItem, MenuItem.item_id == OrderItem.item_id)
+                .where(OrderItem.order_id.in_(order_ids))
+                .order_by(OrderItem.order_item_id)
+            )
+            for order_id, name, quantity, unit_price_cents in rows:
+                lines.setdefault(order_id, []).append({"description": f"{quantity} x {name}", "price": format_currency(quantity * unit_price_cents)})
+        invoices = {}
+        for bill in bills:
+            charges = [("Subtotal", bill.subtotal_cents), ("Discount", -bill.discount_cents),
+                       ("Service charge", bill.service_charge_cents), ("Tax", bill.tax_cents)]
+            invoices[bill.bill_id] = {
+                "logo": INVOICE_LOGO_PATH,
+                "header": f"Invoice #{bill.bill_id}",
+                "items": lines.get(bill.order_id, []) + [
+                    {"description": label, "price": format_currency(cents)} for label, cents in charges if cents or label == "Subtotal"
+                ],
+                "total": format_currency(bill.total_cents),
+            }
+        return invoices
@@ -8,20 +8,38 @@ It provides functionalities to add, update, delete, and retrieve menu items, as
 - Add new menu items with name, price, category, and availability status.
 - Update menu item details such as price, availability, and category.
 - Delete menu items when they are no longer offered.
-- Retrieve all menu items or filter by category.
-- Search for menu items by name.
+- Retrieve all menu items or filter by category as lightweight read-only records.
+- Serve menu reads from the in-memory menu catalog and patch it after every menu change.
+- Republish the compressed menu document for the frontend after every menu change.
+- Search for menu items by name through the FTS5 trigram index, ranked by relevance.
 - Manage availability status (in-stock or out-of-stock).
+- Import menus from CSV files of any size, chunk by chunk, with per-row error reports.
+- Maintain the recipe of each menu item, which takes it off the menu when an ingredient runs out.
 
 🛠️ Dependencies:
 - SQLAlchemy -> ORM for efficient database interactions.
+- MenuCatalog -> Process-wide cache of the menu.
+- MenuPublisher -> Precompressed, ETag-tagged menu document for the frontend.
 - logging -> For logging menu updates and changes.
 - datetime -> For timestamping menu modifications.
 """
 
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, Dict, List, Optional, Set
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from controllers.utils.csv_import import ImportReport, RowValidationError, import_csv, price_field, required_field
+from controllers.utils.payment_utils import to_cents
+from controllers.validation.menu_validation import validate_availability, validate_menu_item_name
+from database.bulk import BulkPersistenceService
+from database.menu_catalog import get_menu_catalog
+from database.menu_publisher import get_menu_publisher
+from database.recipes import set_recipe
+from database.search import MENU_ITEMS_INDEX, rank, search_ids
+from database.write_queue import WriteQueue, end_read, run_write
+from models import Category, MenuItem, MenuItemRecord, RecipeIngredient
 
 
 class MenuController:
@@ -30,26 +48,38 @@ class MenuController:
     Provides methods for adding, updating, deleting, and retrieving menu items.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, write_queue: Optional[WriteQueue] = None):
         """
         Initializes the MenuController with a database session.
 
         :param db_session: The SQLAlchemy session for database interactions.
+        :param write_queue: (Optional) The write queue that menu edits, recipe writes and menu imports are routed through.
         """
         self.session = db_session
+        self.write_queue = write_queue
+        self.catalog = get_menu_catalog(db_session)
+        self.publisher = get_menu_publisher(db_session)
 
     def add_menu_item(self, name: str, price: float, category: str, available: bool = True) -> int:
         """
         Adds a new item to the restaurant menu.
 
         :param name: The name of the menu item.
-        :param price: The price of the item.
+        :param price: The price of the item in currency units; it is stored in cents.
         :param category: The category of the item (e.g., appetizers, main course, beverages, desserts).
         :param available: Whether the item is available for ordering (default: True).
         :return: The ID of the newly created menu item.
         """
-        
-        pass
+        def work(session: Session) -> int:
+            item = MenuItem(name=name, price_cents=to_cents(price), category=self._get_or_create_category(session, category), available=available)
+            session.add(item)
+            session.flush()
+            return item.item_id
+
+        item_id = run_write(work, self.session, self.write_queue)
+        self._refresh_catalog(item_id)
+        logging.info(f"Menu item {item_id} ({name}) added")
+        return item_id
 
     def update_menu_item(self, item_id: int, name: Optional[str] = None, price: Optional[float] = None, category: Optional[str] = None, available: Optional[bool] = None) -> bool:
         """
@@ -57,13 +87,30 @@ class MenuController:
 
         :param item_id: The ID of the menu item to update.
         :param name: (Optional) The new name of the item.
-        :param price: (Optional) The new price of the item.
+        :param price: (Optional) The new price of the item in currency units.
         :param category: (Optional) The new category of the item.
         :param available: (Optional) The new availability status of the item.
         :return: True if the update was successful, False if the item was not found.
         """
-        
-        pass
+        def work(session: Session) -> bool:
+            item = session.get(MenuItem, item_id)
+            if item is None:
+                return False
+            if name is not None:
+                item.name = name
+            if price is not None:
+                item.price_cents = to_cents(price)
+            if category is not None:
+                item.category = self._get_or_create_category(session, category)
+            if available is not None:
+                item.available = available
+            return True
+
+        if not run_write(work, self.session, self.write_queue):
+            return False
+        self._refresh_catalog(item_id)
+        logging.info(f"Menu item {item_id} updated")
+        return True
 
     def delete_menu_item(self, item_id: int) -> bool:
         """
@@ -71,38 +118,57 @@ class MenuController:
 
         :param item_id: The ID of the menu item to delete.
         :return: True if the deletion was successful, False if the item was not found.
+        :raises ValueError: If the item is on recorded orders; nothing is deleted.
         """
-        
-        pass
+        def work(session: Session) -> bool:
+            item = session.get(MenuItem, item_id)
+            if item is None:
+                return False
+            session.delete(item)
+            # Flush inside the unit of work so a foreign key violation rolls back only this unit.
+            session.flush()
+            return True
+
+        try:
+            deleted = run_write(work, self.session, self.write_queue)
+        except IntegrityError:
+            logging.warning(f"Menu item {item_id} is on recorded orders and was not deleted")
+            raise ValueError(f"Menu item {item_id} is on recorded orders; mark it unavailable instead") from None
+        if not deleted:
+            return False
+        self.catalog.remove(item_id)
+        self.publisher.refresh(self.session)
+        end_read(self.session)
+        logging.info(f"Menu item {item_id} deleted")
+        return True
 
-    def get_all_menu_items(self) -> List[Dict[str, str | int | float | bool]]:
+    def get_all_menu_items(self) -> List[MenuItemRecord]:
         """
         Retrieves all menu items.
 
-        :return: A list of dictionaries containing menu item details.
+        :return: A list of MenuItemRecord, ordered by name.
         """
-        
-        pass
+        return list(self.catalog.snapshot(self.session).items)
 
-    def get_menu_items_by_category(self, category: str) -> List[Dict[str, str | int | float | bool]]:
+    def get_menu_items_by_category(self, category: str) -> List[MenuItemRecord]:
         """
         Retrieves all menu items belonging to a specific category.
 
         :param category: The category to filter by.
-        :return: A list of dictionaries containing matching menu item details.
+        :return: A list of MenuItemRecord for the matching items.
         """
-        
-        pass
+        return list(self.catalog.snapshot(self.session).by_category.get(category, ()))
 
-    def search_menu_item_by_name(self, name: str) -> List[Dict[str, str | int | float | bool]]:
+    def search_menu_item_by_name(self, name: str, limit: int = 20) -> List[MenuItemRecord]:
         """
-        Searches for menu items by name.
+        Searches for menu items by name, tolerating partial words and small typos.
 
         :param name: The name of the menu item to search for.
-        :return: A list of dictionaries containing matching item details.
+        :param limit: The maximum number of results (default: 20).
+        :return: A list of MenuItemRecord for the matching items, best match first.
         """
-        
-        pass
+        ids = search_ids(self.session, MENU_ITEMS_INDEX, name, limit)
+        return rank(ids, self.catalog.snapshot(self.session).by_id)
 
     def update_availability(self, item_id: int, available: bool) -> bool:
         """
@@ -112,5 +178,128 @@ class MenuController:
         :param available: The new availability status (True for available, False for out of stock).
         :return: True if the update was successful, False if the item was not found.
         """
-        
-        pass
+        def work(session: Session) -> bool:
+            item = session.get(MenuItem, item_id)
+            if item is None:
+                return False
+            item.available = available
+            return True
+
+        if not run_write(work, self.session, self.write_queue):
+            return False
+        self._refresh_catalog(item_id)
+        logging.info(f"Menu item {item_id} marked {'available' if available else 'out of stock'}")
+        return True
+
+    def set_recipe(self, item_id: int, ingredients: Dict[int, int]) -> bool:
+        """
+        Sets the recipe of a menu item: the units of each inventory item one serving uses.
+        The item is out of stock while any ingredient has less than one serving left.
+
+        :param item_id: The ID of the menu item.
+        :param ingredients: The units used per serving by inventory item ID; empty removes the recipe.
+        :return: True if the recipe was set, False if the menu item was not found.
+        """
+        def work(session: Session) -> Optional[List[int]]:
+            if session.get(MenuItem, item_id) is None:
+                return None
+            return set_recipe(session, item_id, ingredients)
+
+        flipped = run_write(work, self.session, self.write_queue)
+        if flipped is None:
+            return False
+        self._refresh_catalog(*flipped)
+        logging.info(f"Recipe of menu item {item_id} set to {ingredients}")
+        return True
+
+    def get_recipe(self, item_id: int) -> Dict[int, int]:
+        """
+        Retrieves the recipe of a menu item.
+
+        :param item_id: The ID of the menu item.
+        :return: The units used per serving by inventory item ID (empty if the item has no recipe).
+        """
+        rows = self.session.execute(
+            select(RecipeIngredient.inventory_item_id, RecipeIngredient.quantity).where(RecipeIngredient.menu_item_id == item_id)
+        )
+        return dict(rows.all())
+
+    def import_menu_csv(self, file_path: str, chunk_size: int = 5000, progress: Optional[Callable[[ImportReport], None]] = None) -> ImportReport:
+        """
+        Imports menu items from a CSV file with the columns name, price, category and available
+        ("Available" or "Unavailable"; optional). Items are matched by name: known items are
+        updated, new ones added, and categories created as needed.
+
+        :param file_path: The path to the CSV file.
+        :param chunk_size: The number of rows validated and written at a time (default: 5000).
+        :param progress: (Optional) Called with the running ImportReport after every chunk.
+        :return: The ImportReport with the counts and the rejected rows.
+        """
+        report = import_csv(file_path, ("name", "price"), self._parse_menu_row, self._write_menu_chunk, chunk_size, progress)
+        logging.info(f"Menu imported from {file_path}: {report.inserted} added, {report.updated} updated, {report.failed} rejected")
+        return report
+
+    @staticmethod
+    def _parse_menu_row(raw: Dict[str, str]) -> Dict[str, str | int | bool | None]:
+        name = required_field(raw, "name")
+        if not validate_menu_item_name(name):
+            raise RowValidationError(f"invalid name {name!r}")
+        price = price_field(raw)
+        status = (raw.get("available") or "").strip() or "Available"
+        if not validate_availability(status):
+            raise RowValidationError(f"available must be Available or Unavailable, not {status!r}")
+        category = (raw.get("category") or "").strip() or None
+        return {"name": name, "price_cents": to_cents(price), "category": category, "available": status == "Available"}
+
+    def _write_menu_chunk(self, rows: List[Dict]) -> Dict[str, int]:
+        # The categories, the name lookup and the item writes are one transaction, so no other
+        # writer can add a name between the lookup and the insert and skew the counts.
+        bulk = BulkPersistenceService(self.session)
+        # A name repeated within the chunk is written once, with its last row.
+        latest = {row["name"]: row for row in rows}
+        category_names = {row["category"] for row in latest.values() if row["category"]}
+
+        def work(session: Session) -> int:
+            categories = self._category_ids(session, category_names, bulk)
+            existing = dict(session.execute(select(MenuItem.name, MenuItem.item_id).where(MenuItem.name.in_(latest))).all())
+            items = [
+                {"name": name, "price_cents": row["price_cents"], "category_id": categories.get(row["category"]), "available": row["available"]}
+                for name, row in latest.items()
+            ]
+            new = [item for item in items if item["name"] not in existing]
+            known = [dict(item, item_id=existing[item["name"]]) for item in items if item["name"] in existing]
+            if new:
+                bulk.insert_work(MenuItem, new)(session)
+            if known:
+                bulk.upsert_work(MenuItem, known)(session)
+            return len(new)
+
+        inserted = run_write(work, self.session, self.write_queue)
+        bulk.after_write(MenuItem)
+        return {"inserted": inserted, "updated": len(rows) - inserted}
+
+    @staticmethod
+    def _category_ids(session: Session, names: Set[str], bulk: BulkPersistenceService) -> Dict[str, int]:
+        if not names:
+            return {}
+        lookup = select(Category.name, Category.category_id).where(Category.name.in_(names))
+        categories = dict(session.execute(lookup).all())
+        missing = names - categories.keys()
+        if missing:
+            bulk.insert_work(Category, [{"name": name} for name in sorted(missing)])(session)
+            categories = dict(session.execute(lookup).all())
+        return categories
+
+    @staticmethod
+    def _get_or_create_category(session: Session, name: str) -> Category:
+        category = session.scalar(select(Category).where(Category.name == name))
+        if category is None:
+            category = Category(name=name)
+            session.add(category)
+        return category
+
+    def _refresh_catalog(self, *item_ids: int) -> None:
+        # Write-through: patch the catalog with the committed rows instead of reloading the menu.
+        self.catalog.refresh(self.session, item_ids)
+        self.publisher.refresh(self.session)
+        end_read(self.session)
@@ -4,22 +4,43 @@ It provides functionalities to create, update, cancel, and retrieve orders, as w
 
 📌 Features:
 - Create new orders for customers, including the items ordered, quantity, and total price.
-- Update order status (e.g., Pending, In Progress, Completed, Cancelled).
-- Retrieve order details and track order status.
-- Calculate the total price of an order based on ordered items.
-- Generate order reports and summaries.
-- Track customer order history.
+- Create a batch of orders (delivery-platform imports, offline replays) in one transaction.
+- Update order status (e.g., Pending, In Progress, Completed, Cancelled) through the enforced
+  order state machine; every change is appended to the order event log.
+- Retrieve order details and track order status, including all open orders of one status.
+- Read an order's event history and the kitchen preparation times from the event log.
+- Calculate the total price of an order based on ordered items, and reprice thousands of orders
+  per call for repricing and audit jobs (see controllers/utils/pricing_engine.py).
+- Generate order reports and summaries, streamed into the PDF page by page.
+- Track customer order history, optionally including orders moved to the archive database,
+  page by page (keyset pagination) or streamed (see database/history.py).
+- Keep the hourly sales rollup in step with order creation and cancellation.
+- Feed the kitchen queue (see database/kitchen_queue.py) after every order creation and status change.
 
 🛠️ Dependencies:
 - SQLAlchemy -> ORM for managing order-related database interactions.
+- WriteQueue -> Routes order writes through the single database writer thread.
 - datetime -> For timestamping order creation and updates.
 - logging -> For logging order transactions and errors.
+- pdf_report_utils -> Streams the order report into a paged PDF table.
 """
 
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Any, Iterator, List, Dict, Optional, Tuple
+from sqlalchemy import Table, func, insert, select
 from sqlalchemy.orm import Session
+from database.archive import archived_orders, attach_archive, last_assigned_id
+from controllers.utils.pdf_report_utils import write_table_pdf
+from controllers.utils.payment_utils import OrderTotals, format_currency, to_cents
+from controllers.utils.pricing_engine import lines_from_orders, load_order_lines, price_orders
+from controllers.validation.order_validation import validate_order_quantity
+from database.history import Page, customer_history, fetch_page, stream_rows
+from database.kitchen_queue import get_kitchen_queue
+from database.order_events import order_history, prep_times, record_created, transition
+from database.sales_rollup import record_order_sales
+from database.write_queue import WriteQueue, end_read, run_write
+from models import MenuItem, Order, OrderItem
 
 
 class OrderController:
@@ -28,37 +49,120 @@ class OrderController:
     Provides methods to create, update, cancel, and retrieve customer orders.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, write_queue: Optional[WriteQueue] = None):
         """
         Initializes the OrderController with a database session.
 
         :param db_session: The SQLAlchemy session for database interactions.
+        :param write_queue: (Optional) The write queue that order writes are routed through.
         """
-        
-        pass
+        self.session = db_session
+        self.write_queue = write_queue
 
-    def create_order(self, customer_id: int, items: List[Dict[str, int]], total_price: float) -> int:
+    def create_order(self, customer_id: int, items: List[Dict[str, int]], total_price: Optional[float] = None) -> int:
         """
-        Creates a new order for a customer.
+        Creates a new order for a customer. Line prices are taken from the menu, and the order
+        total, tax included, is computed from them in integer cents by the pricing engine.
 
         :param customer_id: The ID of the customer placing the order.
-        :param items: A list of dictionaries containing item details (e.g., item_id, quantity).
-        :param total_price: The total price of the order.
+        :param items: A list of dictionaries containing item details (e.g., item_id, quantity, and optionally course, default 1).
+        :param total_price: (Optional) The total shown to the customer; a mismatch with the computed total raises ValueError.
         :return: The ID of the newly created order.
         """
-        
-        pass
+        order_id = self.create_orders([{"customer_id": customer_id, "items": items, "total_price": total_price}])[0]
+        logging.info(f"Order {order_id} created for customer {customer_id}")
+        return order_id
+
+    def create_orders(self, batch: List[Dict[str, Any]]) -> List[int]:
+        """
+        Creates a batch of orders in one transaction: all of them, or none if any is invalid.
+        Every order is priced from one menu lookup, and the orders and their line items are
+        inserted with one multi-row statement each.
+
+        :param batch: The orders, as dictionaries with customer_id, items (as for create_order),
+                      and optionally total_price, created_at (the time an order was taken,
+                      e.g. when replaying orders captured offline; default: now) and promised_at
+                      (when the food is due; default: KITCHEN_PROMISE_MINUTES after created_at).
+        :return: The IDs of the new orders, in the order of the batch.
+        :raises ValueError: If any order is invalid, e.g. it has an unknown, unavailable or out-of-stock
+                            item; the message names the first invalid order.
+        """
+        if not batch:
+            return []
+
+        def work(session: Session) -> List[int]:
+            item_ids = {item.get("item_id") for order in batch for item in order.get("items") or ()}
+            menu = {
+                item_id: (price_cents, available, out_of_stock, tax_class, discountable)
+                for item_id, price_cents, available, out_of_stock, tax_class, discountable in session.execute(
+                    select(MenuItem.item_id, MenuItem.price_cents, MenuItem.available, MenuItem.out_of_stock, MenuItem.tax_class, MenuItem.discountable)
+                    .where(MenuItem.item_id.in_(item_ids))
+                )
+            }
+            now = datetime.now()
+            # IDs are assigned up front so they follow the batch order; the write lock taken by
+            # run_write keeps them free until commit. SQLite cannot order RETURNING rows of a
+            # multi-row INSERT, and ordered RETURNING would fall back to one INSERT per row.
+            # sqlite_sequence remembers ids of orders since moved to the archive, which must not be reused.
+            first_id = max(last_assigned_id(session, Order.__table__), session.scalar(select(func.max(Order.order_id))) or 0) + 1
+            lines = [self._price_lines(order, menu, f"Order {index} of the batch") for index, order in enumerate(batch)]
+            # Priced like calculate_order_total prices the stored orders, so both always agree.
+            items = [
+                [{"quantity": quantity, "price_cents": unit_price_cents, "tax_class": menu[item_id][3], "discountable": menu[item_id][4]}
+                 for item_id, quantity, unit_price_cents, _ in order_lines]
+                for order_lines in lines
+            ]
+            priced = price_orders(lines_from_orders(items, range(first_id, first_id + len(batch))))
+            orders = []
+            for index, order in enumerate(batch):
+                totals = priced.totals(index)
+                total_price = order.get("total_price")
+                if total_price is not None and to_cents(total_price) != totals.total_cents:
+                    raise ValueError(f"Order {index} of the batch: total {total_price} does not match the menu prices ({format_currency(totals.total_cents)})")
+                created_at = order.get("created_at") or now
+                orders.append({"order_id": first_id + index, "customer_id": order["customer_id"], "status": "Pending", "total_cents": totals.total_cents,
+                               "created_at": created_at, "updated_at": now, "promised_at": order.get("promised_at")})
+
+            order_ids = [row["order_id"] for row in orders]
+            session.execute(insert(Order), orders)
+            record_created(session, ((row["order_id"], row["created_at"]) for row in orders))
+            rows = [
+                {"order_id": order_id, "item_id": item_id, "quantity": quantity, "unit_price_cents": unit_price_cents, "course": course}
+                for order_id, order_lines in zip(order_ids, lines)
+                for item_id, quantity, unit_price_cents, course in order_lines
+            ]
+            if rows:
+                session.execute(insert(OrderItem), rows)
+            record_order_sales(session, order_ids)
+            return order_ids
+
+        order_ids = run_write(work, self.session, self.write_queue)
+        self._sync_kitchen(order_ids)
+        logging.info(f"{len(order_ids)} orders created in one batch")
+        return order_ids
 
     def update_order_status(self, order_id: int, status: str) -> bool:
         """
-        Updates the status of an existing order.
+        Updates the status of an existing order and appends the change to the order event log.
+        Orders move from Pending to In Progress to Completed, and can be cancelled until completed.
 
         :param order_id: The ID of the order to update.
         :param status: The new status of the order (e.g., 'In Progress', 'Completed', 'Cancelled').
         :return: True if the update was successful, False if the order was not found.
+        :raises OrderStateError: If the order cannot move from its current status to the new one.
         """
-        
-        pass
+        def work(session: Session) -> Optional[str]:
+            previous = transition(session, order_id, status)
+            if previous is not None and status == "Cancelled":
+                record_order_sales(session, order_id, -1)
+            return previous
+
+        previous = run_write(work, self.session, self.write_queue)
+        if previous is None:
+            return False
+        self._sync_kitchen([order_id])
+        logging.info(f"Order {order_id} status changed from {previous} to {status}")
+        return True
 
     def cancel_order(self, order_id: int) -> bool:
         """
@@ -67,44 +171,185 @@ class OrderController:
         :param order_id: The ID of the order to cancel.
         :return: True if the cancellation was successful, False if the order was not found.
         """
-        
-        pass
+        return self.update_order_status(order_id, "Cancelled")
 
-    def get_order_details(self, order_id: int) -> Dict[str, str | float | datetime]:
+    def get_order_details(self, order_id: int) -> Optional[Dict[str, str | float | datetime]]:
         """
         Retrieves detailed information about an order.
 
         :param order_id: The ID of the order to retrieve.
-        :return: A dictionary containing order details (status, total price, items).
+        :return: A dictionary containing order details (status, total price, items), or None if the order was not found.
         """
-        
-        pass
+        order = self.session.get(Order, order_id)
+        if order is None:
+            return None
+
+        details = self._order_to_dict(order)
+        details["items"] = [
+            {"item_id": item_id, "quantity": quantity, "unit_price_cents": unit_price_cents}
+            for item_id, quantity, unit_price_cents in self.session.execute(
+                select(OrderItem.item_id, OrderItem.quantity, OrderItem.unit_price_cents).where(OrderItem.order_id == order_id)
+            )
+        ]
+        return details
 
-    def get_customer_orders(self, customer_id: int) -> List[Dict[str, str | float | datetime]]:
+    def get_orders_by_status(self, status: str) -> List[Dict[str, str | float | datetime]]:
         """
-        Retrieves all orders placed by a specific customer.
+        Retrieves all orders currently in one status (e.g., every order 'In Progress'), oldest first.
 
-        :param customer_id: The ID of the customer whose orders to retrieve.
+        :param status: The status to filter by.
         :return: A list of dictionaries containing order details.
         """
-        
-        pass
+        orders = self.session.scalars(select(Order).where(Order.status == status).order_by(Order.created_at))
+        return [self._order_to_dict(order) for order in orders]
 
-    def calculate_order_total(self, order_id: int) -> float:
+    def get_order_history(self, order_id: int) -> List[Dict[str, str | datetime]]:
+        """
+        Retrieves the event log of an order.
+
+        :param order_id: The ID of the order.
+        :return: A list of dictionaries with the event and its time, oldest first.
+        """
+        return [{"event": event, "created_at": created_at} for event, created_at in order_history(self.session, order_id)]
+
+    def get_prep_time_stats(self, start_date: datetime, end_date: datetime) -> Dict[str, int | float | None]:
+        """
+        Computes kitchen preparation times (from In Progress to Completed) of the orders
+        completed in a time window, from the order event log.
+
+        :param start_date: The start of the window.
+        :param end_date: The end of the window.
+        :return: A dictionary with the number of orders and the average and longest preparation time in seconds (None without orders).
+        """
+        durations = [seconds for _, seconds in prep_times(self.session, start_date, end_date)]
+        return {
+            "orders": len(durations),
+            "average_seconds": round(sum(durations) / len(durations), 3) if durations else None,
+            "longest_seconds": max(durations, default=None),
+        }
+
+    def get_customer_orders(self, customer_id: int, include_archive: bool = False) -> List[Dict[str, str | float | datetime]]:
+        """
+        Retrieves all orders placed by a specific customer. For long histories, prefer
+        get_customer_orders_page or iter_customer_orders.
+
+        :param customer_id: The ID of the customer whose orders to retrieve.
+        :param include_archive: Whether to include orders moved to the archive database (default: False).
+        :return: A list of dictionaries containing order details, newest first.
         """
-        Calculates the total price of an order based on the ordered items and their prices.
+        return list(self.iter_customer_orders(customer_id, include_archive))
+
+    def get_customer_orders_page(self, customer_id: int, cursor: Optional[str] = None, limit: int = 50, include_archive: bool = False) -> Page:
+        """
+        Retrieves one page of a customer's orders, newest first. Every page costs the same,
+        however deep into the history it is.
+
+        :param customer_id: The ID of the customer whose orders to retrieve.
+        :param cursor: (Optional) The next_cursor of the previous page (default: the first page).
+        :param limit: The maximum number of orders on the page (default: 50).
+        :param include_archive: Whether to include orders moved to the archive database (default: False).
+        :return: The Page of order dictionaries and the cursor of the next page.
+        """
+        archived = self._archived_orders(include_archive)
+        rows, next_cursor = fetch_page(
+            self.session, lambda after: customer_history(Order.__table__, archived, "order_id", customer_id, after), "order_id", cursor, limit
+        )
+        return Page([self._order_to_dict(row) for row in rows], next_cursor)
+
+    def iter_customer_orders(self, customer_id: int, include_archive: bool = False, batch_size: int = 1000) -> Iterator[Dict[str, str | float | datetime]]:
+        """
+        Streams all orders of a customer, newest first, holding one batch of rows in memory at a time.
+
+        :param customer_id: The ID of the customer whose orders to retrieve.
+        :param include_archive: Whether to include orders moved to the archive database (default: False).
+        :param batch_size: The number of rows fetched at a time (default: 1000).
+        :return: An iterator over order dictionaries.
+        """
+        query = customer_history(Order.__table__, self._archived_orders(include_archive), "order_id", customer_id)
+        for row in stream_rows(self.session, query, batch_size):
+            yield self._order_to_dict(row)
+
+    def calculate_order_total(self, order_id: int, tax_rates: Optional[Dict[str, float]] = None) -> Optional[OrderTotals]:
+        """
+        Calculates the total price of an order based on the ordered items and their prices,
+        with tax per tax class and the order's discount code.
 
         :param order_id: The ID of the order to calculate the total for.
-        :return: The total price of the order.
+        :param tax_rates: (Optional) The tax rate of each tax class (default: DEFAULT_TAX_RATES).
+        :return: The OrderTotals of the order (in cents), or None if the order was not found.
+        """
+        return self.price_orders([order_id], tax_rates).get(order_id)
+
+    def price_orders(self, order_ids: List[int], tax_rates: Optional[Dict[str, float]] = None, use_menu_prices: bool = False) -> Dict[int, OrderTotals]:
+        """
+        Prices many orders at once, for repricing and audit jobs: the line items of all orders
+        are loaded with one query and priced in one vectorized pass.
+
+        :param order_ids: The IDs of the orders to price.
+        :param tax_rates: (Optional) The tax rate of each tax class (default: DEFAULT_TAX_RATES).
+        :param use_menu_prices: Whether to use the current menu prices instead of the prices when ordered (default: False).
+        :return: The OrderTotals of each order found, by order ID.
         """
-        
-        pass
+        return price_orders(load_order_lines(self.session, order_ids, use_menu_prices), tax_rates).by_order()
 
-    def generate_order_report(self, filename: str = "order_report.pdf") -> None:
+    def generate_order_report(self, filename: str = "order_report.pdf", batch_size: int = 1000) -> int:
         """
-        Generates a PDF report summarizing all orders.
+        Generates a PDF report listing all orders, oldest first. Orders are streamed from the database
+        into the PDF a page at a time, so the report renders in bounded memory however many orders there are.
 
         :param filename: The name of the output PDF file (default: "order_report.pdf").
+        :param batch_size: The number of orders fetched at a time (default: 1000).
+        :return: The number of pages written.
         """
-        
-        pass
+        query = select(Order.order_id, Order.customer_id, Order.status, Order.total_cents, Order.created_at).order_by(Order.order_id)
+        rows = (
+            (order_id, customer_id, status, format_currency(total_cents), created_at.strftime("%Y-%m-%d %H:%M") if created_at else "")
+            for order_id, customer_id, status, total_cents, created_at in stream_rows(self.session, query, batch_size)
+        )
+        pages = write_table_pdf(rows, ["Order", "Customer", "Status", "Total", "Created"], filename, title="Order Report",
+                                column_widths=[70, 80, 110, 110, 162])
+        logging.info(f"Order report written to {filename} ({pages} pages)")
+        return pages
+
+    @staticmethod
+    def _price_lines(order: Dict[str, Any], menu: Dict[int, Tuple[int, bool, bool, str, bool]], label: str) -> List[tuple]:
+        # Validates one order against the menu, given as (price_cents, available, out_of_stock,
+        # tax_class, discountable) by item ID, and returns its (item_id, quantity, unit_price_cents, course) lines.
+        if order.get("customer_id") is None:
+            raise ValueError(f"{label}: customer_id is missing")
+        lines = []
+        for item in order.get("items") or ():
+            item_id, quantity, course = item.get("item_id"), item.get("quantity", 1), item.get("course", 1)
+            if item_id not in menu:
+                raise ValueError(f"{label}: unknown menu item {item_id}")
+            price_cents, available, out_of_stock, _, _ = menu[item_id]
+            if not available:
+                raise ValueError(f"{label}: menu item {item_id} is not available")
+            if out_of_stock:
+                raise ValueError(f"{label}: menu item {item_id} is out of stock")
+            if not validate_order_quantity(quantity):
+                raise ValueError(f"{label}: invalid quantity {quantity!r} for menu item {item_id}")
+            if not validate_order_quantity(course):
+                raise ValueError(f"{label}: invalid course {course!r} for menu item {item_id}")
+            lines.append((item_id, quantity, price_cents, course))
+        return lines
+
+    def _archived_orders(self, include_archive: bool) -> Optional[Table]:
+        return archived_orders if include_archive and attach_archive(self.session) else None
+
+    def _sync_kitchen(self, order_ids: List[int]) -> None:
+        # Pushes the committed orders to the kitchen queue, if kitchen screens are using it.
+        kitchen = get_kitchen_queue(self.session)
+        if kitchen.loaded:
+            kitchen.refresh(self.session, order_ids)
+            end_read(self.session)
+
+    @staticmethod
+    def _order_to_dict(order: Order) -> Dict[str, str | float | datetime]:
+        return {
+            "order_id": order.order_id,
+            "customer_id": order.customer_id,
+            "status": order.status,
+            "total_cents": order.total_cents,
+            "created_at": order.created_at,
+        }
@@ -18,9 +18,14 @@ of dining space and customer bookings.
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+from sqlalchemy import exists, func, select
 from sqlalchemy.orm import Session
+from models import Billing, Reservation, Table
+
+# How long a booked table stays occupied around its reservation time.
+RESERVATION_DURATION = timedelta(hours=2)
 
 
 class ReservationController:
@@ -35,8 +40,7 @@ class ReservationController:
 
         :param db_session: The SQLAlchemy session for database interactions.
         """
-        
-        pass
+        self.session = db_session
 
     def create_reservation(self, customer_id: int, reservation_date: datetime, num_guests: int, special_requests: Optional[str] = None) -> int:
         """
@@ -47,9 +51,23 @@ class ReservationController:
         :param num_guests: The number of guests attending the reservation.
         :param special_requests: (Optional) Special requests or notes related to the reservation.
         :return: The ID of the newly created reservation.
+        :raises ValueError: If no table is free for that time and party size.
         """
-        
-        pass
+        table_id = self._find_free_table(reservation_date, num_guests)
+        if table_id is None:
+            raise ValueError(f"No table available for {num_guests} guests at {reservation_date}")
+
+        reservation = Reservation(
+            customer_id=customer_id,
+            table_id=table_id,
+            reservation_date=reservation_date,
+            num_guests=num_guests,
+            special_requests=special_requests,
+        )
+        self.session.add(reservation)
+        self.session.commit()
+        logging.info(f"Reservation {reservation.reservation_id} created for customer {customer_id} at table {table_id}")
+        return reservation.reservation_id
 
     def update_reservation(self, reservation_id: int, reservation_date: Optional[datetime] = None, num_guests: Optional[int] = None, special_requests: Optional[str] = None) -> bool:
         """
@@ -60,9 +78,28 @@ class ReservationController:
         :param num_guests: (Optional) The new number of guests for the reservation.
         :param special_requests: (Optional) New special requests or notes for the reservation.
         :return: True if the update was successful, False if the reservation was not found.
+        :raises ValueError: If no table is free for the new time and party size; nothing is changed.
         """
-        
-        pass
+        reservation = self.session.get(Reservation, reservation_id)
+        if reservation is None:
+            return False
+
+        if (reservation_date is not None or num_guests is not None) and reservation.status == "Booked":
+            new_date = reservation_date if reservation_date is not None else reservation.reservation_date
+            new_guests = num_guests if num_guests is not None else reservation.num_guests
+            table_id = self._find_free_table(new_date, new_guests, reservation_id, reservation.table_id)
+            if table_id is None:
+                raise ValueError(f"No table available for {new_guests} guests at {new_date}")
+            reservation.table_id = table_id
+        if reservation_date is not None:
+            reservation.reservation_date = reservation_date
+        if num_guests is not None:
+            reservation.num_guests = num_guests
+        if special_requests is not None:
+            reservation.special_requests = special_requests
+        self.session.commit()
+        logging.info(f"Reservation {reservation_id} updated")
+        return True
 
     def cancel_reservation(self, reservation_id: int) -> bool:
         """
@@ -71,18 +108,31 @@ class ReservationController:
         :param reservation_id: The ID of the reservation to cancel.
         :return: True if the cancellation was successful, False if the reservation was not found.
         """
-        
-        pass
+        reservation = self.session.get(Reservation, reservation_id)
+        if reservation is None:
+            return False
+
+        reservation.status = "Cancelled"
+        self.session.commit()
+        logging.info(f"Reservation {reservation_id} cancelled")
+        return True
 
-    def get_reservation_details(self, reservation_id: int) -> Dict[str, str | int | datetime]:
+    def get_reservation_details(self, reservation_id: int) -> Optional[Dict[str, str | int | datetime]]:
         """
         Retrieves detailed information about a reservation.
 
         :param reservation_id: The ID of the reservation to retrieve.
-        :return: A dictionary containing reservation details.
+        :return: A dictionary containing reservation details and the amount billed, or None if the reservation was not found.
         """
-        
-        pass
+        reservation = self.session.get(Reservation, reservation_id)
+        if reservation is None:
+            return None
+
+        details = self._reservation_to_dict(reservation)
+        details["amount_billed_cents"] = self.session.scalar(
+            select(func.coalesce(func.sum(Billing.total_cents), 0)).where(Billing.reservation_id == reservation_id)
+        )
+        return details
 
     def get_customer_reservations(self, customer_id: int) -> List[Dict[str, str | int | datetime]]:
         """
@@ -91,8 +141,10 @@ class ReservationController:
         :param customer_id: The ID of the customer whose reservations to retrieve.
         :return: A list of dictionaries containing reservation details.
         """
-        
-        pass
+        reservations = self.session.scalars(
+            select(Reservation).where(Reservation.customer_id == customer_id).order_by(Reservation.reservation_date.desc())
+        )
+        return [self._reservation_to_dict(reservation) for reservation in reservations]
 
     def check_availability(self, reservation_date: datetime, num_guests: int) -> bool:
         """
@@ -102,7 +154,35 @@ class ReservationController:
         :param num_guests: The number of guests for the reservation.
         :return: True if there is availability, False otherwise.
         """
-        
-        pass
-
-
+        return self._find_free_table(reservation_date, num_guests) is not None
+
+    def _find_free_table(self, reservation_date: datetime, num_guests: int, exclude_reservation_id: Optional[int] = None,
+                         preferred_table_id: Optional[int] = None) -> Optional[int]:
+        # Smallest table that fits the party and has no booking overlapping the slot. A reservation
+        # being moved does not block itself, and keeps its current table if that one qualifies.
+        overlapping = [
+            Reservation.table_id == Table.table_id,
+            Reservation.reservation_date > reservation_date - RESERVATION_DURATION,
+            Reservation.reservation_date < reservation_date + RESERVATION_DURATION,
+            Reservation.status == "Booked",
+        ]
+        if exclude_reservation_id is not None:
+            overlapping.append(Reservation.reservation_id != exclude_reservation_id)
+        order = [Table.capacity]
+        if preferred_table_id is not None:
+            order.insert(0, (Table.table_id == preferred_table_id).desc())
+        return self.session.scalar(
+            select(Table.table_id).where(Table.capacity >= num_guests, ~exists().where(*overlapping)).order_by(*order).limit(1)
+        )
+
+    @staticmethod
+    def _reservation_to_dict(reservation: Reservation) -> Dict[str, str | int | datetime]:
+        return {
+            "reservation_id": reservation.reservation_id,
+            "customer_id": reservation.customer_id,
+            "table_id": reservation.table_id,
+            "reservation_date": reservation.reservation_date,
+            "num_guests": reservation.num_guests,
+            "special_requests": reservation.special_requests,
+            "status": reservation.status,
+        }
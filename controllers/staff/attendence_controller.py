@@ -24,8 +24,9 @@ and generate attendance reports for payroll and HR management.
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from sqlalchemy import Column, Integer, String, DateTime, Float
+from models import Attendance
 
 
 class AttendanceController:
@@ -41,8 +42,7 @@ class AttendanceController:
 
         :param db_session: The SQLAlchemy session for interacting with the attendance database.
         """
-        
-        pass
+        self.session = db_session
 
     def record_clock_in(self, employee_id: int) -> bool:
         """
@@ -51,8 +51,13 @@ class AttendanceController:
         :param employee_id: The ID of the employee clocking in.
         :return: True if the clock-in was recorded successfully, False otherwise.
         """
-        
-        pass
+        now = datetime.now()
+        if self._get_record(employee_id, now) is not None:
+            return False
+        self.session.add(Attendance(employee_id=employee_id, date=now.date(), clock_in=now, status="Present"))
+        self.session.commit()
+        logging.info(f"Employee {employee_id} clocked in at {now}")
+        return True
 
     def record_clock_out(self, employee_id: int) -> bool:
         """
@@ -61,8 +66,15 @@ class AttendanceController:
         :param employee_id: The ID of the employee clocking out.
         :return: True if the clock-out was recorded successfully, False otherwise.
         """
-        
-        pass
+        now = datetime.now()
+        record = self._get_record(employee_id, now)
+        if record is None or record.clock_in is None or record.clock_out is not None:
+            return False
+        record.clock_out = now
+        record.hours_worked = round((now - record.clock_in).total_seconds() / 3600, 2)
+        self.session.commit()
+        logging.info(f"Employee {employee_id} clocked out at {now}")
+        return True
 
     def get_daily_attendance(self, date: datetime) -> List[Dict[str, str | int]]:
         """
@@ -94,5 +106,10 @@ class AttendanceController:
         :param date: The date for which the attendance status is required.
         :return: 'Present', 'Absent', or 'On Leave' based on the attendance status.
         """
-        
-        pass
+        record = self._get_record(employee_id, date)
+        return record.status if record is not None else "Absent"
+
+    def _get_record(self, employee_id: int, date: datetime) -> Optional[Attendance]:
+        return self.session.scalar(
+            select(Attendance).where(Attendance.employee_id == employee_id, Attendance.date == date.date())
+        )
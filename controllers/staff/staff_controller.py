@@ -21,8 +21,9 @@ It provides functionalities to add, update, delete, and retrieve staff details,
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from models import Staff  # Assuming a Staff model is defined in the models module
+from models import Staff, StaffRecord
 
 
 class StaffController:
@@ -37,8 +38,7 @@ class StaffController:
 
         :param db_session: The SQLAlchemy session for interacting with the staff database.
         """
-        
-        pass
+        self.session = db_session
 
     def add_staff(self, name: str, role: str, salary: float, contact_info: Optional[str] = None) -> None:
         """
@@ -77,14 +77,13 @@ class StaffController:
         
         pass
 
-    def get_all_staff(self) -> List[Dict[str, str | float]]:
+    def get_all_staff(self) -> List[StaffRecord]:
         """
         Retrieves all staff members in the system.
 
-        :return: A list of dictionaries containing staff member details.
+        :return: A list of StaffRecord, ordered by name.
         """
-        
-        pass
+        return self._fetch_staff()
 
     def get_staff_by_id(self, staff_id: int) -> Optional[Dict[str, str | float]]:
         """
@@ -96,13 +95,20 @@ class StaffController:
         
         pass
 
-    def get_staff_by_role(self, role: str) -> List[Dict[str, str | float]]:
+    def get_staff_by_role(self, role: str) -> List[StaffRecord]:
         """
         Retrieves all staff members with a specific role.
 
         :param role: The role of the staff members to retrieve (e.g., "Waiter", "Chef").
-        :return: A list of dictionaries containing staff member details for the specified role.
+        :return: A list of StaffRecord for the specified role.
         """
-        
-        pass
+        return self._fetch_staff(Staff.role == role)
+
+    def _fetch_staff(self, *criteria) -> List[StaffRecord]:
+        rows = self.session.execute(
+            select(Staff.staff_id, Staff.name, Staff.role, Staff.shift, Staff.salary, Staff.contact_info)
+            .where(*criteria)
+            .order_by(Staff.name)
+        )
+        return [StaffRecord(*row) for row in rows]
 
@@ -0,0 +1,154 @@
+"""
+csv_import.py
+
+This module provides the streaming CSV import pipeline of the Restaurant Management System (RMS).
+Menus and supplier price lists are read in chunks, each row is validated on its own, and every
+chunk of valid rows is written with one bulk upsert, so memory use does not grow with the file
+and the import runs at bulk-insert speed.
+
+📌 Features:
+- Stream the CSV file chunk by chunk (see file_utils.read_csv_chunks).
+- Validate and convert each row; invalid rows are reported with their line number and skipped.
+- Hand each chunk of valid rows to a writer (MenuController / InventoryController bulk upserts).
+- Report progress after every chunk through a callback and the log.
+
+🛠️ Dependencies:
+- file_utils -> Chunked CSV reading.
+- menu_validation -> The price checks shared by the menu and inventory imports.
+- logging -> For logging import progress.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from controllers.utils.file_utils import read_csv_chunks, read_csv_header
+from controllers.validation.menu_validation import validate_price
+
+Row = Dict[str, Any]
+
+
+class RowValidationError(ValueError):
+    """
+    Raised by a row parser to reject one row; the message is reported for that row.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class RowError:
+    """
+    A rejected CSV row.
+    """
+    line: int
+    message: str
+
+
+@dataclass(slots=True)
+class ImportReport:
+    """
+    The running totals of one import, passed to the progress callback after every chunk.
+    """
+    file_path: str
+    rows_read: int = 0
+    inserted: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: List[RowError] = field(default_factory=list)  # the first `max_errors` rejected rows
+
+    @property
+    def succeeded(self) -> int:
+        return self.inserted + self.updated
+
+
+def import_csv(
+    file_path: str,
+    required_columns: Iterable[str],
+    parse_row: Callable[[Dict[str, str]], Row],
+    write_chunk: Callable[[List[Row]], Dict[str, int]],
+    chunk_size: int = 5000,
+    progress: Optional[Callable[[ImportReport], None]] = None,
+    max_errors: int = 1000,
+) -> ImportReport:
+    """
+    Imports a CSV file chunk by chunk.
+
+    :param file_path: The path to the CSV file.
+    :param required_columns: The header columns the file must have.
+    :param parse_row: Validates one raw row and converts it to column values; raises RowValidationError to reject it.
+    :param write_chunk: Writes the valid rows of one chunk and returns {"inserted": n, "updated": n}.
+    :param chunk_size: The number of rows read, validated and written at a time (default: 5000).
+    :param progress: (Optional) Called with the running report after every chunk.
+    :param max_errors: The number of rejected rows kept in the report; all are counted (default: 1000).
+    :return: The final ImportReport.
+    :raises ValueError: If the header lacks a required column, or the file is empty.
+    """
+    report = ImportReport(file_path)
+    header = read_csv_header(file_path)
+    missing = [column for column in required_columns if column not in header]
+    if missing:
+        raise ValueError(f"{file_path} is missing the columns {missing}")
+
+    for chunk in read_csv_chunks(file_path, chunk_size):
+        rows, rejected = _parse_chunk(chunk, parse_row)
+        report.rows_read += len(chunk)
+        report.failed += len(rejected)
+        report.errors.extend(rejected[:max_errors - len(report.errors)])
+        if rows:
+            written = write_chunk(rows)
+            report.inserted += written["inserted"]
+            report.updated += written["updated"]
+
+        logging.info(f"Import of {file_path}: {report.rows_read} rows read, {report.succeeded} written, {report.failed} rejected")
+        if progress is not None:
+            progress(report)
+    return report
+
+
+def _parse_chunk(chunk: List[Tuple[int, Dict[str, str]]], parse_row: Callable[[Dict[str, str]], Row]) -> Tuple[List[Row], List[RowError]]:
+    rows, rejected = [], []
+    for line, raw in chunk:
+        if None in raw:
+            rejected.append(RowError(line, "too many fields"))
+            continue
+        try:
+            rows.append(parse_row(raw))
+        except RowValidationError as error:
+            rejected.append(RowError(line, str(error)))
+    return rows, rejected
+
+
+def required_field(raw: Dict[str, str], column: str) -> str:
+    """
+    Returns a stripped field value, rejecting the row if it is empty.
+
+    :param raw: The raw CSV row.
+    :param column: The column to read.
+    :return: The stripped value.
+    """
+    value = (raw.get(column) or "").strip()
+    if not value:
+        raise RowValidationError(f"{column} is empty")
+    return value
+
+
+def price_field(raw: Dict[str, str], column: str = "price") -> Decimal:
+    """
+    Returns a price field as an exact Decimal, rejecting the row unless it is a positive, finite
+    amount of whole cents.
+
+    :param raw: The raw CSV row.
+    :param column: (Optional) The column to read (default: "price").
+    :return: The price.
+    """
+    value = required_field(raw, column)
+    try:
+        price = Decimal(value)
+    except InvalidOperation:
+        raise RowValidationError(f"{column} {value!r} is not a number") from None
+    if not validate_price(price):
+        raise RowValidationError(f"{column} {value!r} is not a positive amount")
+    cents = price.scaleb(2)
+    if cents != cents.to_integral_value():
+        raise RowValidationError(f"{column} {value!r} is not a whole number of cents")
+    return price
@@ -6,6 +6,7 @@ It includes functions for reading, writing, and processing files, including CSV
 
 📌 Features:
 - Read and write sales data to/from CSV files.
+- Stream large CSV files (menus, supplier price lists) in fixed-size chunks.
 - Read and write customer receipt data.
 - Handle file management tasks like checking file existence and creating new directories.
 - Generate file names with timestamps for easy identification.
@@ -17,6 +18,8 @@ It includes functions for reading, writing, and processing files, including CSV
 
 Functions:
 - read_csv_file(file_path: str) -> List[Dict]: Reads a CSV file and returns the data as a list of dictionaries.
+- read_csv_header(file_path: str) -> List[str]: Reads the header row of a CSV file.
+- read_csv_chunks(file_path: str, chunk_size: int) -> Iterator[List[Tuple[int, Dict]]]: Streams a CSV file in chunks of numbered rows.
 - write_csv_file(file_path: str, data: List[Dict]) -> None: Writes data to a CSV file, creating a new file or overwriting the existing one.
 - create_directory(directory_path: str) -> None: Creates a new directory if it doesn't exist.
 - generate_timestamped_filename(prefix: str) -> str: Generates a timestamped filename for reports or receipts.
@@ -26,7 +29,7 @@ Functions:
 import csv
 import os
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, Iterator, List, Tuple
 
 def read_csv_file(file_path: str) -> List[Dict]:
     """
@@ -43,6 +46,35 @@ def read_csv_file(file_path: str) -> List[Dict]:
                 data.append(row)
     return data
 
+def read_csv_header(file_path: str) -> List[str]:
+    """
+    Reads the header row of a CSV file, as read_csv_chunks reads it.
+
+    :param file_path: The path to the CSV file.
+    :return: The column names, or an empty list if the file is empty.
+    """
+    with open(file_path, mode='r', encoding='utf-8-sig', newline='') as file:
+        return next(csv.reader(file), [])
+
+def read_csv_chunks(file_path: str, chunk_size: int = 5000) -> Iterator[List[Tuple[int, Dict[str, str]]]]:
+    """
+    Streams a CSV file in chunks, so only one chunk of rows is held in memory at a time.
+
+    :param file_path: The path to the CSV file; its first line is the header.
+    :param chunk_size: The number of rows per chunk (default: 5000).
+    :return: An iterator of chunks, each a list of (line number, row dictionary) pairs.
+    """
+    with open(file_path, mode='r', encoding='utf-8-sig', newline='') as file:
+        reader = csv.DictReader(file)
+        chunk = []
+        for row in reader:
+            chunk.append((reader.line_num, row))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
 def write_csv_file(file_path: str, data: List[Dict]) -> None:
     """
     Writes data to a CSV file, creating a new file or overwriting the existing one.
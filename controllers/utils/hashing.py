@@ -13,7 +13,7 @@ as well as for verifying password hashes.
 
 🛠️ Dependencies:
 - hashlib -> For generating cryptographic hash values (SHA256).
-- bcrypt -> For securely hashing passwords using bcrypt, including salting.
+- bcrypt -> For securely hashing passwords using bcrypt, including salting (imported on first use).
 
 Functions:
 - generate_bcrypt_hash(password: str) -> str: Generates a bcrypt hash for a given password, including salting.
@@ -26,7 +26,6 @@ SHA256 is suitable for non-password-related sensitive data such as transaction I
 """
 
 import hashlib
-import bcrypt
 
 def generate_bcrypt_hash(password: str) -> str:
     """
@@ -35,6 +34,7 @@ def generate_bcrypt_hash(password: str) -> str:
     :param password: The password to hash.
     :return: The bcrypt hash of the password.
     """
+    import bcrypt
 
     salt = bcrypt.gensalt()
     hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
@@ -48,6 +48,7 @@ def verify_bcrypt_hash(password: str, hashed_password: str) -> bool:
     :param hashed_password: The stored bcrypt hash to compare against.
     :return: True if the password matches the hash, False otherwise.
     """
+    import bcrypt
 
     return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
 
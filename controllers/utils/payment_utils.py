@@ -4,8 +4,14 @@ payment_utils.py
 This module provides utility functions for managing and processing payments in the Restaurant Management System (RMS). 
 It includes functions for calculating taxes, handling payment processing, and generating payment-related reports.
 
+All money is handled as integer cents (minor units). Amounts are converted to cents once, where
+they enter the system, and formatted only for display. Sums are exact, both in Python and in SQL,
+and rounding happens once per charge instead of once per line item.
+
 📌 Features:
-- Calculate tax and discount for a given payment amount.
+- Convert amounts to and from integer cents.
+- Calculate tax, discount and service charge on amounts in cents, rounding half up once per charge.
+- Compute the totals of a whole order from its line items in one pass.
 - Convert payment amount to a formatted string (currency format).
 - Generate unique payment reference numbers.
 - Validate payment methods (e.g., credit card, cash).
@@ -13,50 +19,139 @@ It includes functions for calculating taxes, handling payment processing, and ge
 
 🛠️ Dependencies:
 - random -> For generating random payment reference numbers.
-- decimal -> For precise handling of financial calculations (e.g., taxes and discounts).
+- decimal -> For exact conversion of user-entered amounts and rates.
 - datetime -> For generating timestamps or unique reference numbers.
 
 Functions:
-- calculate_tax(amount: float, tax_rate: float) -> float: Calculates the tax on a payment amount.
-- calculate_discount(amount: float, discount_rate: float) -> float: Calculates the discount on a payment amount.
-- format_currency(amount: float) -> str: Converts a numerical amount into a formatted currency string.
+- to_cents(amount: float | str | Decimal) -> int: Converts an amount in currency units to integer cents.
+- from_cents(amount_cents: int) -> Decimal: Converts integer cents to an exact Decimal amount.
+- to_basis_points(rate: float) -> int: Converts a rate to integer basis points.
+- calculate_tax(amount_cents: int, tax_rate: float) -> int: Calculates the tax on an amount in cents.
+- calculate_discount(amount_cents: int, discount_rate: float) -> int: Calculates the discount on an amount in cents.
+- calculate_service_charge(amount_cents: int, service_rate: float) -> int: Calculates the service charge on an amount in cents.
+- calculate_order_totals(lines, ...) -> OrderTotals: Computes subtotal, discount, service charge, tax and total of line items.
+- format_currency(amount_cents: int) -> str: Converts an amount in cents into a formatted currency string.
 - generate_payment_reference() -> str: Generates a unique payment reference number.
 - validate_payment_method(payment_method: str) -> bool: Validates the payment method (e.g., 'cash', 'credit_card').
-- process_payment(payment_method: str, amount: float) -> bool: Processes a payment and returns whether the payment was successful.
+- process_payment(payment_method: str, amount_cents: int) -> bool: Processes a payment and returns whether the payment was successful.
 """
 
 import random
-import decimal
+from dataclasses import dataclass
 from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Iterable, Tuple
+
+CENTS_PER_UNIT = 100
+BASIS_POINTS_PER_UNIT = 10_000
+
+@dataclass(frozen=True, slots=True)
+class OrderTotals:
+    """
+    The charges of an order or bill, all in integer cents.
+    """
+    subtotal_cents: int
+    discount_cents: int
+    service_charge_cents: int
+    tax_cents: int
+    total_cents: int
+
+def to_cents(amount: float | str | Decimal) -> int:
+    """
+    Converts an amount in currency units (e.g., 12.5 or "12.50") to integer cents, rounding half up.
+    Use this once, where an amount enters the system (user input, imports).
 
-def calculate_tax(amount: float, tax_rate: float) -> float:
+    :param amount: The amount in currency units.
+    :return: The amount in cents (e.g., 1250).
     """
-    Calculates the tax on a payment amount based on the provided tax rate.
+    return int((Decimal(str(amount)) * CENTS_PER_UNIT).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+def from_cents(amount_cents: int) -> Decimal:
+    """
+    Converts integer cents to an exact Decimal amount in currency units.
+
+    :param amount_cents: The amount in cents.
+    :return: The amount in currency units (e.g., Decimal('12.50')).
+    """
+    return Decimal(amount_cents).scaleb(-2)
+
+def to_basis_points(rate: float) -> int:
+    """
+    Converts a rate given as a fraction (e.g., 0.125) to integer basis points (1250), rounding half up.
+
+    :param rate: The rate as a fraction.
+    :return: The rate in basis points.
+    """
+    return int((Decimal(str(rate)) * BASIS_POINTS_PER_UNIT).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+def _apply_rate(amount_cents: int, rate: float) -> int:
+    # Integer-only rounding half away from zero: (amount * bp + 5000) // 10000 for positive amounts.
+    product = abs(amount_cents) * to_basis_points(rate)
+    cents = (product + BASIS_POINTS_PER_UNIT // 2) // BASIS_POINTS_PER_UNIT
+    return cents if amount_cents >= 0 else -cents
+
+def calculate_tax(amount_cents: int, tax_rate: float) -> int:
+    """
+    Calculates the tax on an amount based on the provided tax rate.
     
-    :param amount: The original payment amount.
-    :param tax_rate: The tax rate as a percentage (e.g., 0.1 for 10%).
-    :return: The tax amount for the payment.
+    :param amount_cents: The taxable amount in cents.
+    :param tax_rate: The tax rate as a fraction (e.g., 0.1 for 10%).
+    :return: The tax amount in cents.
     """
-    return round(amount * tax_rate, 2)
+    return _apply_rate(amount_cents, tax_rate)
 
-def calculate_discount(amount: float, discount_rate: float) -> float:
+def calculate_discount(amount_cents: int, discount_rate: float) -> int:
     """
-    Calculates the discount on a payment amount based on the provided discount rate.
+    Calculates the discount on an amount based on the provided discount rate.
     
-    :param amount: The original payment amount.
-    :param discount_rate: The discount rate as a percentage (e.g., 0.1 for 10%).
-    :return: The discount amount for the payment.
+    :param amount_cents: The original amount in cents.
+    :param discount_rate: The discount rate as a fraction (e.g., 0.1 for 10%).
+    :return: The discount amount in cents.
+    """
+    return _apply_rate(amount_cents, discount_rate)
+
+def calculate_service_charge(amount_cents: int, service_rate: float) -> int:
+    """
+    Calculates the service charge on an amount based on the provided service rate.
+
+    :param amount_cents: The amount in cents the service charge applies to.
+    :param service_rate: The service charge rate as a fraction (e.g., 0.125 for 12.5%).
+    :return: The service charge in cents.
+    """
+    return _apply_rate(amount_cents, service_rate)
+
+def calculate_order_totals(lines: Iterable[Tuple[int, int]], tax_rate: float = 0.0, discount_rate: float = 0.0,
+                           discount_cents: int = 0, service_rate: float = 0.0) -> OrderTotals:
+    """
+    Computes the totals of an order from its line items in one pass.
+
+    The discount (fixed amount plus rate, capped at the subtotal) comes off the subtotal first.
+    The service charge applies to the discounted amount. Tax applies once to the discounted
+    amount plus the service charge. Each charge is rounded once, never per line item.
+
+    :param lines: (unit_price_cents, quantity) pairs.
+    :param tax_rate: The tax rate as a fraction (default: 0.0).
+    :param discount_rate: The discount rate as a fraction (default: 0.0).
+    :param discount_cents: A fixed discount in cents (default: 0).
+    :param service_rate: The service charge rate as a fraction (default: 0.0).
+    :return: The OrderTotals of the order.
     """
-    return round(amount * discount_rate, 2)
+    subtotal = sum(unit_price_cents * quantity for unit_price_cents, quantity in lines)
+    discount = min(subtotal, discount_cents + calculate_discount(subtotal, discount_rate))
+    net = subtotal - discount
+    service_charge = calculate_service_charge(net, service_rate)
+    tax = calculate_tax(net + service_charge, tax_rate)
+    return OrderTotals(subtotal, discount, service_charge, tax, net + service_charge + tax)
 
-def format_currency(amount: float) -> str:
+def format_currency(amount_cents: int) -> str:
     """
-    Converts a numerical amount into a formatted currency string with two decimal places.
+    Converts an amount in cents into a formatted currency string with two decimal places.
     
-    :param amount: The amount to format.
+    :param amount_cents: The amount to format, in cents.
     :return: The formatted currency string (e.g., '$123.45').
     """
-    return "${:,.2f}".format(amount)
+    units, cents = divmod(abs(amount_cents), CENTS_PER_UNIT)
+    return "{}${:,}.{:02d}".format("-" if amount_cents < 0 else "", units, cents)
 
 def generate_payment_reference() -> str:
     """
@@ -78,12 +173,12 @@ def validate_payment_method(payment_method: str) -> bool:
     valid_payment_methods = ['cash', 'credit_card', 'debit_card', 'mobile_payment']
     return payment_method.lower() in valid_payment_methods
 
-def process_payment(payment_method: str, amount: float) -> bool:
+def process_payment(payment_method: str, amount_cents: int) -> bool:
     """
     Processes a payment based on the provided payment method and amount.
     
     :param payment_method: The payment method to use (e.g., 'cash', 'credit_card').
-    :param amount: The amount to be paid.
+    :param amount_cents: The amount to be paid, in cents.
     :return: True if the payment is successful, False otherwise.
     """
     if validate_payment_method(payment_method):
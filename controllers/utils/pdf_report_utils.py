@@ -10,25 +10,38 @@ tables, and other design elements.
 - Add custom branding with logos, headers, and footers.
 - Generate tables with detailed and styled data.
 - Easily add custom fonts and colors to enhance the design.
+- Stream any number of rows into a paged table report, one page of rows at a time (write_table_pdf).
 
 🛠️ Dependencies:
 - reportlab -> For creating and manipulating PDF files with rich styling options.
 - reportlab.platypus -> For creating tables, paragraphs, and other complex page elements.
 
+reportlab is imported inside the functions that draw, so importing this module stays cheap.
+Table reports are set in a Unicode TrueType font (see register_report_fonts), so text is never squeezed into a legacy code page.
+
 Functions:
 - generate_invoice_pdf(invoice_data: dict, output_path: str) -> None: Generates a polished invoice PDF based on the provided data.
-- generate_sales_summary_pdf(sales_data: list, output_path: str) -> None: Generates a beautifully styled sales summary PDF report.
+- generate_sales_summary_pdf(sales_data: Iterable[dict], output_path: str) -> None: Generates a beautifully styled sales summary PDF report.
+- write_table_pdf(rows: Iterable[Sequence], headers: Sequence[str], output_path: str, ...) -> int: Streams rows into a paged table PDF.
+- register_report_fonts() -> Tuple[str, str]: Registers the Unicode TrueType fonts of the table reports.
 - add_logo_and_header(pdf_canvas: Canvas, logo_path: str, header_text: str) -> None: Adds a logo and header to the PDF.
 - add_table_to_pdf(pdf_canvas: Canvas, table_data: list, column_widths: list) -> None: Adds a formatted table to the PDF.
 - add_footer_to_pdf(pdf_canvas: Canvas, footer_text: str) -> None: Adds a footer with custom text to the PDF.
 - save_pdf(pdf_canvas: Canvas, output_path: str) -> None: Saves the generated PDF to the specified file path.
 """
 
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, TableStyle
+from __future__ import annotations
+
+import functools
+import itertools
+import logging
+import os
+import zlib
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+if TYPE_CHECKING:
+    from reportlab.pdfgen import canvas
 
 def generate_invoice_pdf(invoice_data: dict, output_path: str) -> None:
     """
@@ -37,6 +50,10 @@ def generate_invoice_pdf(invoice_data: dict, output_path: str) -> None:
     :param invoice_data: The dictionary containing invoice details such as items, customer information, and total amount.
     :param output_path: The path where the generated PDF will be saved.
     """
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
     c = canvas.Canvas(output_path, pagesize=letter)
     
     # Header
@@ -62,53 +79,97 @@ def generate_invoice_pdf(invoice_data: dict, output_path: str) -> None:
     # Save the PDF
     save_pdf(c, output_path)
 
-def generate_sales_summary_pdf(sales_data: list, output_path: str) -> None:
+def generate_sales_summary_pdf(sales_data: Iterable[dict], output_path: str) -> None:
     """
     Generates a beautiful PDF report summarizing the sales data for a specific period.
+    The sales are streamed into the report (see write_table_pdf), so any number of them fit.
     
-    :param sales_data: A list of dictionaries containing sales information such as transaction date, amount, and items sold.
+    :param sales_data: An iterable of dictionaries containing sales information such as transaction date, amount, and items sold.
     :param output_path: The path where the generated PDF will be saved.
     """
-    doc = SimpleDocTemplate(output_path, pagesize=letter)
-    
-    # Sales Report Title
-    story = []
-    styles = getSampleStyleSheet()
-    title_style = styles['Title']
-    title = Paragraph("Sales Summary Report", title_style)
-    story.append(title)
-    
-    # Sales Data Table
-    table_data = [["Date", "Amount", "Items Sold"]]
-    for sale in sales_data:
-        table_data.append([sale['date'], sale['amount'], sale['items_sold']])
-    
-    table_style = TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-    ])
-    
-    sales_table = Table(table_data)
-    sales_table.setStyle(table_style)
-    
-    story.append(sales_table)
-    
-    doc.build(story)
+    rows = ((sale['date'], sale['amount'], sale['items_sold']) for sale in sales_data)
+    write_table_pdf(rows, ["Date", "Amount", "Items Sold"], output_path, title="Sales Summary Report")
+
+def write_table_pdf(rows: Iterable[Sequence[Any]], headers: Sequence[str], output_path: str, title: Optional[str] = None,
+                    column_widths: Optional[Sequence[float]] = None) -> int:
+    """
+    Streams rows into a tabular PDF report, one page-sized table at a time, repeating the header row
+    on every page. Only one page of rows is held at once: each page is drawn on the canvas, closed with
+    showPage() and compressed before the next rows are read, so rendering time grows linearly with the
+    number of rows and the canvas keeps only a few compressed kilobytes per page until it is saved.
+
+    :param rows: An iterable of rows, one value per column; consumed once.
+    :param headers: The column headers.
+    :param output_path: The path where the generated PDF will be saved.
+    :param title: (Optional) A title printed above the table on the first page.
+    :param column_widths: (Optional) The width of each column in points (default: the page width split evenly).
+    :return: The number of pages written.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.pdfgen import canvas
+    from reportlab.platypus import Paragraph, Table
+
+    regular, bold = register_report_fonts()
+    widths = list(column_widths or [_TABLE_WIDTH / len(headers)] * len(headers))
+    table_style = _table_style(regular, bold)
+    rows = iter(rows)
+    pdf = canvas.Canvas(output_path, pagesize=letter, pageCompression=1)
+    pdf.setPageCallBack(_compress_closed_page(pdf))
+    pages = 0
+    while True:
+        top = _PAGE_TOP - (_TITLE_HEIGHT if title and not pages else 0)
+        capacity = int((top - _PAGE_BOTTOM - _HEADER_HEIGHT) // _ROW_HEIGHT)
+        chunk = [[_fit(value, regular, width) for value, width in zip(row, widths)] for row in itertools.islice(rows, capacity)]
+        if not chunk and pages:
+            break
+        pages += 1
+        if title and pages == 1:
+            title_style = ParagraphStyle("ReportTitle", parent=getSampleStyleSheet()["Title"], fontName=bold)
+            heading = Paragraph(escape(title), title_style)
+            heading.wrapOn(pdf, _TABLE_WIDTH, _TITLE_HEIGHT)
+            heading.drawOn(pdf, _MARGIN, _PAGE_TOP - _TITLE_HEIGHT)
+        table = Table([list(headers), *chunk], colWidths=widths, rowHeights=[_HEADER_HEIGHT] + [_ROW_HEIGHT] * len(chunk), style=table_style)
+        _, height = table.wrapOn(pdf, _TABLE_WIDTH, top - _PAGE_BOTTOM)
+        table.drawOn(pdf, _MARGIN, top - height)
+        pdf.setFont(regular, 8)
+        pdf.drawString(_MARGIN, _MARGIN, f"Page {pages}")
+        pdf.showPage()
+        if len(chunk) < capacity:
+            break
+    pdf.save()
+    return pages
+
+def register_report_fonts() -> Tuple[str, str]:
+    """
+    Registers the TrueType fonts of the table reports with reportlab, once per process. TrueType fonts
+    are embedded as Unicode subsets, so any text the font has glyphs for is printed as is. The fonts are
+    REPORT_FONT_PATH / REPORT_BOLD_FONT_PATH if set, else DejaVu Sans if installed, else reportlab's bundled Vera,
+    which only covers Latin scripts.
+
+    :return: The names of the regular and the bold font.
+    """
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    if _REPORT_FONTS[0] not in pdfmetrics.getRegisteredFontNames():
+        paths = _font_paths()
+        for name, path in zip(_REPORT_FONTS, paths):
+            pdfmetrics.registerFont(TTFont(name, path))
+        pdfmetrics.registerFontFamily(_REPORT_FONTS[0], normal=_REPORT_FONTS[0], bold=_REPORT_FONTS[1])
+        logging.info(f"Report fonts registered from {paths[0]} and {paths[1]}")
+    return _REPORT_FONTS
 
 def add_logo_and_header(pdf_canvas: canvas.Canvas, logo_path: str, header_text: str) -> None:
     """
     Adds a logo and a header to the PDF canvas with beautiful alignment and spacing.
     
     :param pdf_canvas: The canvas object to add elements to.
-    :param logo_path: The path to the logo image.
+    :param logo_path: The path to the logo image; no logo is drawn if it is empty.
     :param header_text: The header text to display at the top of the page.
     """
-    pdf_canvas.drawImage(logo_path, 100, 750, width=60, height=60)  # Logo size and position
+    if logo_path:
+        pdf_canvas.drawImage(logo_path, 100, 750, width=60, height=60)  # Logo size and position
     pdf_canvas.setFont("Helvetica-Bold", 18)
     pdf_canvas.drawString(200, 780, header_text)
 
@@ -120,6 +181,9 @@ def add_table_to_pdf(pdf_canvas: canvas.Canvas, table_data: list, column_widths:
     :param table_data: A list of lists containing the table data.
     :param column_widths: A list specifying the width of each column.
     """
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
     table_style = TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -168,3 +232,88 @@ def save_pdf(pdf_canvas: canvas.Canvas, output_path: str) -> None:
     :param output_path: The path where the generated PDF will be saved.
     """
     pdf_canvas.save()
+
+# Layout of streamed table reports, in points on a US Letter page.
+_PAGE_WIDTH, _PAGE_HEIGHT = 612.0, 792.0
+_MARGIN = 40.0
+_TABLE_WIDTH = _PAGE_WIDTH - 2 * _MARGIN
+_PAGE_TOP = _PAGE_HEIGHT - _MARGIN
+_PAGE_BOTTOM = _MARGIN + 20  # room for the page number
+_TITLE_HEIGHT = 36.0
+_HEADER_HEIGHT = 26.0  # the header row keeps its 12pt bottom padding
+_ROW_HEIGHT = 16.0
+_FONT_SIZE = 9
+_ELLIPSIS = "\u2026"
+
+# Fonts of the table reports: an explicit choice, then DejaVu Sans, then the Vera fonts that ship with reportlab.
+REPORT_FONT_PATH = os.getenv("REPORT_FONT_PATH") or None
+REPORT_BOLD_FONT_PATH = os.getenv("REPORT_BOLD_FONT_PATH") or None
+_REPORT_FONTS = ("ReportSans", "ReportSans-Bold")
+_DEJAVU_DIRS = ("/usr/share/fonts/truetype/dejavu", "/usr/share/fonts/dejavu", "/usr/share/fonts/TTF", "/Library/Fonts")
+
+def _font_paths() -> Tuple[str, str]:
+    # Picks the regular and bold TrueType files, falling back a whole family at a time.
+    if REPORT_FONT_PATH:
+        return REPORT_FONT_PATH, REPORT_BOLD_FONT_PATH or REPORT_FONT_PATH
+    for directory in _DEJAVU_DIRS:
+        regular, bold = (os.path.join(directory, name) for name in ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf"))
+        if os.path.isfile(regular) and os.path.isfile(bold):
+            return regular, bold
+    import reportlab
+
+    fonts = os.path.join(os.path.dirname(reportlab.__file__), "fonts")
+    return os.path.join(fonts, "Vera.ttf"), os.path.join(fonts, "VeraBd.ttf")
+
+def _table_style(regular: str, bold: str) -> Any:
+    # The table style of the sales summary, with the report fonts.
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), bold),
+        ('FONTNAME', (0, 1), (-1, -1), regular),
+        ('FONTSIZE', (0, 0), (-1, -1), _FONT_SIZE),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ])
+
+def _compress_closed_page(pdf: canvas.Canvas) -> Callable[[int], None]:
+    # A page callback for the canvas: deflates the content stream of each page as soon as showPage() closes it.
+    # The canvas would keep the drawing operators of every page until save() and compress them only then;
+    # a stream whose dictionary already names its filter is written out as is.
+    from reportlab.pdfbase.pdfdoc import PDFDictionary, PDFName, PDFStream
+
+    def compress(page_number: int) -> None:
+        page = pdf._doc.Pages[-1]
+        page.Contents = PDFStream(PDFDictionary({"Filter": PDFName("FlateDecode")}), zlib.compress(page.stream.encode("utf8")))
+        page.stream = None
+    return compress
+
+@functools.lru_cache(maxsize=None)
+def _widest_ascii(font: str) -> float:
+    # The widest printable ASCII character, so short ASCII cells fit without measuring them.
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    return max(stringWidth(chr(code), font, _FONT_SIZE) for code in range(32, 127))
+
+def _fit(value: Any, font: str, width: float) -> str:
+    # Truncates text that would overflow its cell, ending it with an ellipsis.
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    text = "" if value is None else str(value)
+    room = width - 12  # the cell's left and right padding
+    if text.isascii() and len(text) * _widest_ascii(font) <= room or stringWidth(text, font, _FONT_SIZE) <= room:
+        return text
+    room -= stringWidth(_ELLIPSIS, font, _FONT_SIZE)
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if stringWidth(text[:middle], font, _FONT_SIZE) <= room:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low] + _ELLIPSIS
@@ -0,0 +1,234 @@
+"""
+pricing_engine.py
+
+This module provides the order pricing engine of the Restaurant Management System (RMS).
+Line items are held as columns (quantity, unit price, tax class, discount eligibility) and the
+subtotal, discount, service charge, tax and total of every order in a batch are computed in one
+vectorized pass with NumPy, so a bill and a repricing job over thousands of orders share one
+implementation.
+
+The charges follow calculate_order_totals (see payment_utils.py), extended to tax classes and
+items excluded from discounts:
+- The discount (fixed amount plus the order's rate, capped) applies to the discountable items only.
+- The service charge applies to the discounted amount.
+- Each tax class is taxed on its share of the discounted amount plus service charge; the discount
+  and service charge are split between the classes in proportion, to the cent.
+- Every charge is rounded half up once per order (tax once per class), never per line item.
+An order with a single tax class is priced exactly as by calculate_order_totals.
+
+📌 Features:
+- Load the line items of many orders as arrays with one query, at their ordered or current menu prices.
+- Build the arrays of a single bill, or of a batch of new orders, from item dictionaries.
+- Price any number of orders per call with exact integer arithmetic on cents.
+- Tax rates per tax class (DEFAULT_TAX_RATES, overridable per call).
+
+🛠️ Dependencies:
+- NumPy -> Vectorized pricing; imported on first use.
+- SQLAlchemy -> Loads line items, tax classes and order discounts.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from controllers.utils.payment_utils import BASIS_POINTS_PER_UNIT, OrderTotals, to_basis_points, to_cents
+from models import Discount, MenuItem, Order, OrderItem
+
+# Tax rate per tax class (see MenuItem.tax_class).
+DEFAULT_TAX_RATES: Dict[str, float] = {"standard": 0.1, "reduced": 0.05, "exempt": 0.0}
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as error:  # pragma: no cover - numpy is in requirements.txt
+        raise ImportError("The pricing engine requires NumPy: pip install numpy") from error
+    return numpy
+
+
+@dataclass(frozen=True, slots=True)
+class OrderLines:
+    """
+    The line items of a batch of orders, as columns. Order-level arrays have one entry per order;
+    line-level arrays one entry per line item.
+    """
+    order_ids: Any         # order-level: the order IDs, in batch order
+    discount_bp: Any       # order-level: discount rate of each order in basis points
+    order_index: Any       # line-level: position of the line's order in `order_ids`
+    quantity: Any          # line-level
+    unit_price_cents: Any  # line-level
+    tax_class: Any         # line-level: index into `tax_classes`
+    discountable: Any      # line-level: bool
+    tax_classes: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class PricedOrders:
+    """
+    The charges of a batch of orders, as order-level arrays of integer cents.
+    """
+    order_ids: Any
+    subtotal_cents: Any
+    discount_cents: Any
+    service_charge_cents: Any
+    tax_cents: Any
+    total_cents: Any
+
+    def __len__(self) -> int:
+        return len(self.order_ids)
+
+    def totals(self, index: int) -> OrderTotals:
+        """
+        The charges of one order of the batch.
+
+        :param index: The position of the order in the batch.
+        :return: The OrderTotals of that order.
+        """
+        return OrderTotals(
+            int(self.subtotal_cents[index]), int(self.discount_cents[index]), int(self.service_charge_cents[index]),
+            int(self.tax_cents[index]), int(self.total_cents[index]),
+        )
+
+    def by_order(self) -> Dict[int, OrderTotals]:
+        """
+        The charges of every order of the batch, by order ID.
+        """
+        return {int(order_id): self.totals(index) for index, order_id in enumerate(self.order_ids)}
+
+
+def _columns(order_ids: List[int], discount_bp: List[int], rows: List[tuple]) -> OrderLines:
+    # rows: (order_index, quantity, unit_price_cents, tax_class, discountable)
+    np = _numpy()
+    order_index, quantity, unit_price_cents, tax_class, discountable = zip(*rows) if rows else ((),) * 5
+    tax_classes, codes = np.unique(np.array(tax_class, dtype=str), return_inverse=True)
+    return OrderLines(
+        order_ids=np.array(order_ids, dtype=np.int64),
+        discount_bp=np.array(discount_bp, dtype=np.int64),
+        order_index=np.array(order_index, dtype=np.int64),
+        quantity=np.array(quantity, dtype=np.int64),
+        unit_price_cents=np.array(unit_price_cents, dtype=np.int64),
+        tax_class=codes.astype(np.int64).reshape(-1),
+        discountable=np.array(discountable, dtype=bool),
+        tax_classes=tuple(str(name) for name in tax_classes),
+    )
+
+
+def lines_from_items(items: Iterable[Dict[str, Any]], discount_rate: float = 0.0) -> OrderLines:
+    """
+    Builds the arrays of one order from item dictionaries.
+
+    :param items: Dictionaries with quantity and price_cents or price, and optionally tax_class (default: "standard") and discountable (default: True).
+    :param discount_rate: (Optional) The discount rate of the order as a fraction (default: 0.0).
+    :return: The OrderLines of a batch holding that one order (order ID 0).
+    """
+    return _columns([0], [to_basis_points(discount_rate)], [_item_row(0, item) for item in items])
+
+
+def lines_from_orders(orders: Iterable[Iterable[Dict[str, Any]]], order_ids: Iterable[int]) -> OrderLines:
+    """
+    Builds the arrays of a batch of orders that are not stored yet, e.g. to price new orders
+    before they are inserted.
+
+    :param orders: The item dictionaries of each order, as for lines_from_items.
+    :param order_ids: The ID of each order, in the same order.
+    :return: The OrderLines of the batch, without discounts.
+    """
+    order_ids = list(order_ids)
+    rows = [_item_row(index, item) for index, items in enumerate(orders) for item in items]
+    return _columns(order_ids, [0] * len(order_ids), rows)
+
+
+def _item_row(order_index: int, item: Dict[str, Any]) -> tuple:
+    return (
+        order_index,
+        int(item.get("quantity", 1)),
+        item["price_cents"] if "price_cents" in item else to_cents(item["price"]),
+        item.get("tax_class", "standard"),
+        bool(item.get("discountable", True)),
+    )
+
+
+def load_order_lines(session: Session, order_ids: Iterable[int], use_menu_prices: bool = False) -> OrderLines:
+    """
+    Loads the line items of orders, with their tax classes and the orders' discount codes.
+
+    :param session: The SQLAlchemy session for database interactions.
+    :param order_ids: The IDs of the orders; IDs without an order are left out.
+    :param use_menu_prices: Whether to price items at their current menu price instead of the price when ordered (default: False).
+    :return: The OrderLines of the orders found, in ascending order ID.
+    """
+    order_ids = sorted(set(order_ids))
+    orders = session.execute(
+        select(Order.order_id, Discount.percentage)
+        .outerjoin(Discount, Discount.discount_id == Order.discount_id)
+        .where(Order.order_id.in_(order_ids))
+        .order_by(Order.order_id)
+    ).all()
+    position = {order_id: index for index, (order_id, _) in enumerate(orders)}
+    price = MenuItem.price_cents if use_menu_prices else OrderItem.unit_price_cents
+    rows = session.execute(
+        select(OrderItem.order_id, OrderItem.quantity, price, MenuItem.tax_class, MenuItem.discountable)
+        .join(MenuItem, MenuItem.item_id == OrderItem.item_id)
+        .where(OrderItem.order_id.in_(order_ids))
+    )
+    return _columns(
+        [order_id for order_id, _ in orders],
+        # Discount.percentage is a percentage (e.g. 15 for 15%).
+        [to_basis_points((percentage or 0) / 100) for _, percentage in orders],
+        [(position[order_id], *line) for order_id, *line in rows],
+    )
+
+
+def price_orders(lines: OrderLines, tax_rates: Optional[Mapping[str, float]] = None, discount_cents: int = 0, service_rate: float = 0.0) -> PricedOrders:
+    """
+    Prices every order of a batch in one vectorized pass.
+
+    :param lines: The line items of the orders.
+    :param tax_rates: (Optional) The tax rate of each tax class as a fraction (default: DEFAULT_TAX_RATES).
+    :param discount_cents: (Optional) A fixed discount in cents applied to each order (default: 0).
+    :param service_rate: (Optional) The service charge rate as a fraction (default: 0.0).
+    :return: The PricedOrders of the batch, in the order of `lines.order_ids`.
+    :raises ValueError: If a line has a tax class without a rate.
+    """
+    np = _numpy()
+    tax_rates = DEFAULT_TAX_RATES if tax_rates is None else tax_rates
+    missing = [name for name in lines.tax_classes if name not in tax_rates]
+    if missing:
+        raise ValueError(f"No tax rate for the tax classes {missing}")
+    tax_bp = np.array([to_basis_points(tax_rates[name]) for name in lines.tax_classes] or [0], dtype=np.int64)
+    orders, classes = len(lines.order_ids), len(tax_bp)
+
+    # One cell per order and tax class; np.add.at sums exactly in int64.
+    cell = lines.order_index * classes + lines.tax_class
+    amount = lines.quantity * lines.unit_price_cents
+    gross = np.zeros(orders * classes, dtype=np.int64)
+    eligible = np.zeros(orders * classes, dtype=np.int64)
+    np.add.at(gross, cell, amount)
+    np.add.at(eligible, cell, amount * lines.discountable)
+    gross, eligible = gross.reshape(orders, classes), eligible.reshape(orders, classes)
+
+    subtotal = gross.sum(axis=1)
+    eligible_total = eligible.sum(axis=1)
+    discount = np.minimum(eligible_total, discount_cents + _apply_rate(eligible_total, lines.discount_bp))
+    net_by_class = gross - _allocate(np, discount, eligible)
+    net = subtotal - discount
+    service = _apply_rate(net, to_basis_points(service_rate))
+    taxable_by_class = net_by_class + _allocate(np, service, net_by_class)
+    tax = _apply_rate(taxable_by_class, tax_bp).sum(axis=1)
+    return PricedOrders(lines.order_ids, subtotal, discount, service, tax, net + service + tax)
+
+
+def _apply_rate(amount_cents, basis_points):
+    # Same rounding as payment_utils._apply_rate, for the non-negative amounts of an order.
+    return (amount_cents * basis_points + BASIS_POINTS_PER_UNIT // 2) // BASIS_POINTS_PER_UNIT
+
+
+def _allocate(np, amount, weights):
+    # Splits each order's amount between its tax classes in proportion to the weights, to the
+    # cent: shares are rounded down and the remaining cents go to the largest class.
+    weight_total = weights.sum(axis=1)
+    shares = amount[:, None] * weights // np.maximum(weight_total, 1)[:, None]
+    shares[np.arange(len(amount)), weights.argmax(axis=1)] += amount - shares.sum(axis=1)
+    return shares
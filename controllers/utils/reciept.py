@@ -1,17 +1,22 @@
-import win32print
-import win32api
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
+from __future__ import annotations
 
-def generate_receipt_pdf(receipt_data: dict, output_path: str) -> None:
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from reportlab.pdfgen import canvas
+
+def generate_receipt_pdf(receipt_data: dict, output_path: str, print_copy: bool = True) -> None:
     """
     Generates a detailed receipt PDF with the provided receipt data, including an order code.
     
     :param receipt_data: A dictionary containing receipt details such as the order code, 
                             customer information, items purchased, total amount, and payment method.
     :param output_path: The path where the generated receipt PDF will be saved.
+    :param print_copy: Whether to send the receipt to the default printer (default: True).
     """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
     c = canvas.Canvas(output_path, pagesize=letter)
     
     add_order_code_to_receipt(c, receipt_data['order_code'])
@@ -20,7 +25,8 @@ def generate_receipt_pdf(receipt_data: dict, output_path: str) -> None:
     add_payment_details_to_receipt(c, receipt_data['payment_method'], receipt_data['total_amount'])
     add_footer_to_receipt(c, "Thank you for dining with us! Visit again soon.")
     save_pdf(c, output_path)
-    print_receipt(output_path)
+    if print_copy:
+        print_receipt(output_path)
 
 def print_receipt(pdf_path: str) -> None:
     """
@@ -28,6 +34,9 @@ def print_receipt(pdf_path: str) -> None:
     
     :param pdf_path: The path to the PDF file to be printed.
     """
+    import win32api
+    import win32print
+
     printer_name = win32print.GetDefaultPrinter()  # Get the default printer
     win32api.ShellExecute(0, "print", pdf_path, '/d:"%s"' % printer_name, ".", 0)
 
@@ -0,0 +1,197 @@
+"""
+render_service.py
+
+This module provides the document rendering service of the Restaurant Management System (RMS).
+Invoices and receipts are rendered by a pool of worker processes instead of on the calling
+thread, so a burst of payments at close-out never freezes the POS: callers get a Future for
+the rendered file and carry on.
+
+📌 Features:
+- Render invoices and receipts in worker processes, one per core by default.
+- Bounded backlog: submitting blocks (or raises queue.Full after a timeout) while too many
+  documents are pending.
+- A request for a document that is already pending for the same bill and file returns the same Future.
+- Bulk rendering across every core (see BillingController.render_invoices_for_date).
+- A pool broken by a dead worker (killed, out of memory) is replaced on the next submit; only the
+  documents that were pending in it fail, with BrokenProcessPool.
+- Share one process-wide service through `get_render_service()`.
+
+🛠️ Dependencies:
+- concurrent.futures -> Process pool and Futures for the rendered files.
+- multiprocessing -> "spawn" workers, which are safe alongside the database threads.
+- pdf_report_utils / reciept -> The renderers, run in the workers.
+- dotenv -> Loads RENDER_WORKERS, RENDER_MAX_PENDING and INVOICE_LOGO_PATH from the .env file.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from controllers.utils.pdf_report_utils import generate_invoice_pdf
+from controllers.utils.reciept import generate_receipt_pdf
+
+load_dotenv()
+
+# Worker processes (empty = one per core) and the number of documents that may be pending at once.
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS") or 0) or None
+RENDER_MAX_PENDING = int(os.getenv("RENDER_MAX_PENDING") or 256)
+# Logo printed on invoices (empty = no logo).
+INVOICE_LOGO_PATH = os.getenv("INVOICE_LOGO_PATH") or None
+
+DOCUMENT_KINDS = ("invoice", "receipt")
+
+# (kind, bill_id, document data, output path)
+RenderJob = Tuple[str, int, Dict[str, Any], str]
+
+
+def render_document(kind: str, data: Dict[str, Any], output_path: str) -> str:
+    """
+    Renders one document. Runs in a worker process.
+
+    :param kind: "invoice" (see generate_invoice_pdf) or "receipt" (see generate_receipt_pdf; not printed).
+    :param data: The document data.
+    :param output_path: The path where the generated PDF will be saved.
+    :return: The output path.
+    """
+    if kind == "invoice":
+        generate_invoice_pdf(data, output_path)
+    elif kind == "receipt":
+        generate_receipt_pdf(data, output_path, print_copy=False)
+    else:
+        raise ValueError(f"Unknown document kind: {kind}")
+    return output_path
+
+
+class RenderService:
+    """
+    Renders documents in a process pool with a bounded backlog, one pending render per document.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: int = RENDER_MAX_PENDING):
+        """
+        Initializes the RenderService; the worker processes are started on first use.
+
+        :param max_workers: (Optional) The number of worker processes (default: RENDER_WORKERS, else one per core).
+        :param max_pending: The maximum number of documents queued or rendering at once (default: RENDER_MAX_PENDING).
+        """
+        self.max_workers = max_workers or RENDER_WORKERS or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending: Dict[Tuple[str, int, str], Future] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Starts the worker processes if they are not already running.
+        """
+        with self._lock:
+            self._start()
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stops the worker processes.
+
+        :param wait: Whether to wait for the pending documents to be rendered first (default: True).
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def submit(self, kind: str, bill_id: int, data: Dict[str, Any], output_path: str, timeout: Optional[float] = None) -> "Future[str]":
+        """
+        Queues a document for rendering. If the same document of the same bill is already pending
+        for the same file, its Future is returned and nothing new is queued.
+
+        :param kind: "invoice" or "receipt".
+        :param bill_id: The ID of the bill the document belongs to.
+        :param data: The document data (plain values; it is sent to a worker process).
+        :param output_path: The path where the generated PDF will be saved.
+        :param timeout: (Optional) Seconds to wait while the backlog is full (default: wait as long as needed).
+        :return: A Future resolved with the output path once the document is rendered.
+        :raises ValueError: If the document kind is unknown.
+        :raises queue.Full: If the backlog stayed full for `timeout` seconds.
+        """
+        if kind not in DOCUMENT_KINDS:
+            raise ValueError(f"Unknown document kind: {kind}")
+        key = (kind, bill_id, output_path)
+        with self._lock:
+            future = self._pending.get(key)
+        if future is not None:
+            return future
+        if not self._slots.acquire(timeout=timeout):
+            raise queue.Full(f"{self.max_pending} documents are already pending")
+        try:
+            with self._lock:
+                future = self._pending.get(key)  # submitted by another thread while this one waited
+                queued = future is None
+                if queued:
+                    future = self._pending[key] = self._render(kind, data, output_path)
+        except BaseException:
+            self._slots.release()
+            raise
+        if not queued:
+            self._slots.release()
+            return future
+        future.add_done_callback(lambda done: self._finished(key, done))
+        return future
+
+    def render_many(self, jobs: Iterable[RenderJob]) -> Dict[Tuple[str, int], "Future[str]"]:
+        """
+        Queues many documents, keeping every worker busy. Blocks while the backlog is full, so
+        any number of jobs can be passed.
+
+        :param jobs: The (kind, bill_id, data, output_path) of each document.
+        :return: The Future of each document, by (kind, bill_id).
+        """
+        return {(kind, bill_id): self.submit(kind, bill_id, data, output_path) for kind, bill_id, data, output_path in jobs}
+
+    def _start(self) -> ProcessPoolExecutor:
+        # Called with the lock held.
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def _render(self, kind: str, data: Dict[str, Any], output_path: str) -> Future:
+        # Called with the lock held. Once a worker dies the pool refuses every submit, so it is
+        # replaced; its own pending futures have already failed with BrokenProcessPool.
+        try:
+            return self._start().submit(render_document, kind, data, output_path)
+        except BrokenProcessPool:
+            logging.warning("Render pool broken by a dead worker; starting a new one")
+            broken, self._pool = self._pool, None
+            broken.shutdown(wait=False)
+            return self._start().submit(render_document, kind, data, output_path)
+
+    def _finished(self, key: Tuple[str, int, str], future: Future) -> None:
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+        self._slots.release()
+
+
+_render_service: Optional[RenderService] = None
+_render_service_lock = threading.Lock()
+
+
+def get_render_service() -> RenderService:
+    """
+    Returns the process-wide render service, creating it on first use.
+
+    :return: The shared RenderService.
+    """
+    global _render_service
+    with _render_service_lock:
+        if _render_service is None:
+            _render_service = RenderService()
+            atexit.register(_render_service.stop)
+        return _render_service
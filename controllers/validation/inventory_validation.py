@@ -12,7 +12,7 @@ Libraries:
 Functions:
 ----------
 - validate_stock_quantity(quantity: int) -> bool:
-    Ensures stock quantity is a positive integer.
+    Ensures stock quantity is a whole number of zero or more.
 
     Example:
     --------
@@ -46,22 +46,24 @@ Functions:
 """
 
 import re
-from datetime import datetime
+from datetime import date as Date, datetime
 from typing import Dict
 
+# Letters (any script), digits, spaces and the punctuation found in product names; 100 is the column length.
+NAME_PATTERN = re.compile(r"[^\W_][\w '&(),.%\-/]{0,99}")
+
 
 def validate_stock_quantity(quantity: int) -> bool:
     """
-    Validates the stock quantity to ensure it is a positive integer.
+    Validates the stock quantity to ensure it is a whole number of zero or more (an item can be out of stock).
 
     Args:
     quantity (int): The stock quantity to validate.
 
     Returns:
-    bool: True if the quantity is positive, False otherwise.
+    bool: True if the quantity is zero or positive, False otherwise.
     """
-    
-    pass
+    return isinstance(quantity, int) and not isinstance(quantity, bool) and quantity >= 0
 
 
 def validate_expiration_date(date: str) -> bool:
@@ -74,8 +76,10 @@ def validate_expiration_date(date: str) -> bool:
     Returns:
     bool: True if the expiration date is valid and not expired, False otherwise.
     """
-    
-    pass
+    try:
+        return datetime.strptime(date, "%Y-%m-%d").date() >= Date.today()
+    except (TypeError, ValueError):
+        return False
 
 
 def validate_supplier_details(details: Dict[str, str]) -> bool:
@@ -102,8 +106,7 @@ def validate_item_name(name: str) -> bool:
     Returns:
     bool: True if the name is alphanumeric and has a valid length, False otherwise.
     """
-    
-    pass
+    return isinstance(name, str) and NAME_PATTERN.fullmatch(name) is not None
 
 
 def validate_supplier_contact(contact: str) -> bool:
@@ -65,7 +65,13 @@ Functions:
     False
 """
 
+import math
 import re
+from decimal import Decimal
+
+# Letters (any script), digits, spaces and the punctuation found in dish names; 100 is the column length.
+NAME_PATTERN = re.compile(r"[^\W_][\w '&(),.\-/]{0,99}")
+AVAILABILITY_STATUSES = ("Available", "Unavailable")
 
 def validate_price(price: float) -> bool:
     """
@@ -77,8 +83,12 @@ def validate_price(price: float) -> bool:
     Returns:
     bool: True if the price is positive, False otherwise.
     """
-    
-    pass
+    if isinstance(price, bool) or not isinstance(price, (int, float, Decimal)):
+        return False
+    if isinstance(price, Decimal):
+        # A signaling NaN cannot even be converted to float, so check Decimals without math.
+        return price.is_finite() and price > 0
+    return math.isfinite(price) and price > 0
 
 def validate_category(category: str) -> bool:
     """
@@ -103,8 +113,7 @@ def validate_availability(status: str) -> bool:
     Returns:
     bool: True if the status is valid, False otherwise.
     """
-    
-    pass
+    return status in AVAILABILITY_STATUSES
 
 def validate_menu_item_name(name: str) -> bool:
     """
@@ -116,8 +125,7 @@ def validate_menu_item_name(name: str) -> bool:
     Returns:
     bool: True if the name is alphanumeric and has a valid length, False otherwise.
     """
-    
-    pass
+    return isinstance(name, str) and NAME_PATTERN.fullmatch(name) is not None
 
 def validate_description(description: str) -> bool:
     """
@@ -7,15 +7,16 @@ Libraries:
 ----------
 - `re`: Used for validating discount codes and other string formats.
 - `datetime`: For checking discount code expiration.
+- `database.menu_catalog`: For looking up menu items without querying the database.
 
 Functions:
 ----------
-- validate_menu_item(item_id: str) -> bool:
-    Checks if the selected menu item exists in the database.
+- validate_menu_item(item_id: str, session: Optional[Session] = None) -> bool:
+    Checks if the selected menu item is on the menu and available for ordering.
 
     Example:
     --------
-    >>> validate_menu_item("burger123")
+    >>> validate_menu_item("12")
     True
 
     >>> validate_menu_item("")
@@ -68,21 +69,30 @@ Functions:
 
 import re
 from datetime import datetime
+from typing import Optional
 
+from sqlalchemy.orm import Session
 
+from database.menu_catalog import get_menu_catalog
 
-def validate_menu_item(item_id: str) -> bool:
+
+def validate_menu_item(item_id: str, session: Optional[Session] = None) -> bool:
     """
-    Validates if the menu item exists in the database (for demonstration, we use a hardcoded list of item IDs).
-    
+    Validates if the menu item exists and is available, using the in-memory menu catalog.
+
     Args:
     item_id (str): The ID of the menu item.
+    session (Session, optional): The session used to load the catalog on first use (default: the thread's application session).
 
     Returns:
-    bool: True if the item exists, False otherwise.
+    bool: True if the item exists and is available, False otherwise.
     """
-    
-    pass
+    try:
+        item_id = int(item_id)
+    except (TypeError, ValueError):
+        return False
+    item = get_menu_catalog(session).snapshot(session).by_id.get(item_id)
+    return item is not None and item.available
 
 def validate_payment_method(method: str) -> bool:
     """
@@ -120,8 +130,7 @@ def validate_order_quantity(quantity: int) -> bool:
     Returns:
     bool: True if the quantity is valid (positive integer), False otherwise.
     """
-    
-    pass
+    return isinstance(quantity, int) and not isinstance(quantity, bool) and quantity > 0
 
 def validate_customer_details(customer_id: str, name: str) -> bool:
     """
@@ -0,0 +1,178 @@
+"""
+archive.py
+
+This module provides hot/cold data archival for the Restaurant Management System (RMS).
+Closed orders, paid bills and past reservations older than a cutoff are moved from the main
+database into a separate SQLite file, which keeps the live tables and their indexes small.
+The archive is ATTACHed to a connection on demand, so history lookups can read both databases
+in one query when the full history is asked for.
+
+📌 Features:
+- Mirror the orders, order_items, order_events, billing and reservations tables in the archive database.
+- Move records older than N days into the archive: `python -m database.archive --days 365`.
+- Re-running the job after an interruption is safe; rows already copied are skipped.
+- Never lose a row: the live tables use AUTOINCREMENT so archived ids are not reused, and a live row
+  whose id is already archived with different values stops the run instead of being dropped.
+- Attach the archive once per pooled connection as the "archive" schema.
+
+🛠️ Dependencies:
+- SQLAlchemy -> Core insert-from-select and delete statements, schema-qualified archive tables.
+- sqlite3 -> For creating the archive file in WAL mode.
+- WriteQueue -> Routes the archival transaction through the single database writer thread.
+- python-dotenv -> Loads the archive path from the .env file.
+- logging -> For logging archival runs.
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Sequence
+
+from dotenv import load_dotenv
+from sqlalchemy import Column, Index, MetaData, Table, and_, delete, exists, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from database.connection import session_scope
+from database.write_queue import WriteQueue, run_write
+from models import Billing, Order, OrderEvent, OrderItem, Reservation
+
+load_dotenv()
+
+ARCHIVE_PATH = os.getenv("ARCHIVE_DB_PATH", "restaurant_archive.db")
+ARCHIVE_SCHEMA = "archive"
+
+CLOSED_ORDER_STATUSES = ("Completed", "Cancelled")
+
+archive_metadata = MetaData(schema=ARCHIVE_SCHEMA)
+
+
+def _archive_table(table: Table, *indexes: Index) -> Table:
+    # Plain copies of the columns: archived rows keep their ids, but foreign keys cannot
+    # point from the archive file into the main database.
+    columns = [Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable) for column in table.columns]
+    return Table(table.name, archive_metadata, *columns, *indexes)
+
+
+archived_orders = _archive_table(Order.__table__, Index("ix_archived_orders_customer_created", "customer_id", "created_at"))
+archived_order_items = _archive_table(OrderItem.__table__, Index("ix_archived_order_items_order", "order_id"))
+archived_order_events = _archive_table(OrderEvent.__table__, Index("ix_archived_order_events_order", "order_id"))
+archived_billing = _archive_table(Billing.__table__, Index("ix_archived_billing_customer_created", "customer_id", "created_at"))
+archived_reservations = _archive_table(Reservation.__table__, Index("ix_archived_reservations_customer_date", "customer_id", "reservation_date"))
+
+
+def attach_archive(session: Session, archive_path: Optional[str] = None, create: bool = False) -> bool:
+    """
+    Attaches the archive database to the session's connection as the "archive" schema.
+    Pooled connections stay attached, so this is a dictionary lookup after the first call.
+
+    :param session: The session whose connection the archive is attached to.
+    :param archive_path: (Optional) Path to the archive file (default: ARCHIVE_DB_PATH from .env).
+    :param create: Whether to create the archive file and tables if they do not exist (default: False).
+    :return: True if the archive is attached, False if it does not exist and create is False.
+    """
+    connection = session.connection()
+    if connection.info.get("rms_archive_attached"):
+        return True
+
+    archive_path = os.path.abspath(archive_path or ARCHIVE_PATH)
+    if not os.path.exists(archive_path):
+        if not create:
+            return False
+        archive = sqlite3.connect(archive_path)
+        try:
+            archive.execute("PRAGMA journal_mode=WAL")
+        finally:
+            archive.close()
+
+    connection.exec_driver_sql(f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}", (archive_path,))
+    connection.info["rms_archive_attached"] = True
+    if create:
+        archive_metadata.create_all(connection)
+    return True
+
+
+def last_assigned_id(session: Session, table: Table) -> int:
+    """
+    Returns the largest id ever assigned in an AUTOINCREMENT table, including ids of rows since
+    moved to the archive.
+
+    :param session: The SQLAlchemy session for database interactions.
+    :param table: The live table.
+    :return: The largest id, or 0 if none was assigned (or the table predates AUTOINCREMENT).
+    """
+    if not session.scalar(text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_sequence'")):
+        return 0
+    return session.scalar(text("SELECT seq FROM sqlite_sequence WHERE name = :name"), {"name": table.name}) or 0
+
+
+def archive_old_records(session: Session, older_than_days: int = 365, archive_path: Optional[str] = None, write_queue: Optional[WriteQueue] = None) -> Dict[str, int]:
+    """
+    Moves closed orders, paid bills and past reservations older than the cutoff into the archive.
+
+    Bills are moved first; orders and reservations are only moved once no bill in the main
+    database refers to them.
+
+    :param session: The SQLAlchemy session for database interactions.
+    :param older_than_days: Records older than this many days are archived (default: 365).
+    :param archive_path: (Optional) Path to the archive file (default: ARCHIVE_DB_PATH from .env).
+    :param write_queue: (Optional) The write queue that the archival transaction is routed through.
+    :return: A dictionary with the number of rows moved per table.
+    """
+    cutoff = datetime.now() - timedelta(days=older_than_days)
+    orders, order_items, order_events = Order.__table__, OrderItem.__table__, OrderEvent.__table__
+    billing, reservations = Billing.__table__, Reservation.__table__
+
+    def move(session: Session, source: Table, target: Table, condition) -> int:
+        columns = [column.name for column in source.columns]
+        # OR IGNORE skips rows copied by an earlier, interrupted run. Any other row it skipped
+        # reuses an archived id, and deleting it from the live table would lose it.
+        session.execute(insert(target).prefix_with("OR IGNORE").from_select(columns, select(*source.columns).where(condition)))
+        # Aliased, since "orders" inside a subquery on archive.orders would name the archive table.
+        archived = target.alias("archived")
+        identical = and_(*(archived.c[name].is_not_distinct_from(source.c[name]) for name in columns))
+        conflicts = session.scalar(select(func.count()).select_from(source).where(condition, ~exists().where(identical)))
+        if conflicts:
+            raise ValueError(f"{conflicts} rows of {source.name} reuse ids already in the archive with different values; nothing was archived")
+        return session.execute(delete(source).where(condition)).rowcount
+
+    def work(session: Session) -> Dict[str, int]:
+        attach_archive(session, archive_path, create=True)
+        moved = {}
+        moved["billing"] = move(session, billing, archived_billing, (billing.c.status == "Paid") & (billing.c.created_at < cutoff))
+
+        closed_orders = (
+            orders.c.status.in_(CLOSED_ORDER_STATUSES)
+            & (orders.c.created_at < cutoff)
+            & ~exists().where(billing.c.order_id == orders.c.order_id)
+        )
+        closed_order_ids = select(orders.c.order_id).where(closed_orders)
+        moved["order_items"] = move(session, order_items, archived_order_items, order_items.c.order_id.in_(closed_order_ids))
+        moved["order_events"] = move(session, order_events, archived_order_events, order_events.c.order_id.in_(closed_order_ids))
+        moved["orders"] = move(session, orders, archived_orders, closed_orders)
+
+        moved["reservations"] = move(
+            session, reservations, archived_reservations,
+            (reservations.c.reservation_date < cutoff) & ~exists().where(billing.c.reservation_id == reservations.c.reservation_id),
+        )
+        return moved
+
+    moved = run_write(work, session, write_queue)
+    logging.info(f"Archived records older than {cutoff:%Y-%m-%d}: {moved}")
+    return moved
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Move old orders, bills and reservations into the RMS archive database.")
+    parser.add_argument("--days", type=int, default=365, help="archive records older than this many days")
+    parser.add_argument("--archive", default=None, help="archive database file (default: ARCHIVE_DB_PATH)")
+    args = parser.parse_args(argv)
+
+    with session_scope() as session:
+        for table, count in archive_old_records(session, args.days, args.archive).items():
+            print(f"{table}: {count} rows archived")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+bulk.py
+
+This module provides bulk persistence for the Restaurant Management System (RMS).
+Loading a menu, a supplier catalogue or a day of imported delivery orders goes through
+one executemany per batch instead of one ORM add and flush per row.
+
+📌 Features:
+- Bulk insert rows of any model (MenuItem, Inventory, Reservation, Staff, Supplier, ...) except
+  orders and their line items, which must go through `OrderController.create_orders`.
+- Bulk upsert rows with `INSERT ... ON CONFLICT DO UPDATE` on the model's natural key.
+- Report how many rows were inserted and how many were updated.
+- Run each call as one transaction through `run_write`, optionally on the single-writer queue,
+  or hand out the unit of work so several bulk writes can share one transaction.
+- After menu items or categories were loaded: recompute `out_of_stock` in the same transaction,
+  invalidate the in-memory menu catalog and republish the compressed menu.
+
+🛠️ Dependencies:
+- SQLAlchemy -> Core insert statements, executemany / insertmanyvalues batching, SQLite upserts.
+- WriteQueue -> Routes bulk writes through the single database writer thread.
+- menu_catalog / menu_publisher / recipes -> Keep the cached and published menu and the stock state in step.
+- logging -> For logging bulk loads.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import Table, insert, inspect, select, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from database.menu_catalog import get_menu_catalog
+from database.menu_publisher import get_menu_publisher
+from database.recipes import refresh_stock_state
+from database.write_queue import WriteQueue, end_read, run_write
+from models import Category, Inventory, MenuItem, Order, OrderItem, Supplier
+
+Row = Dict[str, Any]
+
+# Natural keys used as the upsert conflict target when the caller does not name one.
+# Models without a unique natural key fall back to their primary key.
+DEFAULT_CONFLICT_COLUMNS: Dict[type, Tuple[str, ...]] = {
+    Inventory: ("name",),
+    Supplier: ("name",),
+}
+
+# Orders feed the sales rollup and the order event log, which a raw bulk load would skip.
+_ORDER_MODELS = (Order, OrderItem)
+
+# SQLite's default limit on bound parameters per statement is 32766; key lookups stay well below it.
+_KEY_LOOKUP_CHUNK = 500
+
+
+class BulkPersistenceService:
+    """
+    Inserts and upserts large numbers of rows with batched executemany statements.
+    """
+
+    def __init__(self, db_session: Session, write_queue: Optional[WriteQueue] = None, batch_size: int = 1000):
+        """
+        Initializes the BulkPersistenceService with a database session.
+
+        :param db_session: The SQLAlchemy session for database interactions.
+        :param write_queue: (Optional) The write queue that bulk writes are routed through.
+        :param batch_size: The number of rows sent per executemany call (default: 1000).
+        """
+        self.session = db_session
+        self.write_queue = write_queue
+        self.batch_size = batch_size
+
+    def bulk_insert(self, model: type, rows: Iterable[Row]) -> Dict[str, int]:
+        """
+        Inserts rows of a model in batches.
+
+        :param model: The mapped model class (e.g., MenuItem, Supplier).
+        :param rows: Dictionaries of column values; omitted columns get their defaults.
+        :return: A dictionary with the number of rows inserted and updated (always 0).
+        :raises ValueError: If the model is Order or OrderItem, or a row has an unknown column.
+        """
+        inserted = run_write(self.insert_work(model, rows), self.session, self.write_queue)
+        self.after_write(model)
+        logging.info(f"Bulk inserted {inserted} rows into {model.__table__.name}")
+        return {"inserted": inserted, "updated": 0}
+
+    def bulk_upsert(self, model: type, rows: Iterable[Row], conflict_columns: Optional[Sequence[str]] = None, update_columns: Optional[Sequence[str]] = None) -> Dict[str, int]:
+        """
+        Inserts rows of a model, updating the rows whose key already exists.
+
+        :param model: The mapped model class (e.g., Inventory, Supplier).
+        :param rows: Dictionaries of column values; every row must contain the conflict columns.
+        :param conflict_columns: (Optional) The unique columns that identify a row (default: the model's natural key, else its primary key).
+        :param update_columns: (Optional) The columns overwritten on conflict (default: every given column except the conflict columns).
+        :return: A dictionary with the number of rows inserted and updated.
+        :raises ValueError: If the model is Order or OrderItem, or a column is unknown.
+        """
+        inserted, updated = run_write(self.upsert_work(model, rows, conflict_columns, update_columns), self.session, self.write_queue)
+        self.after_write(model)
+        logging.info(f"Bulk upserted {inserted + updated} rows into {model.__table__.name}: {inserted} inserted, {updated} updated")
+        return {"inserted": inserted, "updated": updated}
+
+    def insert_work(self, model: type, rows: Iterable[Row]) -> Callable[[Session], int]:
+        """
+        Prepares a bulk insert as a unit of work, so it can share one transaction with other writes.
+        Call after_write(model) once the transaction has been committed.
+
+        :param model: The mapped model class.
+        :param rows: Dictionaries of column values; omitted columns get their defaults.
+        :return: The unit of work; it returns the number of rows inserted.
+        :raises ValueError: If the model is Order or OrderItem, or a row has an unknown column.
+        """
+        self._check_model(model)
+        table = model.__table__
+        rows = self._prepare_rows(table, rows)
+
+        def work(session: Session) -> int:
+            for batch in self._batches(rows):
+                session.execute(insert(table), batch)
+            self._refresh_stock_state(session, model)
+            return len(rows)
+        return work
+
+    def upsert_work(self, model: type, rows: Iterable[Row], conflict_columns: Optional[Sequence[str]] = None, update_columns: Optional[Sequence[str]] = None) -> Callable[[Session], Tuple[int, int]]:
+        """
+        Prepares a bulk upsert as a unit of work, so it can share one transaction with other writes.
+        Call after_write(model) once the transaction has been committed.
+
+        :param model: The mapped model class.
+        :param rows: Dictionaries of column values; every row must contain the conflict columns.
+        :param conflict_columns: (Optional) The unique columns that identify a row (default: the model's natural key, else its primary key).
+        :param update_columns: (Optional) The columns overwritten on conflict (default: every given column except the conflict columns).
+        :return: The unit of work; it returns the numbers of rows inserted and updated.
+        :raises ValueError: If the model is Order or OrderItem, or a column is unknown.
+        """
+        self._check_model(model)
+        table = model.__table__
+        rows = self._prepare_rows(table, rows)
+        conflict_columns = tuple(conflict_columns or DEFAULT_CONFLICT_COLUMNS.get(model) or (c.name for c in table.primary_key))
+        self._check_columns(table, conflict_columns)
+
+        if update_columns is None:
+            given = {key for row in rows for key in row}
+            update_columns = [c.name for c in table.columns if c.name in given and c.name not in conflict_columns]
+        else:
+            self._check_columns(table, update_columns)
+        # Core upserts skip Python-side onupdate hooks, so apply them explicitly (e.g. updated_at).
+        touched = [c for c in table.columns if c.onupdate is not None and c.name not in update_columns and c.name not in conflict_columns]
+        # ... and the ORM's optimistic version counter, so sessions holding the old row notice the change.
+        version_column = inspect(model).version_id_col
+
+        def work(session: Session) -> Tuple[int, int]:
+            existing = self._existing_keys(session, table, conflict_columns, rows)
+            inserted = 0
+            for row in rows:
+                key = tuple(row.get(name) for name in conflict_columns)
+                if None in key or key not in existing:
+                    inserted += 1
+                    if None not in key:
+                        existing.add(key)
+
+            for batch in self._batches(rows):
+                stmt = sqlite_insert(table)
+                set_ = {name: stmt.excluded[name] for name in update_columns}
+                set_.update({column.name: column.onupdate.arg(None) for column in touched})
+                if set_ and version_column is not None and version_column.name not in update_columns:
+                    set_[version_column.name] = version_column + 1
+                if set_:
+                    stmt = stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=set_)
+                else:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+                session.execute(stmt, batch)
+            self._refresh_stock_state(session, model)
+            return inserted, len(rows) - inserted
+        return work
+
+    def after_write(self, model: type) -> None:
+        """
+        Brings the in-memory menu up to date after rows of a model were bulk loaded, as the
+        MenuController write paths do after each edit: the catalog is reloaded on its next read
+        and the published menu is republished.
+
+        :param model: The mapped model class that was written.
+        """
+        if model in (MenuItem, Category):
+            get_menu_catalog(self.session).invalidate()
+            get_menu_publisher(self.session).refresh(self.session)
+            end_read(self.session)
+
+    @staticmethod
+    def _refresh_stock_state(session: Session, model: type) -> None:
+        # Loaded menu items may carry any out_of_stock value; their recipes decide it, within the same transaction.
+        if model is MenuItem:
+            refresh_stock_state(session)
+
+    def _prepare_rows(self, table: Table, rows: Iterable[Row]) -> List[Row]:
+        """
+        Validates the rows and gives them a common set of keys, as executemany requires.
+        Columns missing from some rows are filled with their scalar or callable default.
+        """
+        rows = [dict(row) for row in rows]
+        keys: Set[str] = {key for row in rows for key in row}
+        self._check_columns(table, keys)
+        for name in keys:
+            column = table.columns[name]
+            missing = [row for row in rows if name not in row]
+            if not missing:
+                continue
+            default = column.default
+            for row in missing:
+                if default is None:
+                    row[name] = None
+                elif default.is_callable:
+                    row[name] = default.arg(None)
+                else:
+                    row[name] = default.arg
+        return rows
+
+    def _existing_keys(self, session: Session, table: Table, conflict_columns: Tuple[str, ...], rows: List[Row]) -> Set[Tuple[Any, ...]]:
+        """
+        Returns the conflict keys among the rows that already exist in the table.
+        """
+        keys = list({tuple(row.get(name) for name in conflict_columns) for row in rows})
+        keys = [key for key in keys if None not in key]
+        columns = [table.columns[name] for name in conflict_columns]
+        existing: Set[Tuple[Any, ...]] = set()
+        for start in range(0, len(keys), _KEY_LOOKUP_CHUNK):
+            chunk = keys[start:start + _KEY_LOOKUP_CHUNK]
+            if len(columns) == 1:
+                condition = columns[0].in_([key[0] for key in chunk])
+            else:
+                condition = tuple_(*columns).in_(chunk)
+            existing.update(tuple(row) for row in session.execute(select(*columns).where(condition)))
+        return existing
+
+    def _batches(self, rows: List[Row]) -> Iterable[List[Row]]:
+        for start in range(0, len(rows), self.batch_size):
+            yield rows[start:start + self.batch_size]
+
+    @staticmethod
+    def _check_model(model: type) -> None:
+        if model in _ORDER_MODELS:
+            raise ValueError(
+                f"{model.__table__.name} cannot be bulk loaded: use OrderController.create_orders, "
+                "which also maintains the sales rollup and the order event log"
+            )
+
+    @staticmethod
+    def _check_columns(table: Table, names: Iterable[str]) -> None:
+        unknown = sorted(set(names) - set(table.columns.keys()))
+        if unknown:
+            raise ValueError(f"Unknown columns for {table.name}: {unknown}")
@@ -0,0 +1,386 @@
+"""
+connection.py
+
+This module manages the database connection for the Restaurant Management System (RMS).
+It builds a pooled SQLAlchemy engine tuned for SQLite and hands out thread-scoped sessions
+to the controllers (MenuController, OrderController, BillingController, ...).
+
+📌 Features:
+- Create SQLite engines in WAL mode so report readers never block order writers.
+- Tune connection pragmas (synchronous, mmap_size, cache_size, temp_store, busy_timeout).
+- Pool connections so that concurrent screens reuse already-tuned connections.
+- Provide one session per thread through a scoped session registry.
+- Offer a transactional `session_scope()` context manager for scripts.
+- Start transactions explicitly (BEGIN DEFERRED, or BEGIN IMMEDIATE through the
+  `sqlite_begin` execution option) so SAVEPOINTs behave as documented.
+- Create an asyncio engine (aiosqlite) with the same tuning for the async controllers.
+- Keep a separate read-only pool (mode=ro, query_only) for the reports package, so long
+  aggregate scans never share a connection or transaction with order taking; `readonly_scope()`
+  reads one report from one snapshot and ends it afterwards.
+- Record slow statements to the slow-query log when SLOW_QUERY_MS is set.
+
+🛠️ Dependencies:
+- SQLAlchemy -> Engine, connection pooling and session management (sync and asyncio).
+- aiosqlite -> Asyncio driver used by the async engine.
+- python-dotenv -> Loads the database path from the .env file.
+- os -> For reading environment configuration.
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+
+from database.query_log import install_slow_query_log
+
+load_dotenv()
+
+DATABASE_PATH = os.getenv("DB_PATH", "restaurant.db")
+
+# When set, statements slower than this many milliseconds go to the slow-query log.
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS")) if os.getenv("SLOW_QUERY_MS") else None
+
+# Applied to every new DBAPI connection. WAL lets readers work on a snapshot while a
+# writer appends to the log, and synchronous=NORMAL is durable in WAL mode while
+# skipping the fsync on every commit.
+SQLITE_PRAGMAS: Dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "busy_timeout": 5000,        # milliseconds to wait on a locked database
+    "cache_size": -64000,        # negative value is KiB -> 64 MiB page cache
+    "mmap_size": 268435456,      # 256 MiB memory-mapped I/O
+    "temp_store": "MEMORY",
+}
+
+# Applied to read-only connections. Journal mode and synchronous are properties of the
+# writer; query_only makes any accidental write fail instead of taking the write lock.
+SQLITE_READONLY_PRAGMAS: Dict[str, str | int] = {
+    "query_only": "ON",
+    "busy_timeout": SQLITE_PRAGMAS["busy_timeout"],
+    "cache_size": SQLITE_PRAGMAS["cache_size"],
+    "mmap_size": SQLITE_PRAGMAS["mmap_size"],
+    "temp_store": SQLITE_PRAGMAS["temp_store"],
+}
+
+_engine: Optional[Engine] = None
+_readonly_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+
+SessionLocal = scoped_session(sessionmaker(autoflush=False, expire_on_commit=False))
+ReadOnlySessionLocal = scoped_session(sessionmaker(autoflush=False, expire_on_commit=False))
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: Optional[Dict[str, str | int]] = None) -> None:
+    """
+    Applies the RMS pragmas to a raw SQLite connection.
+
+    :param dbapi_connection: The sqlite3 connection to tune.
+    :param pragmas: (Optional) The pragmas to apply (default: SQLITE_PRAGMAS).
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in (pragmas or SQLITE_PRAGMAS).items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def create_db_engine(database_path: Optional[str] = None, pool_size: int = 5, max_overflow: int = 10, echo: bool = False) -> Engine:
+    """
+    Creates a pooled SQLite engine with the RMS pragmas applied to every connection.
+
+    :param database_path: (Optional) Path to the SQLite file (default: DB_PATH from .env). Use ":memory:" for tests.
+    :param pool_size: The number of connections kept open in the pool (default: 5).
+    :param max_overflow: The number of extra connections allowed during bursts (default: 10).
+    :param echo: Whether to log every SQL statement (default: False).
+    :return: The configured SQLAlchemy engine.
+    """
+    database_path = database_path or DATABASE_PATH
+    connect_args = _connect_args()
+
+    if database_path == ":memory:":
+        # An in-memory database only exists on its own connection, so every session must share it.
+        engine = create_engine("sqlite://", poolclass=StaticPool, connect_args=connect_args, echo=echo)
+    else:
+        engine = create_engine(
+            f"sqlite:///{database_path}",
+            poolclass=QueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            connect_args=connect_args,
+            echo=echo,
+        )
+
+    _install_sqlite_listeners(engine)
+    return engine
+
+
+def create_readonly_engine(database_path: Optional[str] = None, pool_size: int = 3, max_overflow: int = 5, echo: bool = False) -> Engine:
+    """
+    Creates a pooled read-only SQLite engine for reports. Connections are opened with
+    `mode=ro` and `query_only`, and every session transaction reads from one WAL snapshot.
+
+    The database must already exist and be in WAL mode, i.e. opened once by the read-write engine.
+
+    :param database_path: (Optional) Path to the SQLite file (default: DB_PATH from .env).
+    :param pool_size: The number of connections kept open in the pool (default: 3).
+    :param max_overflow: The number of extra connections allowed during bursts (default: 5).
+    :param echo: Whether to log every SQL statement (default: False).
+    :return: The configured read-only SQLAlchemy engine.
+    """
+    database_path = os.path.abspath(database_path or DATABASE_PATH)
+    engine = create_engine(
+        f"sqlite:///file:{database_path}?mode=ro&uri=true",
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        connect_args=_connect_args(),
+        echo=echo,
+    )
+    _install_sqlite_listeners(engine, SQLITE_READONLY_PRAGMAS)
+    return engine
+
+
+def create_async_db_engine(database_path: Optional[str] = None, pool_size: int = 5, max_overflow: int = 10, echo: bool = False) -> AsyncEngine:
+    """
+    Creates a pooled asyncio SQLite engine (aiosqlite) with the RMS pragmas applied to every connection.
+
+    :param database_path: (Optional) Path to the SQLite file (default: DB_PATH from .env). Use ":memory:" for tests.
+    :param pool_size: The number of connections kept open in the pool (default: 5).
+    :param max_overflow: The number of extra connections allowed during bursts (default: 10).
+    :param echo: Whether to log every SQL statement (default: False).
+    :return: The configured SQLAlchemy asyncio engine.
+    """
+    database_path = database_path or DATABASE_PATH
+    connect_args = _connect_args()
+
+    if database_path == ":memory:":
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool, connect_args=connect_args, echo=echo)
+    else:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{database_path}",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            connect_args=connect_args,
+            echo=echo,
+        )
+
+    _install_sqlite_listeners(engine.sync_engine)
+    return engine
+
+
+def _connect_args() -> Dict[str, bool | float]:
+    return {"check_same_thread": False, "timeout": SQLITE_PRAGMAS["busy_timeout"] / 1000}
+
+
+def _install_sqlite_listeners(engine: Engine, pragmas: Optional[Dict[str, str | int]] = None) -> None:
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        # Let SQLAlchemy, not the sqlite3 module, decide when a transaction starts so that
+        # SAVEPOINTs work and writers can take the write lock up front with BEGIN IMMEDIATE.
+        dbapi_connection.isolation_level = None
+        apply_sqlite_pragmas(dbapi_connection, pragmas)
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(connection):
+        connection.exec_driver_sql(f"BEGIN {connection.get_execution_options().get('sqlite_begin', 'DEFERRED')}")
+
+    if SLOW_QUERY_MS is not None:
+        install_slow_query_log(engine, SLOW_QUERY_MS)
+
+
+def init_engine(database_path: Optional[str] = None, **engine_options) -> Engine:
+    """
+    Creates the application engine and binds the scoped session registry to it.
+    Any previously configured engine is disposed.
+
+    :param database_path: (Optional) Path to the SQLite file (default: DB_PATH from .env).
+    :param engine_options: Extra keyword arguments passed to `create_db_engine`.
+    :return: The new application engine.
+    """
+    global _engine, _readonly_engine
+
+    SessionLocal.remove()
+    ReadOnlySessionLocal.remove()
+    if _engine is not None:
+        _engine.dispose()
+    if _readonly_engine is not None and _readonly_engine is not _engine:
+        _readonly_engine.dispose()
+    _readonly_engine = None
+
+    _engine = create_db_engine(database_path, **engine_options)
+    SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+def get_engine() -> Engine:
+    """
+    Returns the application engine, creating it from the .env configuration on first use.
+
+    :return: The application engine.
+    """
+    if _engine is None:
+        return init_engine()
+    return _engine
+
+
+def get_session() -> Session:
+    """
+    Returns the session bound to the calling thread. Repeated calls from the same thread
+    return the same session until `close_session()` is called.
+
+    :return: The thread-local SQLAlchemy session.
+    """
+    get_engine()
+    return SessionLocal()
+
+
+def close_session() -> None:
+    """
+    Closes the calling thread's session and returns its connection to the pool.
+    """
+    SessionLocal.remove()
+
+
+def get_readonly_engine() -> Engine:
+    """
+    Returns the read-only engine used by the reports package, creating it on first use
+    for the same database file as the application engine. For an in-memory database the
+    application engine itself is returned, since its data is not visible to other connections.
+
+    :return: The read-only engine.
+    """
+    global _readonly_engine
+
+    if _readonly_engine is None:
+        engine = get_engine()
+        if engine.url.database in (None, "", ":memory:"):
+            _readonly_engine = engine
+        else:
+            # The read-write engine must have opened the file first so that it exists in WAL mode.
+            with engine.connect():
+                pass
+            _readonly_engine = create_readonly_engine(engine.url.database)
+        ReadOnlySessionLocal.configure(bind=_readonly_engine)
+    return _readonly_engine
+
+
+def get_readonly_session() -> Session:
+    """
+    Returns the read-only session bound to the calling thread. Its transaction reads from a
+    single snapshot until it is ended with `rollback()`, `commit()` or `close_readonly_session()`.
+
+    :return: The thread-local read-only SQLAlchemy session.
+    """
+    get_readonly_engine()
+    return ReadOnlySessionLocal()
+
+
+def close_readonly_session() -> None:
+    """
+    Closes the calling thread's read-only session and returns its connection to the pool.
+    """
+    ReadOnlySessionLocal.remove()
+
+
+@contextmanager
+def readonly_scope(session: Optional[Session] = None) -> Iterator[Session]:
+    """
+    Provides one read snapshot for one report. Without a session, the calling thread's read-only
+    session is used and released afterwards, so the next report sees newly committed data and
+    no open read keeps the WAL from being checkpointed.
+
+    :param session: (Optional) A session owned by the caller, used as is and left open.
+    :return: The session to read with.
+    """
+    if session is not None:
+        yield session
+        return
+    try:
+        yield get_readonly_session()
+    finally:
+        close_readonly_session()
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Provides a transactional scope around a series of operations.
+    Commits on success, rolls back on error and always releases the thread's session.
+
+    :return: The thread-local SQLAlchemy session.
+    """
+    session = get_session()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        close_session()
+
+
+async def init_async_engine(database_path: Optional[str] = None, **engine_options) -> AsyncEngine:
+    """
+    Creates the application's asyncio engine and binds the async session factory to it.
+    Any previously configured asyncio engine is disposed.
+
+    :param database_path: (Optional) Path to the SQLite file (default: DB_PATH from .env).
+    :param engine_options: Extra keyword arguments passed to `create_async_db_engine`.
+    :return: The new asyncio engine.
+    """
+    global _async_engine
+
+    if _async_engine is not None:
+        await _async_engine.dispose()
+
+    _async_engine = create_async_db_engine(database_path, **engine_options)
+    AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Returns the application's asyncio engine, creating it from the .env configuration on first use.
+
+    :return: The asyncio engine.
+    """
+    global _async_engine
+
+    if _async_engine is None:
+        _async_engine = create_async_db_engine()
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+async def close_async_engine() -> None:
+    """
+    Disposes the application's asyncio engine and closes its pooled connections.
+    Call this before the event loop shuts down, as open aiosqlite connections keep their worker threads alive.
+    """
+    global _async_engine
+
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
+
+def get_async_session() -> AsyncSession:
+    """
+    Returns a new asyncio session. Unlike `get_session()`, async sessions are not shared:
+    each request or task should open its own, e.g. `async with get_async_session() as session:`.
+
+    :return: A new SQLAlchemy AsyncSession.
+    """
+    get_async_engine()
+    return AsyncSessionLocal()
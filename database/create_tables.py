@@ -0,0 +1,93 @@
+"""
+create_tables.py
+
+This module builds the database schema of the Restaurant Management System (RMS).
+It creates every table registered on `Base.metadata` together with the index plan
+that the hot controller queries rely on.
+
+📌 Features:
+- Create all tables declared in the models package.
+- Create the composite indexes used by order, reservation, billing, attendance, staff and inventory queries.
+- Add missing indexes to an existing database without touching its data.
+- Create the FTS5 name search indexes of menu and inventory items (see database/search.py).
+- Can be run as a script: `python -m database.create_tables`.
+
+🛠️ Dependencies:
+- SQLAlchemy -> For creating tables and indexes.
+- logging -> For logging schema creation.
+"""
+
+import logging
+from typing import List, Optional
+
+from sqlalchemy import Index, func
+from sqlalchemy.engine import Engine
+
+from database.base import Base
+from database.connection import get_engine
+from database.search import SEARCH_INDEXES, create_search_indexes
+from models import Attendance, Billing, Inventory, MenuItem, Order, OrderEvent, OrderItem, RecipeIngredient, Reservation, Staff, Table
+
+# Every index here backs at least one controller query; tests/unit/database/test_query_plans.py
+# fails if one of those queries falls back to a full table scan.
+INDEXES: List[Index] = [
+    # SalesReportController.get_total_sales / get_sales_trends: date range, then status filter.
+    Index("ix_orders_created_status", Order.created_at, Order.status),
+    # OrderController.get_orders_by_status: the open orders of one state, oldest first.
+    Index("ix_orders_status_created", Order.status, Order.created_at),
+    # OrderController.get_customer_orders: one customer's orders, newest first.
+    Index("ix_orders_customer_created", Order.customer_id, Order.created_at),
+    # Foreign-key checks when a category is deleted (menu reads are served by the menu catalog).
+    Index("ix_menu_items_category", MenuItem.category_id),
+    # OrderController.get_order_details: line items of one order.
+    Index("ix_order_items_order", OrderItem.order_id),
+    # OrderController.get_order_history and the prep-time join: one order's events.
+    Index("ix_order_events_order_event", OrderEvent.order_id, OrderEvent.event),
+    # OrderController.get_prep_time_stats: one kind of event in a time window.
+    Index("ix_order_events_event_created", OrderEvent.event, OrderEvent.created_at),
+    # ReservationController.check_availability: booked tables in a time window.
+    Index("ix_reservations_date_table", Reservation.reservation_date, Reservation.table_id),
+    # ReservationController.get_customer_reservations.
+    Index("ix_reservations_customer_date", Reservation.customer_id, Reservation.reservation_date),
+    # ReservationController.check_availability: tables large enough for the party.
+    Index("ix_tables_capacity", Table.capacity),
+    # ReservationController.get_reservation_details: bills of one reservation.
+    Index("ix_billing_reservation", Billing.reservation_id),
+    # BillingController.get_billing_history.
+    Index("ix_billing_customer_created", Billing.customer_id, Billing.created_at),
+    # BillingController.load_invoices_for_date: one day's bills.
+    Index("ix_billing_created", Billing.created_at),
+    # AttendanceController: one employee's record for one day.
+    Index("ix_attendance_employee_date", Attendance.employee_id, Attendance.date),
+    # StaffController.get_staff_by_role: one role's staff, ordered by name.
+    Index("ix_staff_role_name", Staff.role, Staff.name),
+    # InventoryController.check_low_stock.
+    Index("ix_inventory_quantity", Inventory.quantity),
+    # database/recipes.py: the dishes that use an ingredient whose stock changed.
+    Index("ix_recipe_ingredients_inventory", RecipeIngredient.inventory_item_id, RecipeIngredient.menu_item_id),
+    # database/search.py: name prefix lookups of search-as-you-type.
+    Index("ix_menu_items_name_lower", func.lower(MenuItem.name)),
+    Index("ix_inventory_name_lower", func.lower(Inventory.name)),
+]
+
+
+def create_tables(engine: Optional[Engine] = None) -> None:
+    """
+    Creates all tables and indexes. Existing tables are kept; missing indexes are added.
+
+    :param engine: (Optional) The engine to create the schema on (default: the application engine).
+    """
+    engine = engine or get_engine()
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        # Looked up in sqlite_master: SQLAlchemy's index reflection skips expression indexes.
+        existing = {name for (name,) in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        for index in INDEXES:
+            if index.name not in existing:
+                index.create(conn)
+    create_search_indexes(engine)
+    logging.info(f"Schema created with {len(Base.metadata.tables)} tables, {len(INDEXES)} indexes and {len(SEARCH_INDEXES)} search indexes")
+
+
+if __name__ == "__main__":
+    create_tables()
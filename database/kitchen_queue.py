@@ -0,0 +1,330 @@
+"""
+kitchen_queue.py
+
+This module provides the in-process kitchen queue of the Restaurant Management System (RMS).
+Open orders are split into one ticket per course and kept in a priority heap ordered by the
+time promised to the customer, then by course. Kitchen and expo screens subscribe through
+asyncio and are pushed the changes, instead of each polling the orders table.
+
+📌 Features:
+- One ticket per order and course for Pending and In Progress orders, with item names and quantities.
+- Priority order: promised time, then course, then order ID (see `tickets()`).
+- Fed by OrderController after every committed order creation and status change; completed
+  and cancelled orders leave the queue.
+- asyncio subscriptions: a subscriber first receives a snapshot, then only deltas.
+- A subscriber that falls behind gets a fresh snapshot instead of an ever-growing backlog.
+- Loaded from the open orders on first use, then kept up to date; one queue per engine
+  through `get_kitchen_queue()`.
+
+🛠️ Dependencies:
+- heapq -> Priority heap with lazy deletion.
+- asyncio -> Delivers deltas on each subscriber's event loop, from any thread.
+- SQLAlchemy -> Loads the tickets of committed orders.
+- dotenv -> Loads KITCHEN_PROMISE_MINUTES from the .env file.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from database.connection import get_session
+from models import MenuItem, Order, OrderItem
+
+load_dotenv()
+
+# The statuses of orders the kitchen still has to work on.
+OPEN_STATUSES = ("Pending", "In Progress")
+# Orders placed without a promised time are due this many minutes after they were placed.
+PROMISE_MINUTES = int(os.getenv("KITCHEN_PROMISE_MINUTES") or 20)
+
+
+@dataclass(frozen=True, slots=True)
+class KitchenTicket:
+    """
+    One course of one open order.
+    """
+    order_id: int
+    course: int
+    status: str
+    promised_at: datetime
+    items: Tuple[Tuple[str, int], ...]  # (menu item name, quantity)
+
+
+@dataclass(frozen=True, slots=True)
+class KitchenDelta:
+    """
+    A change pushed to subscribers. Versions increase with every change to the queue.
+    """
+    version: int
+    kind: str  # "snapshot" (every ticket, in priority order), "upsert" or "remove"
+    tickets: Tuple[KitchenTicket, ...]
+
+
+def load_tickets(session: Session, order_ids: Optional[Iterable[int]] = None) -> List[KitchenTicket]:
+    """
+    Loads the tickets of open orders.
+
+    :param session: The SQLAlchemy session for database interactions.
+    :param order_ids: (Optional) The orders to load (default: every open order).
+    :return: The tickets of those orders that are still open.
+    """
+    criteria = [Order.status.in_(OPEN_STATUSES)]
+    if order_ids is not None:
+        criteria.append(Order.order_id.in_(list(order_ids)))
+    rows = session.execute(
+        select(Order.order_id, OrderItem.course, Order.status, Order.promised_at, Order.created_at, MenuItem.name, OrderItem.quantity)
+        .join(OrderItem, OrderItem.order_id == Order.order_id)
+        .join(MenuItem, MenuItem.item_id == OrderItem.item_id)
+        .where(*criteria)
+        .order_by(Order.order_id, OrderItem.course, OrderItem.order_item_id)
+    )
+    tickets = []
+    for (order_id, course), lines in itertools.groupby(rows, key=lambda row: (row[0], row[1])):
+        lines = list(lines)
+        _, _, status, promised_at, created_at, _, _ = lines[0]
+        promised_at = promised_at or created_at + timedelta(minutes=PROMISE_MINUTES)
+        tickets.append(KitchenTicket(order_id, course, status, promised_at, tuple((line[5], line[6]) for line in lines)))
+    return tickets
+
+
+class KitchenSubscription:
+    """
+    The deltas of one kitchen screen, consumed with `async for delta in subscription`.
+    """
+
+    def __init__(self, queue: "KitchenQueue", loop: asyncio.AbstractEventLoop, max_backlog: int):
+        self._queue = queue
+        self._loop = loop
+        self._max_backlog = max_backlog
+        self._deltas: asyncio.Queue = asyncio.Queue()
+        self._version = -1
+        self._resync = True  # the first delta is a snapshot
+        self._closed = False
+
+    def __aiter__(self) -> "KitchenSubscription":
+        return self
+
+    async def __anext__(self) -> KitchenDelta:
+        while True:
+            if self._closed:
+                raise StopAsyncIteration
+            if self._resync:
+                self._resync = False
+                delta = self._queue.snapshot()
+            else:
+                delta = await self._deltas.get()
+                if delta is None:
+                    raise StopAsyncIteration
+            # Deltas already contained in the last snapshot are skipped.
+            if delta.version > self._version:
+                self._version = delta.version
+                return delta
+
+    def close(self) -> None:
+        """
+        Ends the subscription; a pending `async for` finishes.
+        """
+        self._closed = True
+        self._queue._unsubscribe(self)
+        try:
+            self._loop.call_soon_threadsafe(self._deltas.put_nowait, None)
+        except RuntimeError:  # the event loop is already closed
+            pass
+
+    def _deliver(self, delta: KitchenDelta) -> None:
+        # Runs on the subscriber's event loop.
+        if self._resync or self._closed:
+            return
+        if self._deltas.qsize() >= self._max_backlog:
+            # Too far behind: drop the backlog and send a snapshot on the next read.
+            while not self._deltas.empty():
+                self._deltas.get_nowait()
+            self._resync = True
+            return
+        self._deltas.put_nowait(delta)
+
+
+class KitchenQueue:
+    """
+    Keeps the tickets of one database's open orders in priority order.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty KitchenQueue; the open orders are loaded on first use.
+        """
+        self._orders: Dict[int, Tuple[KitchenTicket, ...]] = {}
+        # Entries are (promised_at, course, order_id, sequence, ticket); an entry is stale once
+        # its ticket is no longer the current ticket of that order and course.
+        self._heap: List[tuple] = []
+        self._sequence = itertools.count()
+        self._version = 0
+        self._loaded = False
+        self._subscribers: Set[KitchenSubscription] = set()
+        self._lock = threading.Lock()
+        # Held from reading orders until their tickets are applied, so a read that lost a race
+        # never overwrites a newer one. Readers of the queue only wait for `_lock`.
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Whether the open orders have been loaded; until then, order changes are not tracked.
+        """
+        return self._loaded
+
+    def load(self, session: Optional[Session] = None) -> None:
+        """
+        (Re)loads every open order and sends subscribers a snapshot.
+
+        :param session: (Optional) The session used to read the orders (default: the thread's application session).
+        """
+        with self._refresh_lock:
+            tickets = load_tickets(session or get_session())
+            with self._lock:
+                self._orders, self._heap = {}, []
+                self._store(tickets, tickets)
+                self._loaded = True
+                self._version += 1
+                self._publish(self._snapshot())
+
+    def refresh(self, session: Session, order_ids: Iterable[int]) -> None:
+        """
+        Applies the committed state of some orders. Does nothing until the queue is loaded.
+
+        :param session: The session used to read the orders.
+        :param order_ids: The IDs of the created or changed orders.
+        """
+        order_ids = set(order_ids)
+        if not self._loaded or not order_ids:
+            return
+        with self._refresh_lock:
+            tickets = load_tickets(session, order_ids)
+            self._apply(order_ids, tickets)
+
+    def _apply(self, order_ids: Set[int], tickets: List[KitchenTicket]) -> None:
+        with self._lock:
+            previous = {(ticket.order_id, ticket.course): ticket for order_id in order_ids for ticket in self._orders.pop(order_id, ())}
+            # Unchanged tickets keep their heap entry; only new or changed ones are pushed.
+            kept, upserted = [], []
+            for ticket in tickets:
+                old = previous.get((ticket.order_id, ticket.course))
+                if old == ticket:
+                    kept.append(old)
+                else:
+                    kept.append(ticket)
+                    upserted.append(ticket)
+            self._store(kept, upserted)
+            current = {(ticket.order_id, ticket.course) for ticket in tickets}
+            removed = tuple(ticket for key, ticket in previous.items() if key not in current)
+            upserted = tuple(upserted)
+            for kind, changed in (("remove", removed), ("upsert", upserted)):
+                if changed:
+                    self._version += 1
+                    self._publish(KitchenDelta(self._version, kind, changed))
+            if len(self._heap) > 2 * sum(map(len, self._orders.values())) + 64:
+                self._heap = [entry for entry in self._heap if self._current(entry)]
+                heapq.heapify(self._heap)
+
+    def tickets(self, limit: Optional[int] = None, session: Optional[Session] = None) -> List[KitchenTicket]:
+        """
+        Returns the open tickets in priority order, loading the open orders first if needed.
+
+        :param limit: (Optional) The number of tickets from the top of the queue (default: all).
+        :param session: (Optional) The session used to load the orders if needed.
+        :return: The tickets, most urgent first.
+        """
+        if not self._loaded:
+            self.load(session)
+        with self._lock:
+            while self._heap and not self._current(self._heap[0]):
+                heapq.heappop(self._heap)
+            live = (entry for entry in self._heap if self._current(entry))
+            entries = sorted(live) if limit is None else heapq.nsmallest(limit, live)
+            return [entry[-1] for entry in entries]
+
+    def snapshot(self) -> KitchenDelta:
+        """
+        Returns every open ticket as a snapshot delta at the current version.
+        """
+        with self._lock:
+            return self._snapshot()
+
+    def subscribe(self, max_backlog: int = 1000, session: Optional[Session] = None) -> KitchenSubscription:
+        """
+        Subscribes the running event loop to the queue. The first delta is a snapshot of the
+        queue; every later delta is a change. Must be called from a coroutine.
+
+        :param max_backlog: The number of unread deltas after which the backlog is replaced by a snapshot (default: 1000).
+        :param session: (Optional) The session used to load the orders if needed.
+        :return: The subscription; close it when the screen disconnects.
+        """
+        loop = asyncio.get_running_loop()
+        if not self._loaded:
+            self.load(session)
+        subscription = KitchenSubscription(self, loop, max_backlog)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def _store(self, tickets: List[KitchenTicket], pushed: Iterable[KitchenTicket]) -> None:
+        by_order: Dict[int, List[KitchenTicket]] = {}
+        for ticket in tickets:
+            by_order.setdefault(ticket.order_id, []).append(ticket)
+        for order_id, order_tickets in by_order.items():
+            self._orders[order_id] = tuple(order_tickets)
+        for ticket in pushed:
+            heapq.heappush(self._heap, (ticket.promised_at, ticket.course, ticket.order_id, next(self._sequence), ticket))
+
+    def _current(self, entry: tuple) -> bool:
+        ticket = entry[-1]
+        return any(current is ticket for current in self._orders.get(ticket.order_id, ()))
+
+    def _snapshot(self) -> KitchenDelta:
+        tickets = sorted(
+            (ticket for tickets in self._orders.values() for ticket in tickets),
+            key=lambda ticket: (ticket.promised_at, ticket.course, ticket.order_id),
+        )
+        return KitchenDelta(self._version, "snapshot", tuple(tickets))
+
+    def _publish(self, delta: KitchenDelta) -> None:
+        # Called with the lock held, so every event loop receives the deltas in version order.
+        for subscription in list(self._subscribers):
+            try:
+                subscription._loop.call_soon_threadsafe(subscription._deliver, delta)
+            except RuntimeError:  # the subscriber's event loop is closed
+                self._subscribers.discard(subscription)
+
+    def _unsubscribe(self, subscription: KitchenSubscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+
+_queues: "weakref.WeakKeyDictionary[Engine, KitchenQueue]" = weakref.WeakKeyDictionary()
+_queues_lock = threading.Lock()
+
+
+def get_kitchen_queue(session: Optional[Session] = None) -> KitchenQueue:
+    """
+    Returns the kitchen queue of the database the session is bound to, creating it on first use.
+
+    :param session: (Optional) A session bound to the database (default: the thread's application session).
+    :return: The shared KitchenQueue of that database.
+    """
+    engine = (session or get_session()).get_bind()
+    with _queues_lock:
+        queue = _queues.get(engine)
+        if queue is None:
+            queue = _queues[engine] = KitchenQueue()
+        return queue
@@ -0,0 +1,188 @@
+"""
+menu_catalog.py
+
+This module provides the in-memory menu catalog of the Restaurant Management System (RMS).
+Order entry, order validation and the menu screens all read the menu many times per order;
+the catalog loads it once per process and serves those reads from memory.
+
+📌 Features:
+- Hold every menu item indexed by ID, by category and by availability.
+- Publish immutable, versioned snapshots, so a reader never sees a half-applied change.
+- Write-through: MenuController and InventoryController patch the catalog after each committed
+  change to a menu item, including items flipped in or out of stock by a sale or a restock.
+- Invalidate the catalog after bulk loads; the next read reloads it with one query.
+- One catalog per engine through `get_menu_catalog()`.
+
+Menu changes made by other processes are not seen until the catalog is invalidated
+(e.g. by restarting the terminal); all menu edits of one terminal go through its own catalog.
+
+🛠️ Dependencies:
+- SQLAlchemy -> Loads the menu in one query.
+- threading -> Serializes reloads, refreshes and patches; reads take no lock.
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from sqlalchemy import and_, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from database.connection import get_session
+from models import Category, MenuItem, MenuItemRecord
+
+
+@dataclass(frozen=True, slots=True)
+class MenuSnapshot:
+    """
+    An immutable view of the whole menu at one catalog version.
+    """
+    version: int
+    items: Tuple[MenuItemRecord, ...]  # ordered by name
+    by_id: Mapping[int, MenuItemRecord]
+    by_category: Mapping[str, Tuple[MenuItemRecord, ...]]
+    available: Tuple[MenuItemRecord, ...]
+
+    @classmethod
+    def build(cls, version: int, items: Iterable[MenuItemRecord]) -> "MenuSnapshot":
+        items = tuple(sorted(items, key=lambda item: item.name))
+        by_category: Dict[str, list] = {}
+        for item in items:
+            by_category.setdefault(item.category, []).append(item)
+        return cls(
+            version=version,
+            items=items,
+            by_id={item.item_id: item for item in items},
+            by_category={category: tuple(members) for category, members in by_category.items()},
+            available=tuple(item for item in items if item.available),
+        )
+
+
+def load_menu_items(session: Session, *criteria) -> list:
+    """
+    Loads menu items with their category names as read-only records. An item counts as
+    available if it is switched on and in stock.
+
+    :param session: The SQLAlchemy session for database interactions.
+    :param criteria: (Optional) Filters applied to the menu items.
+    :return: A list of MenuItemRecord, ordered by name.
+    """
+    rows = session.execute(
+        select(MenuItem.item_id, MenuItem.name, MenuItem.price_cents, Category.name, and_(MenuItem.available, ~MenuItem.out_of_stock))
+        .outerjoin(Category, MenuItem.category_id == Category.category_id)
+        .where(*criteria)
+        .order_by(MenuItem.name)
+    )
+    return [MenuItemRecord(*row) for row in rows]
+
+
+class MenuCatalog:
+    """
+    Caches the menu of one database as versioned snapshots.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty MenuCatalog; the menu is loaded on the first read.
+        """
+        self._snapshot: Optional[MenuSnapshot] = None
+        self._version = 0
+        self._lock = threading.Lock()
+        # Held from each read of the database until its result is applied, so an older read
+        # can never be applied over a newer one.
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """
+        The version of the catalog, incremented by every patch and invalidation.
+        """
+        return self._version
+
+    def snapshot(self, session: Optional[Session] = None) -> MenuSnapshot:
+        """
+        Returns the current snapshot, loading the menu first if the catalog is empty.
+
+        :param session: (Optional) The session used to load the menu if needed (default: the thread's application session).
+        :return: The current MenuSnapshot.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        with self._refresh_lock:
+            if self._snapshot is None:
+                items = load_menu_items(session or get_session())
+                with self._lock:
+                    self._snapshot = MenuSnapshot.build(self._version, items)
+            return self._snapshot
+
+    def patch(self, item: MenuItemRecord) -> None:
+        """
+        Adds or replaces one menu item after its change has been committed.
+
+        :param item: The item as it is now stored.
+        """
+        with self._refresh_lock:
+            self._apply({item.item_id: item})
+
+    def refresh(self, session: Session, item_ids: Iterable[int]) -> None:
+        """
+        Patches the catalog with the committed state of some menu items.
+
+        :param session: The session used to read the items.
+        :param item_ids: The IDs of the changed items; items no longer stored are removed.
+        """
+        item_ids = list(item_ids)
+        if not item_ids:
+            return
+        with self._refresh_lock:
+            items = {item.item_id: item for item in load_menu_items(session, MenuItem.item_id.in_(item_ids))}
+            self._apply({item_id: items.get(item_id) for item_id in item_ids})
+
+    def remove(self, item_id: int) -> None:
+        """
+        Removes one menu item after its deletion has been committed.
+
+        :param item_id: The ID of the deleted item.
+        """
+        with self._refresh_lock:
+            self._apply({item_id: None})
+
+    def invalidate(self) -> None:
+        """
+        Drops the cached menu; the next read reloads it from the database.
+        """
+        with self._refresh_lock, self._lock:
+            self._version += 1
+            self._snapshot = None
+
+    def _apply(self, changes: Dict[int, Optional[MenuItemRecord]]) -> None:
+        # Maps item IDs to their new record, or None for removed items.
+        with self._lock:
+            self._version += 1
+            if self._snapshot is None:
+                return  # nothing cached yet; the next read loads the change
+            items = [existing for existing in self._snapshot.items if existing.item_id not in changes]
+            items.extend(item for item in changes.values() if item is not None)
+            self._snapshot = MenuSnapshot.build(self._version, items)
+
+
+_catalogs: "weakref.WeakKeyDictionary[Engine, MenuCatalog]" = weakref.WeakKeyDictionary()
+_catalogs_lock = threading.Lock()
+
+
+def get_menu_catalog(session: Optional[Session] = None) -> MenuCatalog:
+    """
+    Returns the catalog of the database the session is bound to, creating it on first use.
+
+    :param session: (Optional) A session bound to the database (default: the thread's application session).
+    :return: The shared MenuCatalog of that database.
+    """
+    engine = (session or get_session()).get_bind()
+    with _catalogs_lock:
+        catalog = _catalogs.get(engine)
+        if catalog is None:
+            catalog = _catalogs[engine] = MenuCatalog()
+        return catalog
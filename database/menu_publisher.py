@@ -0,0 +1,176 @@
+"""
+menu_publisher.py
+
+This module publishes the menu of the Restaurant Management System (RMS) for the React frontend.
+Every menu change is serialized once into a gzip-compressed JSON document with a content hash,
+so serving the menu is a static read and clients revalidate their copy with `If-None-Match`.
+
+📌 Features:
+- Serialize the menu catalog (items, categories and availability) into compact JSON.
+- Precompress the document with gzip and tag it with a strong ETag (SHA-256 of the JSON).
+- Republish after every MenuController change; bulk loads republish on the next request.
+- Publish on the first request, so terminals that never serve the frontend never serialize the menu.
+- Answer conditional requests with 304 Not Modified when the client's ETag is current.
+- Write `menu.json.gz` and `menu.etag` to MENU_PUBLISH_DIR for a static file server.
+
+🛠️ Dependencies:
+- MenuCatalog -> The menu snapshot that is published.
+- gzip / hashlib / json -> Compression, content hash and serialization.
+- dotenv -> Loads MENU_PUBLISH_DIR from the .env file.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from database.connection import get_session
+from database.menu_catalog import MenuCatalog, MenuSnapshot, get_menu_catalog
+
+load_dotenv()
+
+# Directory the published files are written to; empty keeps the published menu in memory only.
+PUBLISH_DIR = os.getenv("MENU_PUBLISH_DIR") or None
+
+
+@dataclass(frozen=True, slots=True)
+class PublishedMenu:
+    """
+    One published version of the menu.
+    """
+    version: int
+    etag: str
+    body: bytes   # gzip-compressed JSON
+    size: int     # length of the uncompressed JSON
+
+    def headers(self) -> Dict[str, str]:
+        """
+        The response headers that go with the body.
+        """
+        return {
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+            "ETag": self.etag,
+            "Cache-Control": "no-cache",
+        }
+
+
+def serialize_menu(snapshot: MenuSnapshot) -> bytes:
+    """
+    Serializes a menu snapshot into compact JSON.
+
+    :param snapshot: The menu snapshot to serialize.
+    :return: The UTF-8 encoded JSON document.
+    """
+    # The catalog version is left out so that the ETag only changes when the content does.
+    document = {
+        "categories": sorted(category for category in snapshot.by_category if category is not None),
+        # Positional rows keep the document small; "fields" names the columns once.
+        "fields": ["item_id", "name", "price_cents", "category", "available"],
+        "items": [[item.item_id, item.name, item.price_cents, item.category, item.available] for item in snapshot.items],
+    }
+    return json.dumps(document, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class MenuPublisher:
+    """
+    Keeps a precompressed, content-addressed copy of one catalog's menu.
+    """
+
+    def __init__(self, catalog: MenuCatalog, output_dir: Optional[str] = PUBLISH_DIR):
+        """
+        Initializes the MenuPublisher.
+
+        :param catalog: The menu catalog to publish.
+        :param output_dir: (Optional) Directory to write `menu.json.gz` and `menu.etag` to (default: MENU_PUBLISH_DIR).
+        """
+        self.catalog = catalog
+        self.output_dir = output_dir
+        self._published: Optional[PublishedMenu] = None
+        self._lock = threading.Lock()
+
+    def publish(self, session: Optional[Session] = None) -> PublishedMenu:
+        """
+        Publishes the catalog's current snapshot, unless that version is already published.
+
+        :param session: (Optional) The session used to load the catalog if needed (default: the thread's application session).
+        :return: The published menu.
+        """
+        snapshot = self.catalog.snapshot(session)
+        with self._lock:
+            if self._published is not None and self._published.version == snapshot.version:
+                return self._published
+            document = serialize_menu(snapshot)
+            etag = '"' + hashlib.sha256(document).hexdigest()[:32] + '"'
+            if self._published is not None and self._published.etag == etag:
+                # Same content under a new catalog version (e.g. a reload): keep the compressed body.
+                published = PublishedMenu(snapshot.version, etag, self._published.body, self._published.size)
+            else:
+                # mtime=0 makes the compressed bytes depend on the content only.
+                published = PublishedMenu(snapshot.version, etag, gzip.compress(document, compresslevel=9, mtime=0), len(document))
+                if self.output_dir:
+                    self._write(published)
+                logging.info(f"Menu version {snapshot.version} published: {published.size} bytes, {len(published.body)} gzipped, ETag {etag}")
+            self._published = published
+            return published
+
+    def refresh(self, session: Optional[Session] = None) -> None:
+        """
+        Republishes after a menu change, if the menu has been published before; otherwise the
+        first request publishes it.
+
+        :param session: (Optional) The session used to load the catalog if needed.
+        """
+        if self._published is not None:
+            self.publish(session)
+
+    def respond(self, if_none_match: Optional[str] = None, session: Optional[Session] = None) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Builds the response to a menu request.
+
+        :param if_none_match: (Optional) The client's `If-None-Match` header.
+        :param session: (Optional) The session used to load the catalog if needed.
+        :return: A (status, headers, body) tuple: 200 with the compressed menu, or 304 with an empty body.
+        """
+        published = self.publish(session)
+        if if_none_match and (if_none_match.strip() == "*" or published.etag in (tag.strip() for tag in if_none_match.split(","))):
+            return 304, {"ETag": published.etag, "Cache-Control": "no-cache"}, b""
+        return 200, published.headers(), published.body
+
+    def _write(self, published: PublishedMenu) -> None:
+        os.makedirs(self.output_dir, exist_ok=True)
+        # Write the body before the ETag, each through a rename, so a reader never sees a torn file.
+        for filename, data in (("menu.json.gz", published.body), ("menu.etag", published.etag.encode("ascii"))):
+            path = os.path.join(self.output_dir, filename)
+            with open(path + ".tmp", "wb") as file:
+                file.write(data)
+            os.replace(path + ".tmp", path)
+
+
+_publishers: "weakref.WeakKeyDictionary[Engine, MenuPublisher]" = weakref.WeakKeyDictionary()
+_publishers_lock = threading.Lock()
+
+
+def get_menu_publisher(session: Optional[Session] = None) -> MenuPublisher:
+    """
+    Returns the publisher of the database the session is bound to, creating it on first use.
+
+    :param session: (Optional) A session bound to the database (default: the thread's application session).
+    :return: The shared MenuPublisher of that database.
+    """
+    session = session or get_session()
+    engine = session.get_bind()
+    with _publishers_lock:
+        publisher = _publishers.get(engine)
+        if publisher is None:
+            publisher = _publishers[engine] = MenuPublisher(get_menu_catalog(session))
+        return publisher
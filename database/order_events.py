@@ -0,0 +1,126 @@
+"""
+order_events.py
+
+This module keeps the order event log of the Restaurant Management System (RMS).
+Order state changes are appended to `order_events` instead of being overwritten, and
+`orders.status` is maintained as the indexed current-state projection of that log.
+
+📌 Features:
+- Enforce the order state machine: Pending -> In Progress -> Completed, and cancellation of
+  open orders. Completed and Cancelled orders are final.
+- Move an order's status and append its event in one conditional UPDATE plus one INSERT, so
+  two terminals racing on the same order cannot both apply a transition.
+- Append the `created` events of a batch of new orders with one executemany.
+- Compute kitchen preparation times (`in_progress` -> `completed`) from the log.
+
+🛠️ Dependencies:
+- SQLAlchemy -> Conditional updates and the event log queries.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import Session, aliased
+
+from models import Order, OrderEvent
+
+# The event appended when an order enters each status.
+STATUS_EVENTS: Dict[str, str] = {
+    "Pending": "created",
+    "In Progress": "in_progress",
+    "Completed": "completed",
+    "Cancelled": "cancelled",
+}
+
+# The statuses an order may move to from each status.
+TRANSITIONS: Dict[str, Tuple[str, ...]] = {
+    "Pending": ("In Progress", "Cancelled"),
+    "In Progress": ("Completed", "Cancelled"),
+    "Completed": (),
+    "Cancelled": (),
+}
+
+
+class OrderStateError(ValueError):
+    """
+    Raised when an order cannot move from its current status to the requested one.
+    """
+
+
+def record_created(session: Session, orders: Iterable[Tuple[int, datetime]]) -> None:
+    """
+    Appends the `created` events of new orders. Must run inside the transaction that creates them.
+
+    :param session: The session of the writing transaction.
+    :param orders: (order_id, created_at) pairs.
+    """
+    rows = [{"order_id": order_id, "event": STATUS_EVENTS["Pending"], "created_at": created_at} for order_id, created_at in orders]
+    if rows:
+        session.execute(insert(OrderEvent), rows)
+
+
+def transition(session: Session, order_id: int, status: str, at: Optional[datetime] = None) -> Optional[str]:
+    """
+    Moves an order to a new status and appends the matching event.
+    Must run inside the caller's write transaction.
+
+    :param session: The session of the writing transaction.
+    :param order_id: The ID of the order.
+    :param status: The new status (a key of STATUS_EVENTS).
+    :param at: (Optional) The time of the change (default: now).
+    :return: The previous status, or None if the order was not found.
+    :raises OrderStateError: If the status is unknown or not reachable from the current one.
+    """
+    if status not in STATUS_EVENTS:
+        raise OrderStateError(f"Unknown order status: {status}")
+    sources = [source for source, targets in TRANSITIONS.items() if status in targets]
+    at = at or datetime.now()
+    previous = session.scalar(select(Order.status).where(Order.order_id == order_id))
+    if previous is None:
+        return None
+    # The status condition makes the check and the write one step: a concurrent change in
+    # between leaves no row to update.
+    moved = session.execute(
+        update(Order)
+        .where(Order.order_id == order_id, Order.status == previous, Order.status.in_(sources))
+        .values(status=status, updated_at=at)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not moved:
+        raise OrderStateError(f"Order {order_id} cannot move from {previous} to {status}")
+    session.execute(insert(OrderEvent).values(order_id=order_id, event=STATUS_EVENTS[status], created_at=at))
+    return previous
+
+
+def order_history(session: Session, order_id: int) -> List[Tuple[str, datetime]]:
+    """
+    Reads the event log of one order.
+
+    :param session: The SQLAlchemy session for database interactions.
+    :param order_id: The ID of the order.
+    :return: (event, created_at) pairs, oldest first.
+    """
+    return [tuple(row) for row in session.execute(
+        select(OrderEvent.event, OrderEvent.created_at).where(OrderEvent.order_id == order_id).order_by(OrderEvent.event_id)
+    )]
+
+
+def prep_times(session: Session, start_date: datetime, end_date: datetime) -> List[Tuple[int, float]]:
+    """
+    Reads the preparation time of every order completed in a time window.
+
+    :param session: The SQLAlchemy session for database interactions.
+    :param start_date: The start of the window (inclusive).
+    :param end_date: The end of the window (exclusive).
+    :return: (order_id, seconds from in_progress to completed) pairs, in completion order.
+    """
+    started, completed = aliased(OrderEvent), aliased(OrderEvent)
+    seconds = (func.julianday(completed.created_at) - func.julianday(started.created_at)) * 86400
+    rows = session.execute(
+        select(completed.order_id, seconds)
+        .join(started, (started.order_id == completed.order_id) & (started.event == STATUS_EVENTS["In Progress"]))
+        .where(completed.event == STATUS_EVENTS["Completed"], completed.created_at >= start_date, completed.created_at < end_date)
+        .order_by(completed.created_at)
+    )
+    return [(order_id, round(duration, 3)) for order_id, duration in rows]
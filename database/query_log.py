@@ -0,0 +1,245 @@
+"""
+query_log.py
+
+This module provides the slow-query log of the Restaurant Management System (RMS).
+It hooks into the SQLAlchemy engine and records every SQL statement that runs longer than
+a configurable threshold, so a slow screen can be traced back to the controller call and
+the query plan that caused it.
+
+📌 Features:
+- Time every statement with `before_cursor_execute` / `after_cursor_execute` engine events.
+- Record slow statements with their duration, bind parameters and the controller method that issued them.
+- Capture the SQLite `EXPLAIN QUERY PLAN` of each slow statement.
+- Write records as JSON lines to a rotating file under logs/database/.
+- Summarize the top-N query shapes by total time: `python -m database.query_log --top 10`.
+
+🛠️ Dependencies:
+- SQLAlchemy -> Engine events.
+- logging (RotatingFileHandler) -> For the rotating JSON-lines file.
+- json -> For serializing records.
+- argparse -> For the summary command line.
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DEFAULT_LOG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs", "database", "slow_queries.jsonl")
+DEFAULT_THRESHOLD_MS = 100.0
+
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "REPLACE")
+_IN_LIST = re.compile(r"IN \((?:\?|__\[POSTCOMPILE_\w+\])(?:, \?)*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def query_shape(statement: str) -> str:
+    """
+    Normalizes a SQL statement so that executions differing only in IN-list length or layout group together.
+
+    :param statement: The SQL statement.
+    :return: The normalized statement.
+    """
+    return _IN_LIST.sub("IN (...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def find_caller() -> Optional[str]:
+    """
+    Returns the controller method on the current call stack, e.g.
+    "controllers.restaurant.order_controller.OrderController.get_customer_orders".
+    Falls back to the first frame outside SQLAlchemy and the database package.
+
+    :return: The dotted name of the calling function, or None if none was found.
+    """
+    frame = sys._getframe(1)
+    fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("controllers."):
+            return f"{module}.{frame.f_code.co_qualname}"
+        if fallback is None and not module.startswith(("sqlalchemy", "database.", "contextlib", "threading")):
+            fallback = f"{module}.{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return fallback
+
+
+class SlowQueryLog:
+    """
+    Records statements slower than a threshold, with caller, parameters and query plan, as JSON lines.
+    """
+
+    def __init__(self, log_path: str = DEFAULT_LOG_PATH, threshold_ms: float = DEFAULT_THRESHOLD_MS, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5, explain: bool = True):
+        """
+        Initializes the SlowQueryLog.
+
+        :param log_path: The JSON-lines file to write to (default: logs/database/slow_queries.jsonl).
+        :param threshold_ms: Statements taking at least this many milliseconds are recorded (default: 100).
+        :param max_bytes: The size at which the file is rotated (default: 10 MiB).
+        :param backup_count: The number of rotated files kept (default: 5).
+        :param explain: Whether to capture EXPLAIN QUERY PLAN for recorded statements (default: True).
+        """
+        self.log_path = log_path
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        handler = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._logger = logging.getLogger(f"rms.slow_queries.{log_path}")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._logger.handlers = [handler]
+
+    def install(self, engine: Engine) -> None:
+        """
+        Starts timing the statements of an engine.
+
+        :param engine: The engine to watch (use `AsyncEngine.sync_engine` for asyncio engines).
+        """
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def uninstall(self, engine: Engine) -> None:
+        """
+        Stops timing the statements of an engine.
+
+        :param engine: The engine passed to `install`.
+        """
+        event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def close(self) -> None:
+        """
+        Closes the log file.
+        """
+        for handler in self._logger.handlers:
+            handler.close()
+        self._logger.handlers = []
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # Kept on the execution context, which is discarded with it when a statement fails.
+        if context is not None:
+            context._rms_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_rms_start", None)
+        if start is None:
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms < self.threshold_ms:
+            return
+        if executemany:
+            parameters = parameters[0] if parameters else ()
+        record = {
+            "timestamp": datetime.now().isoformat(timespec="milliseconds"),
+            "duration_ms": round(elapsed_ms, 3),
+            "caller": find_caller(),
+            "statement": statement,
+            "shape": query_shape(statement),
+            "parameters": parameters,
+            "executemany": executemany,
+            "rowcount": cursor.rowcount,
+            "plan": self._query_plan(conn, statement, parameters) if self.explain else None,
+        }
+        self._logger.info(json.dumps(record, default=str))
+
+    @staticmethod
+    def _query_plan(conn, statement: str, parameters: Any) -> Optional[List[str]]:
+        if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            return None
+        # A raw cursor on the same connection sees the same transaction and does not re-enter the events.
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            return [row[3] for row in cursor.fetchall()]
+        except Exception as exc:
+            return [f"EXPLAIN failed: {exc}"]
+        finally:
+            cursor.close()
+
+
+_slow_query_log: Optional[SlowQueryLog] = None
+
+
+def install_slow_query_log(engine: Engine, threshold_ms: Optional[float] = None) -> SlowQueryLog:
+    """
+    Installs the process-wide slow-query log on an engine.
+
+    :param engine: The engine to watch.
+    :param threshold_ms: (Optional) The threshold in milliseconds (default: the current threshold, initially 100).
+    :return: The shared SlowQueryLog.
+    """
+    global _slow_query_log
+    if _slow_query_log is None:
+        _slow_query_log = SlowQueryLog()
+    if threshold_ms is not None:
+        _slow_query_log.threshold_ms = threshold_ms
+    _slow_query_log.install(engine)
+    return _slow_query_log
+
+
+def summarize(log_path: str = DEFAULT_LOG_PATH, top_n: int = 10) -> List[Dict[str, Any]]:
+    """
+    Groups the recorded statements by query shape, including rotated files, and ranks them by total time.
+
+    :param log_path: The JSON-lines file to read (default: logs/database/slow_queries.jsonl).
+    :param top_n: The number of query shapes to return (default: 10).
+    :return: A list of dictionaries with shape, count, total_ms, mean_ms, max_ms and callers.
+    """
+    groups: Dict[str, Dict[str, Any]] = defaultdict(lambda: {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "callers": set()})
+    paths = [log_path] + [f"{log_path}.{n}" for n in range(1, 100)]
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                group = groups[record["shape"]]
+                group["count"] += 1
+                group["total_ms"] += record["duration_ms"]
+                group["max_ms"] = max(group["max_ms"], record["duration_ms"])
+                if record.get("caller"):
+                    group["callers"].add(record["caller"])
+
+    ranked = sorted(groups.items(), key=lambda item: item[1]["total_ms"], reverse=True)[:top_n]
+    return [
+        {
+            "shape": shape,
+            "count": group["count"],
+            "total_ms": round(group["total_ms"], 3),
+            "mean_ms": round(group["total_ms"] / group["count"], 3),
+            "max_ms": round(group["max_ms"], 3),
+            "callers": sorted(group["callers"]),
+        }
+        for shape, group in ranked
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Summarize the RMS slow-query log by query shape.")
+    parser.add_argument("log_path", nargs="?", default=DEFAULT_LOG_PATH, help="JSON-lines slow-query log")
+    parser.add_argument("--top", type=int, default=10, help="number of query shapes to show")
+    args = parser.parse_args(argv)
+
+    for rank, entry in enumerate(summarize(args.log_path, args.top), start=1):
+        print(f"{rank:>2}. {entry['total_ms']:>10.1f} ms total  {entry['count']:>6} calls  "
+              f"{entry['mean_ms']:>8.1f} ms mean  {entry['max_ms']:>8.1f} ms max")
+        print(f"    {entry['shape']}")
+        for caller in entry["callers"]:
+            print(f"    <- {caller}")
+
+
+if __name__ == "__main__":
+    main()
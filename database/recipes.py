@@ -0,0 +1,99 @@
+"""
+recipes.py
+
+This module connects the menu of the Restaurant Management System (RMS) to its inventory
+through recipes (see models/recipe_model.py). A menu item is out of stock while any of its
+ingredients has less than one serving left.
+
+📌 Features:
+- Replace the recipe of a menu item.
+- Convert sold dishes into the inventory quantities they consume.
+- Recompute `out_of_stock` only for the dishes that use the ingredients whose stock changed,
+  found through the ingredient -> dish index, and flip only those whose state changed.
+- Recompute every dish with a recipe after bulk stock loads.
+
+🛠️ Dependencies:
+- SQLAlchemy -> Correlated EXISTS updates with RETURNING.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, exists, insert, select, update
+from sqlalchemy.orm import Session
+
+from models import Inventory, MenuItem, RecipeIngredient
+
+
+def set_recipe(session: Session, menu_item_id: int, ingredients: Dict[int, int]) -> List[int]:
+    """
+    Replaces the recipe of a menu item and recomputes whether it is in stock.
+    Must run inside the caller's write transaction.
+
+    :param session: The session of the writing transaction.
+    :param menu_item_id: The ID of the menu item.
+    :param ingredients: The units of each inventory item (by ID) used per serving; empty removes the recipe.
+    :return: The IDs of the menu items whose stock state flipped.
+    """
+    session.execute(delete(RecipeIngredient).where(RecipeIngredient.menu_item_id == menu_item_id))
+    if ingredients:
+        session.execute(insert(RecipeIngredient), [
+            {"menu_item_id": menu_item_id, "inventory_item_id": inventory_item_id, "quantity": quantity}
+            for inventory_item_id, quantity in ingredients.items()
+        ])
+    return refresh_stock_state(session, menu_item_ids=[menu_item_id])
+
+
+def consumed_ingredients(session: Session, dishes: Dict[int, int]) -> Dict[int, int]:
+    """
+    Converts sold dishes into the inventory quantities their recipes use.
+
+    :param session: The SQLAlchemy session for database interactions.
+    :param dishes: The servings sold per menu item ID.
+    :return: The units used per inventory item ID; dishes without a recipe use nothing.
+    """
+    used: Dict[int, int] = defaultdict(int)
+    rows = session.execute(
+        select(RecipeIngredient.menu_item_id, RecipeIngredient.inventory_item_id, RecipeIngredient.quantity)
+        .where(RecipeIngredient.menu_item_id.in_(dishes))
+    )
+    for menu_item_id, inventory_item_id, quantity in rows:
+        used[inventory_item_id] += quantity * dishes[menu_item_id]
+    return dict(used)
+
+
+def refresh_stock_state(session: Session, inventory_item_ids: Optional[Iterable[int]] = None, menu_item_ids: Optional[Iterable[int]] = None) -> List[int]:
+    """
+    Recomputes `out_of_stock` for the dishes affected by a stock or recipe change.
+    Must run inside the transaction that made the change.
+
+    :param session: The session of the writing transaction.
+    :param inventory_item_ids: (Optional) Ingredients whose stock changed; their dishes are recomputed.
+    :param menu_item_ids: (Optional) Dishes to recompute directly (default: none, or every dish with a recipe if no ingredients are given either).
+    :return: The IDs of the menu items whose stock state flipped.
+    """
+    short = exists().where(
+        RecipeIngredient.menu_item_id == MenuItem.item_id,
+        Inventory.item_id == RecipeIngredient.inventory_item_id,
+        Inventory.quantity < RecipeIngredient.quantity,
+    )
+    if inventory_item_ids is None and menu_item_ids is None:
+        affected = MenuItem.item_id.in_(select(RecipeIngredient.menu_item_id)) | MenuItem.out_of_stock
+    elif inventory_item_ids is not None:
+        affected = MenuItem.item_id.in_(
+            select(RecipeIngredient.menu_item_id).where(RecipeIngredient.inventory_item_id.in_(list(inventory_item_ids)))
+        )
+        if menu_item_ids is not None:
+            affected = affected | MenuItem.item_id.in_(list(menu_item_ids))
+    else:
+        affected = MenuItem.item_id.in_(list(menu_item_ids))
+
+    # Only rows whose state actually changes are written (and returned).
+    stmt = (
+        update(MenuItem)
+        .where(affected, MenuItem.out_of_stock != short)
+        .values(out_of_stock=short)
+        .returning(MenuItem.item_id)
+        .execution_options(synchronize_session=False)
+    )
+    return list(session.scalars(stmt))
@@ -0,0 +1,116 @@
+"""
+sales_rollup.py
+
+This module maintains the sales rollup of the Restaurant Management System (RMS): the quantity,
+revenue and order count of every menu item per day and hour (see models/sales_rollup_model.py).
+Sales dashboards read the rollup instead of scanning the orders table on every refresh.
+
+📌 Features:
+- Add or subtract one order's line items in the same transaction that creates or cancels it.
+- Accumulate with `INSERT ... SELECT ... ON CONFLICT DO UPDATE`, one statement per order.
+- Rebuild the rollup from the order history, including archived orders:
+  `python -m database.sales_rollup --rebuild`.
+
+🛠️ Dependencies:
+- SQLAlchemy -> Core insert-from-select with SQLite upserts.
+- WriteQueue -> Routes the rebuild through the single database writer thread.
+- logging -> For logging rebuilds.
+"""
+
+import argparse
+import logging
+from typing import Iterable, Optional, Sequence
+
+from sqlalchemy import Integer, Select, Table, cast, delete, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from database.archive import archived_order_items, archived_orders, attach_archive
+from database.connection import session_scope
+from database.write_queue import WriteQueue, run_write
+from models import Order, OrderItem, SalesRollup
+
+_KEY_COLUMNS = ("day", "hour", "item_id")
+_SUM_COLUMNS = ("quantity", "revenue_cents", "order_count")
+
+
+def _sales_select(orders: Table, order_items: Table, *criteria, sign: int = 1) -> Select:
+    # The rollup buckets by the hour the order was placed, as stored in orders.created_at.
+    day = func.date(orders.c.created_at)
+    hour = cast(func.strftime("%H", orders.c.created_at), Integer)
+    return (
+        select(
+            day,
+            hour,
+            order_items.c.item_id,
+            sign * func.sum(order_items.c.quantity),
+            sign * func.sum(order_items.c.quantity * order_items.c.unit_price_cents),
+            sign * func.count(func.distinct(orders.c.order_id)),
+        )
+        .join(order_items, order_items.c.order_id == orders.c.order_id)
+        .where(*criteria)
+        .group_by(day, hour, order_items.c.item_id)
+    )
+
+
+def _accumulate(session: Session, sales: Select) -> None:
+    rollup = SalesRollup.__table__
+    stmt = sqlite_insert(rollup).from_select(_KEY_COLUMNS + _SUM_COLUMNS, sales)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(_KEY_COLUMNS),
+        set_={name: rollup.c[name] + stmt.excluded[name] for name in _SUM_COLUMNS},
+    )
+    session.execute(stmt)
+
+
+def record_order_sales(session: Session, order_id: int | Iterable[int], sign: int = 1) -> None:
+    """
+    Adds an order's line items to the rollup, or subtracts them with sign=-1.
+    Must run inside the transaction that creates the order or changes its cancelled state.
+
+    :param session: The session of the writing transaction.
+    :param order_id: The ID of the order, or the IDs of a batch of orders, whose line items must already be flushed.
+    :param sign: 1 to add the order, -1 to remove it (default: 1).
+    """
+    orders, order_items = Order.__table__, OrderItem.__table__
+    selected = orders.c.order_id == order_id if isinstance(order_id, int) else orders.c.order_id.in_(list(order_id))
+    _accumulate(session, _sales_select(orders, order_items, selected, sign=sign))
+
+
+def rebuild_sales_rollup(session: Session, include_archive: bool = True, write_queue: Optional[WriteQueue] = None) -> int:
+    """
+    Rebuilds the rollup from all non-cancelled orders.
+
+    :param session: The SQLAlchemy session for database interactions.
+    :param include_archive: Whether to include orders moved to the archive database, if it exists (default: True).
+    :param write_queue: (Optional) The write queue that the rebuild is routed through.
+    :return: The number of rollup rows written.
+    """
+    def work(session: Session) -> int:
+        session.execute(delete(SalesRollup))
+        orders, order_items = Order.__table__, OrderItem.__table__
+        _accumulate(session, _sales_select(orders, order_items, orders.c.status != "Cancelled"))
+        if include_archive and attach_archive(session):
+            _accumulate(session, _sales_select(archived_orders, archived_order_items, archived_orders.c.status != "Cancelled"))
+        return session.scalar(select(func.count()).select_from(SalesRollup))
+
+    rows = run_write(work, session, write_queue)
+    logging.info(f"Sales rollup rebuilt with {rows} rows")
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Maintain the RMS sales rollup.")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild the rollup from the order history")
+    parser.add_argument("--skip-archive", action="store_true", help="ignore orders in the archive database")
+    args = parser.parse_args(argv)
+    if not args.rebuild:
+        parser.error("nothing to do; pass --rebuild")
+
+    with session_scope() as session:
+        rows = rebuild_sales_rollup(session, include_archive=not args.skip_archive)
+    print(f"Sales rollup rebuilt: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+search.py
+
+This module provides the full-text name search of the Restaurant Management System (RMS).
+Menu items and inventory items are indexed in SQLite FTS5 tables with the trigram tokenizer,
+so search-as-you-type matches any part of a name without scanning the base tables.
+
+📌 Features:
+- One external-content FTS5 index per searchable table (`menu_items_fts`, `inventory_fts`).
+- Triggers keep the indexes in sync with every insert, rename and delete, including bulk loads.
+- Substring and prefix matching for queries of three or more characters.
+- Typo-tolerant fallback: when nothing contains the query, match names sharing most of its trigrams.
+- Rank results with bm25; queries shorter than three characters, or matching too many rows
+  to rank per keystroke, list names starting with the query first.
+- Created (and filled from existing rows) by `create_tables`.
+
+🛠️ Dependencies:
+- SQLite >= 3.34 -> FTS5 with the trigram tokenizer.
+- SQLAlchemy -> DDL execution and ranked queries.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, func, literal_column, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from models import Inventory, MenuItem
+
+# The trigram tokenizer indexes every three-character window, so shorter queries cannot MATCH.
+MIN_MATCH_LENGTH = 3
+# Typo-tolerant matches are picked from this many bm25-ranked candidates per requested result.
+FUZZY_CANDIDATES_PER_RESULT = 5
+# Queries matching more rows than this are not ranked with bm25 (see search_ids).
+MAX_RANKED_MATCHES = 2000
+
+search_metadata = MetaData()
+
+
+@dataclass(frozen=True, slots=True)
+class SearchIndex:
+    """
+    An FTS5 index over the name column of one table.
+    """
+    name: str
+    source: Table
+    key: str
+    table: Table
+
+
+def _search_index(name: str, source: Table, key: str) -> SearchIndex:
+    # Only for building queries; the virtual table is created by create_search_indexes.
+    table = Table(name, search_metadata, Column("rowid", Integer, primary_key=True), Column("name", String))
+    return SearchIndex(name, source, key, table)
+
+
+MENU_ITEMS_INDEX = _search_index("menu_items_fts", MenuItem.__table__, "item_id")
+INVENTORY_INDEX = _search_index("inventory_fts", Inventory.__table__, "item_id")
+SEARCH_INDEXES = (MENU_ITEMS_INDEX, INVENTORY_INDEX)
+
+
+def _ddl(index: SearchIndex) -> List[str]:
+    source, key = index.source.name, index.key
+    insert = f"INSERT INTO {index.name}(rowid, name) VALUES (new.{key}, new.name)"
+    delete = f"INSERT INTO {index.name}({index.name}, rowid, name) VALUES ('delete', old.{key}, old.name)"
+    return [
+        f"CREATE VIRTUAL TABLE {index.name} USING fts5(name, content='{source}', content_rowid='{key}', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {index.name}_ai AFTER INSERT ON {source} BEGIN {insert}; END",
+        f"CREATE TRIGGER IF NOT EXISTS {index.name}_ad AFTER DELETE ON {source} BEGIN {delete}; END",
+        f"CREATE TRIGGER IF NOT EXISTS {index.name}_au AFTER UPDATE OF name ON {source} BEGIN {delete}; {insert}; END",
+        f"INSERT INTO {index.name}({index.name}) VALUES ('rebuild')",
+    ]
+
+
+def create_search_indexes(engine: Engine) -> None:
+    """
+    Creates the search indexes and their triggers. A newly created index is filled from the
+    rows already in its table; existing indexes are left untouched.
+
+    :param engine: The engine to create the indexes on.
+    """
+    with engine.begin() as conn:
+        for index in SEARCH_INDEXES:
+            if conn.exec_driver_sql("SELECT 1 FROM sqlite_master WHERE name = ?", (index.name,)).first():
+                continue
+            for statement in _ddl(index):
+                conn.exec_driver_sql(statement)
+
+
+def _phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def search_ids(session: Session, index: SearchIndex, query: str, limit: int = 20) -> List[int]:
+    """
+    Searches one index and returns the matching row IDs, best match first.
+
+    :param session: The SQLAlchemy session for database interactions.
+    :param index: The index to search (MENU_ITEMS_INDEX or INVENTORY_INDEX).
+    :param query: The text typed by the user.
+    :param limit: The maximum number of results (default: 20).
+    :return: The IDs of the matching rows, best match first.
+    """
+    query = " ".join(query.split())
+    if not query:
+        return []
+    if len(query) < MIN_MATCH_LENGTH:
+        return _prefix_ids(session, index, query, limit)
+
+    fts = index.table
+    match = literal_column(index.name).op("MATCH")
+    # Counting stops after MAX_RANKED_MATCHES + 1 rows; that is all the decision below needs.
+    matches = session.scalar(select(func.count()).select_from(
+        select(fts.c.rowid).where(match(_phrase(query))).limit(MAX_RANKED_MATCHES + 1).subquery()
+    ))
+    if matches > MAX_RANKED_MATCHES:
+        # Ranking thousands of rows costs more than a keystroke allows, and for such a broad query
+        # names starting with it are the likely pick; fill up with unranked matches.
+        ids = _prefix_ids(session, index, query, limit)
+        if len(ids) < limit:
+            ids += session.scalars(select(fts.c.rowid).where(match(_phrase(query)), fts.c.rowid.not_in(ids)).limit(limit - len(ids)))
+        return ids
+    if matches:
+        return list(session.scalars(select(fts.c.rowid).where(match(_phrase(query))).order_by(func.bm25(literal_column(index.name))).limit(limit)))
+
+    # Nothing contains the query: look up names sharing its trigrams and keep those sharing at
+    # least half of them, which tolerates a missing, extra or mistyped letter.
+    trigrams = _trigrams(query)
+    fuzzy = " OR ".join(_phrase(trigram) for trigram in trigrams)
+    candidates = session.execute(
+        select(fts.c.rowid, fts.c.name)
+        .where(match(fuzzy))
+        .order_by(func.bm25(literal_column(index.name)))
+        .limit(limit * FUZZY_CANDIDATES_PER_RESULT)
+    )
+    scored = [(len(trigrams & _trigrams(name)), row_id) for row_id, name in candidates]
+    scored = [(shared, row_id) for shared, row_id in scored if shared * 2 >= len(trigrams)]
+    # sorted() is stable, so equally close names keep their bm25 order.
+    return [row_id for _, row_id in sorted(scored, key=lambda pair: -pair[0])[:limit]]
+
+
+def _prefix_ids(session: Session, index: SearchIndex, prefix: str, limit: int) -> List[int]:
+    # A range over lower(name) is answered by the expression index created in create_tables.
+    name = func.lower(index.source.c.name)
+    low = prefix.lower()
+    high = low[:-1] + chr(ord(low[-1]) + 1)
+    return list(session.scalars(select(index.source.c[index.key]).where(name >= low, name < high).order_by(name).limit(limit)))
+
+
+def _trigrams(text: str) -> set:
+    text = text.lower()
+    return {text[i:i + MIN_MATCH_LENGTH] for i in range(len(text) - MIN_MATCH_LENGTH + 1)}
+
+
+def rank(ids: List[int], rows: Dict[int, object]) -> list:
+    """
+    Orders rows by their position in a ranked list of IDs, skipping IDs without a row.
+
+    :param ids: The ranked row IDs returned by `search_ids`.
+    :param rows: The rows by ID.
+    :return: The rows in rank order.
+    """
+    return [rows[row_id] for row_id in ids if row_id in rows]
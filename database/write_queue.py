@@ -0,0 +1,220 @@
+"""
+write_queue.py
+
+This module provides the single-writer commit queue of the Restaurant Management System (RMS).
+SQLite allows only one writer at a time, so instead of letting OrderController, BillingController
+and InventoryController race for the write lock, their write operations are handed to one
+dedicated writer thread which group-commits them in batches.
+
+📌 Features:
+- Submit a unit of work (a callable taking a session) and receive a Future for its result.
+- Group-commit several units of work in one transaction to raise sustained write throughput.
+- Isolate every unit of work in a SAVEPOINT so one failing write never rolls back the others.
+- A batch that cannot be committed fails the Future of every unit in it, so no caller waits forever.
+- Take the write lock up front with BEGIN IMMEDIATE, which avoids "database is locked" upgrades;
+  `end_read()` ends a caller's read so its next write can do so.
+- Share one process-wide queue through `get_write_queue()`.
+
+🛠️ Dependencies:
+- SQLAlchemy -> Session management for the writer thread.
+- threading / queue -> For the writer thread and its work queue.
+- concurrent.futures -> For returning results to the submitting threads.
+- logging -> For logging failed batches.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from database.connection import get_engine
+
+T = TypeVar("T")
+
+WorkUnit = Callable[[Session], Any]
+
+_STOP = object()
+
+
+class WriteQueue:
+    """
+    Runs database writes on a single writer thread and commits them in batches.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None, batch_size: int = 64, max_wait: float = 0.002, maxsize: int = 0):
+        """
+        Initializes the WriteQueue.
+
+        :param session_factory: (Optional) Factory for the writer's sessions (default: the application engine with BEGIN IMMEDIATE).
+        :param batch_size: The maximum number of work units committed together (default: 64).
+        :param max_wait: Seconds to wait for more work before committing a partial batch (default: 0.002).
+        :param maxsize: The maximum number of pending work units, 0 for unbounded (default: 0).
+        """
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Starts the writer thread if it is not already running.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            if self._session_factory is None:
+                engine = get_engine().execution_options(sqlite_begin="IMMEDIATE")
+                self._session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+            self._thread = threading.Thread(target=self._run, name="rms-db-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the writer thread after all pending work has been committed.
+
+        :param timeout: (Optional) Seconds to wait for the writer thread to finish.
+        """
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(_STOP)
+            self._thread = None
+        thread.join(timeout)
+
+    def submit(self, work: Callable[[Session], T]) -> "Future[T]":
+        """
+        Queues a unit of work for the writer thread.
+
+        The callable receives the writer's session and must not commit it; the queue commits
+        once per batch. Return plain values (e.g. ids) rather than ORM instances.
+
+        :param work: The unit of work to run.
+        :return: A Future resolved with the work's return value once it has been committed.
+        """
+        if self._thread is None:
+            self.start()
+        future: "Future[T]" = Future()
+        self._queue.put((work, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=self.max_wait)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._commit_batch(batch)
+            if stop:
+                return
+
+    def _commit_batch(self, batch: List[Tuple[WorkUnit, Future]]) -> None:
+        completed: List[Tuple[Future, Any]] = []
+        try:
+            session = self._session_factory()
+        except Exception as exc:
+            logging.exception("Write batch of %d units could not open a session", len(batch))
+            self._fail_unresolved(batch, exc)
+            return
+        try:
+            for work, future in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                savepoint = session.begin_nested()
+                try:
+                    result = work(session)
+                    savepoint.commit()
+                except Exception as exc:
+                    savepoint.rollback()
+                    future.set_exception(exc)
+                    continue
+                completed.append((future, result))
+            session.commit()
+        except Exception as exc:
+            logging.exception("Write batch of %d units failed to commit", len(batch))
+            try:
+                session.rollback()
+            finally:
+                # Nothing in the batch was committed, including the units not reached yet.
+                self._fail_unresolved(batch, exc)
+        else:
+            for future, result in completed:
+                future.set_result(result)
+        finally:
+            session.close()
+
+    @staticmethod
+    def _fail_unresolved(batch: List[Tuple[WorkUnit, Future]], exc: BaseException) -> None:
+        for _, future in batch:
+            if future.done():
+                continue
+            # Only the writer thread starts futures, so a running one can no longer be cancelled.
+            if future.running() or future.set_running_or_notify_cancel():
+                future.set_exception(exc)
+
+
+def run_write(work: Callable[[Session], T], session: Session, write_queue: Optional[WriteQueue] = None) -> T:
+    """
+    Runs a unit of work through the write queue if one is given, otherwise on the session directly.
+
+    :param work: The unit of work to run; it receives the session and must not commit it.
+    :param session: The caller's session, used when no write queue is given.
+    :param write_queue: (Optional) The write queue to route the work through.
+    :return: The work's return value after it has been committed.
+    """
+    if write_queue is not None:
+        return write_queue.submit(work).result()
+    if not session.in_transaction():
+        # Take the write lock before the first read so the transaction never has to upgrade.
+        session.connection(execution_options={"sqlite_begin": "IMMEDIATE"})
+    try:
+        result = work(session)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    return result
+
+
+def end_read(session: Session) -> None:
+    """
+    Ends the session's read transaction, so its next write can take the write lock up front
+    (see run_write) instead of upgrading a read lock, and the read snapshot is released.
+
+    :param session: The session that has been reading.
+    """
+    if session.in_transaction():
+        session.commit()
+
+
+_write_queue: Optional[WriteQueue] = None
+
+
+def get_write_queue() -> WriteQueue:
+    """
+    Returns the process-wide write queue, starting its writer thread on first use.
+
+    :return: The shared WriteQueue.
+    """
+    global _write_queue
+    if _write_queue is None:
+        _write_queue = WriteQueue()
+        _write_queue.start()
+        atexit.register(_write_queue.stop)
+    return _write_queue
@@ -0,0 +1,50 @@
+"""
+Models Package
+
+This package contains the SQLAlchemy ORM models of the Restaurant Management System (RMS).
+Importing the package registers every table on `Base.metadata`.
+
+Modules:
+--------
+- attendance_model: Daily employee attendance records.
+- billing_model: Customer bills and payments.
+- category_model: Menu categories (e.g., Appetizers, Main Courses, Desserts).
+- discount_model: Discount codes that can be applied to orders.
+- inventory_model: Ingredients and products kept in stock.
+- menu_item_model: Dishes and drinks offered on the menu.
+- order_event_model: The append-only log of order state changes.
+- order_model: Customer orders and their line items.
+- read_models: Frozen, slotted read-only records returned by the list endpoints.
+- recipe_model: The inventory items each menu item is made from.
+- reservation_model: Table reservations.
+- sales_rollup_model: Hourly per-item sales totals for the sales reports.
+- settings_model: System-wide configuration values.
+- staff_model: Restaurant employees.
+- supplier_model: Suppliers of ingredients and goods.
+- table_model: Dining tables.
+- user_model: Application users and their roles.
+"""
+
+from .attendance_model import Attendance
+from .billing_model import Billing
+from .category_model import Category
+from .discount_model import Discount
+from .inventory_model import Inventory
+from .menu_item_model import MenuItem
+from .order_event_model import OrderEvent
+from .order_model import Order, OrderItem
+from .read_models import InventoryRecord, MenuItemRecord, StaffRecord
+from .recipe_model import RecipeIngredient
+from .reservation_model import Reservation
+from .sales_rollup_model import SalesRollup
+from .settings_model import Settings
+from .staff_model import Staff
+from .supplier_model import Supplier
+from .table_model import Table
+from .user_model import User
+
+
+__all__ = [
+    'Attendance', 'Billing', 'Category', 'Discount', 'Inventory', 'InventoryRecord', 'MenuItem', 'MenuItemRecord',
+    'Order', 'OrderEvent', 'OrderItem', 'RecipeIngredient', 'Reservation', 'SalesRollup', 'Settings', 'Staff', 'StaffRecord', 'Supplier', 'Table', 'User'
+]
@@ -0,0 +1,39 @@
+"""
+Attendance Module
+
+This module defines the `Attendance` model for the Restaurant Management System (RMS).
+The `Attendance` model stores the daily attendance records of the restaurant's employees,
+including their clock-in and clock-out times and their attendance status.
+
+Models:
+-------
+- Attendance: Represents one employee's attendance on one day.
+
+Usage:
+------
+The `Attendance` model is used by the AttendanceController and the attendance reports to
+track working hours, overtime, and absences.
+"""
+
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
+from database.base import Base
+
+class Attendance(Base):
+    """
+    Attendance model stores an employee's clock-in/clock-out times and status for a given day.
+    """
+    __tablename__ = "attendance"
+
+    attendance_id = Column(Integer, primary_key=True, autoincrement=True)
+    employee_id = Column(Integer, ForeignKey("staff.staff_id"), nullable=False)
+    date = Column(Date, nullable=False)
+    clock_in = Column(DateTime, nullable=True)
+    clock_out = Column(DateTime, nullable=True)
+    status = Column(String(20), nullable=False, default="Present")  # Present, Absent, On Leave
+    hours_worked = Column(Float, nullable=False, default=0.0)
+
+    employee = relationship("Staff")
+
+    def __repr__(self):
+        return f"<Attendance(employee_id={self.employee_id}, date={self.date}, status={self.status})>"
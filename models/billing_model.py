@@ -8,9 +8,10 @@ such as the total amount billed, the payment method used, and the associated res
 The `Billing` model is part of the database schema and is used for tracking payments 
 and generating invoices for customer reservations. It includes attributes such as the 
 total amount, payment method, and the foreign key referencing the associated reservation.
+Amounts are stored as integer cents (see controllers/utils/payment_utils.py).
 """
 
-from sqlalchemy import Column, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database.base import Base
@@ -21,6 +22,26 @@ class Billing(Base):
     including the total amount, payment method, and associated reservation.
     """
     __tablename__ = "billing"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    bill_id = Column(Integer, primary_key=True, autoincrement=True)
+    customer_id = Column(Integer, nullable=False)
+    reservation_id = Column(Integer, ForeignKey("reservations.reservation_id"), nullable=True)
+    order_id = Column(Integer, ForeignKey("orders.order_id"), nullable=True)
+    # Amounts are integer cents.
+    subtotal_cents = Column(Integer, nullable=False, default=0)
+    discount_cents = Column(Integer, nullable=False, default=0)
+    service_charge_cents = Column(Integer, nullable=False, default=0)
+    tax_cents = Column(Integer, nullable=False, default=0)
+    total_cents = Column(Integer, nullable=False, default=0)
+    amount_paid_cents = Column(Integer, nullable=False, default=0)
+    payment_method = Column(String(30), nullable=True)
+    status = Column(String(20), nullable=False, default="Unpaid")  # Unpaid, Paid, Cancelled
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+    paid_at = Column(DateTime, nullable=True)
+
+    reservation = relationship("Reservation", back_populates="bills")
+    order = relationship("Order", back_populates="bills")
 
     def __repr__(self):
-        return f"<Billing(bill_id={self.bill_id}, total_amount={self.total_amount})>"
+        return f"<Billing(bill_id={self.bill_id}, total_cents={self.total_cents})>"
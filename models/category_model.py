@@ -11,7 +11,7 @@ Models:
 """
 
 
-from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database.base import Base
@@ -23,5 +23,12 @@ class Category(Base):
     """
     __tablename__ = "categories"
 
+    category_id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(50), unique=True, nullable=False)
+    description = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    menu_items = relationship("MenuItem", back_populates="category")
+
     def __repr__(self):
         return f"<Category(name={self.name}, category_id={self.category_id})>"
\ No newline at end of file
@@ -17,7 +17,7 @@ This model is used to manage the discounts applied to customer orders in the RMS
 could be applied to the total order amount, either as a fixed amount or a percentage.
 """
 
-from sqlalchemy import Column, String, Float, DateTime
+from sqlalchemy import Column, Integer, String, Float, DateTime
 from datetime import datetime
 from database.base import Base
 from sqlalchemy.orm import relationship
@@ -28,5 +28,13 @@ class Discount(Base):
     """
     __tablename__ = "discounts"
 
+    discount_id = Column(Integer, primary_key=True, autoincrement=True)
+    code = Column(String(30), unique=True, nullable=False)
+    percentage = Column(Float, nullable=False)
+    valid_from = Column(DateTime, nullable=False, default=datetime.now)
+    valid_until = Column(DateTime, nullable=True)
+
+    orders = relationship("Order", back_populates="discount")
+
     def __repr__(self):
         return f"<Discount(code={self.code}, percentage={self.percentage})>"
\ No newline at end of file
@@ -6,6 +6,9 @@ The `Inventory` class stores details about ingredients, products, and other item
 in the restaurant's inventory, including their names, quantities, prices, and other relevant
 information for efficient stock management.
 
+Every change to a row increments its `version`, so concurrent terminals editing the same
+item detect each other instead of silently overwriting the other's change.
+
 Models:
 -------
 - Inventory: Represents items in the restaurant's inventory such as ingredients or products,
@@ -17,7 +20,8 @@ The `Inventory` model is used to track and manage inventory items in the RMS. Th
 adding, updating, and querying the stock of ingredients and products available for orders.
 """
 
-from sqlalchemy import Column, String, Integer, Float, DateTime
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
 from datetime import datetime
 from database.base import Base
 
@@ -27,7 +31,20 @@ class Inventory(Base):
     """
     __tablename__ = "inventory"
 
-    pass
+    item_id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(100), unique=True, nullable=False)
+    quantity = Column(Integer, nullable=False, default=0)
+    price = Column(Float, nullable=False, default=0.0)
+    supplier_id = Column(Integer, ForeignKey("suppliers.supplier_id"), nullable=True)
+    expiration_date = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+    updated_at = Column(DateTime, nullable=False, default=datetime.now, onupdate=datetime.now)
+    version = Column(Integer, nullable=False, default=1)
+
+    supplier = relationship("Supplier", back_populates="inventory_items")
+
+    # ORM updates check the version they loaded and raise StaleDataError if the row changed since.
+    __mapper_args__ = {"version_id_col": version}
 
     def __repr__(self):
         return f"<Inventory(item_id={self.item_id}, name={self.name}, quantity={self.quantity})>"
\ No newline at end of file
@@ -15,9 +15,14 @@ Usage:
 ------
 The `MenuItem` model is used to manage and display menu items in the RMS. This includes 
 adding, updating, and querying items in the menu, as well as associating them with a category.
+Prices are stored as integer cents (see controllers/utils/payment_utils.py).
+`available` is the manager's switch; `out_of_stock` is derived from the item's recipe and the
+inventory (see database/recipes.py). An item can be ordered only if it is available and in stock.
+`tax_class` and `discountable` decide how the item is taxed and discounted when orders are
+priced (see controllers/utils/pricing_engine.py).
 """
 
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, Text, DateTime
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, DateTime, Boolean
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database.base import Base
@@ -28,7 +33,21 @@ class MenuItem(Base):
     Each menu item is associated with a category (e.g., Appetizer, Main Course).
     """
     __tablename__ = "menu_items"
-    
+
+    item_id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(100), nullable=False)
+    description = Column(Text, nullable=True)
+    price_cents = Column(Integer, nullable=False)  # integer cents
+    category_id = Column(Integer, ForeignKey("categories.category_id"), nullable=True)
+    available = Column(Boolean, nullable=False, default=True)
+    out_of_stock = Column(Boolean, nullable=False, default=False)  # maintained from the recipe
+    tax_class = Column(String(20), nullable=False, default="standard")  # a key of the tax rate table
+    discountable = Column(Boolean, nullable=False, default=True)  # whether order discounts apply to the item
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+    updated_at = Column(DateTime, nullable=False, default=datetime.now, onupdate=datetime.now)
+
+    category = relationship("Category", back_populates="menu_items")
+    recipe = relationship("RecipeIngredient", back_populates="menu_item", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
-        return f"<MenuItem(name={self.name}, item_id={self.item_id}, price={self.price})>"
\ No newline at end of file
+        return f"<MenuItem(name={self.name}, item_id={self.item_id}, price_cents={self.price_cents})>"
\ No newline at end of file
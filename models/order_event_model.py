@@ -0,0 +1,40 @@
+"""
+Order Event Module
+
+This module defines the `OrderEvent` model for the Restaurant Management System (RMS).
+Every change of an order's state is appended to the `order_events` log with its timestamp;
+rows are never updated or deleted (except when archived together with their order).
+
+Models:
+-------
+- OrderEvent: One state change of one order (created, in_progress, completed, cancelled).
+
+Usage:
+------
+Events are appended by OrderController in the same transaction that moves the order's
+`status`, which is the current-state projection of the log (see database/order_events.py).
+Kitchen timing metrics, such as the preparation time from `in_progress` to `completed`,
+are read from the log.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import relationship
+from database.base import Base
+
+class OrderEvent(Base):
+    """
+    OrderEvent model stores one entry of the append-only order state log.
+    """
+    __tablename__ = "order_events"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    event_id = Column(Integer, primary_key=True, autoincrement=True)
+    order_id = Column(Integer, ForeignKey("orders.order_id", ondelete="CASCADE"), nullable=False)
+    event = Column(String(20), nullable=False)  # created, in_progress, completed, cancelled
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    order = relationship("Order", back_populates="events")
+
+    def __repr__(self):
+        return f"<OrderEvent(order_id={self.order_id}, event={self.event}, created_at={self.created_at})>"
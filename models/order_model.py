@@ -10,15 +10,19 @@ Models:
 -------
 - Order: Represents an order placed by a customer, including the total amount, associated 
     menu items, discounts, and customer details.
+- OrderItem: Represents a single line item (menu item and quantity) of an order.
 
 Usage:
 ------
 The `Order` model is used to manage customer orders in the RMS. It is essential for tracking 
 and processing customer orders, calculating totals, and applying discounts.
+Amounts are stored as integer cents (see controllers/utils/payment_utils.py).
+`status` is the current state of the order; its history is kept in the order event log
+(see models/order_event_model.py).
 """
 
 
-from sqlalchemy import Column, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database.base import Base
@@ -28,6 +32,44 @@ class Order(Base):
     Order model stores details of customer orders, including items ordered, prices, and associated discounts.
     """
     __tablename__ = "orders"
+    # AUTOINCREMENT here and on every other table with an archive copy (see database/archive.py): ids are
+    # never reused, so an id moved to the archive cannot come back for a new row.
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    order_id = Column(Integer, primary_key=True, autoincrement=True)
+    customer_id = Column(Integer, nullable=False)
+    status = Column(String(20), nullable=False, default="Pending")  # Pending, In Progress, Completed, Cancelled
+    total_cents = Column(Integer, nullable=False, default=0)  # integer cents
+    discount_id = Column(Integer, ForeignKey("discounts.discount_id"), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+    updated_at = Column(DateTime, nullable=False, default=datetime.now, onupdate=datetime.now)
+    promised_at = Column(DateTime, nullable=True)  # when the customer was promised the food; orders the kitchen queue
+
+    items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
+    events = relationship("OrderEvent", back_populates="order", order_by="OrderEvent.event_id", passive_deletes=True)
+    discount = relationship("Discount", back_populates="orders")
+    bills = relationship("Billing", back_populates="order")
+
+    def __repr__(self):
+        return f"<Order(order_id={self.order_id}, total_cents={self.total_cents})>"
+
+
+class OrderItem(Base):
+    """
+    OrderItem model stores the individual line items of an order, with the unit price captured at ordering time.
+    """
+    __tablename__ = "order_items"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    order_item_id = Column(Integer, primary_key=True, autoincrement=True)
+    order_id = Column(Integer, ForeignKey("orders.order_id", ondelete="CASCADE"), nullable=False)
+    item_id = Column(Integer, ForeignKey("menu_items.item_id"), nullable=False)
+    quantity = Column(Integer, nullable=False, default=1)
+    unit_price_cents = Column(Integer, nullable=False)  # integer cents
+    course = Column(Integer, nullable=False, default=1)  # 1 = first course; the kitchen fires courses in order
+
+    order = relationship("Order", back_populates="items")
+    menu_item = relationship("MenuItem")
 
     def __repr__(self):
-        return f"<Order(order_id={self.order_id}, total_amount={self.total_amount})>"
\ No newline at end of file
+        return f"<OrderItem(order_id={self.order_id}, item_id={self.item_id}, quantity={self.quantity})>"
\ No newline at end of file
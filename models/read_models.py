@@ -0,0 +1,64 @@
+"""
+Read Models Module
+
+This module defines the read-only records returned by the list endpoints of the
+Restaurant Management System (RMS).
+
+The list screens (full menu, inventory, staff) only display rows; they never modify them.
+Loading them as ORM instances would put every row in the session's identity map with
+change tracking and a per-instance `__dict__`. Instead, the controllers select just the
+displayed columns through Core and wrap each row in one of these frozen `__slots__` records.
+
+Models:
+-------
+- MenuItemRecord: One menu item with its category name.
+- InventoryRecord: One inventory item with its stock level.
+- StaffRecord: One staff member.
+
+Usage:
+------
+Fields are read as attributes (`item.name`, `item.price_cents`). `dataclasses.asdict(record)`
+converts a record to a dictionary where one is needed, e.g. for JSON responses.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class MenuItemRecord:
+    """
+    A menu item as shown on the menu screens.
+    """
+    item_id: int
+    name: str
+    price_cents: int
+    category: Optional[str]
+    available: bool
+
+
+@dataclass(frozen=True, slots=True)
+class InventoryRecord:
+    """
+    An inventory item as shown on the stock screens.
+    """
+    item_id: int
+    name: str
+    quantity: int
+    price: float
+    supplier_id: Optional[int]
+    expiration_date: Optional[datetime]
+
+
+@dataclass(frozen=True, slots=True)
+class StaffRecord:
+    """
+    A staff member as shown on the staff screens.
+    """
+    staff_id: int
+    name: str
+    role: str
+    shift: Optional[str]
+    salary: float
+    contact_info: Optional[str]
@@ -0,0 +1,42 @@
+"""
+Recipe Module
+
+This module defines the `RecipeIngredient` model for the Restaurant Management System (RMS).
+A menu item's recipe (its bill of materials) lists the inventory items it is made from and
+how many units of each one serving uses.
+
+Models:
+-------
+- RecipeIngredient: One ingredient of one menu item, with the quantity used per serving.
+
+Usage:
+------
+Recipes connect the menu to the stock. Selling a dish consumes its ingredients, and a dish
+whose ingredient stock falls below one serving is marked out of stock (see database/recipes.py).
+Rows are stored by menu item; the `ix_recipe_ingredients_inventory` index created in
+database/create_tables.py maps each ingredient back to the dishes that use it.
+"""
+
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Integer
+from sqlalchemy.orm import relationship
+from database.base import Base
+
+class RecipeIngredient(Base):
+    """
+    RecipeIngredient model stores how many units of an inventory item one serving of a menu item uses.
+    """
+    __tablename__ = "recipe_ingredients"
+    __table_args__ = (
+        CheckConstraint("quantity > 0", name="ck_recipe_ingredients_quantity"),
+        {"sqlite_with_rowid": False},
+    )
+
+    menu_item_id = Column(Integer, ForeignKey("menu_items.item_id", ondelete="CASCADE"), primary_key=True)
+    inventory_item_id = Column(Integer, ForeignKey("inventory.item_id", ondelete="CASCADE"), primary_key=True)
+    quantity = Column(Integer, nullable=False)  # units of the inventory item per serving
+
+    menu_item = relationship("MenuItem", back_populates="recipe")
+    inventory_item = relationship("Inventory")
+
+    def __repr__(self):
+        return f"<RecipeIngredient(menu_item_id={self.menu_item_id}, inventory_item_id={self.inventory_item_id}, quantity={self.quantity})>"
@@ -15,7 +15,7 @@ The `Reservation` model is used to manage and track customer reservations in the
 including the number of guests and the assigned table.
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database.base import Base
@@ -26,6 +26,20 @@ class Reservation(Base):
     including date, time, guest count, and table association.
     """
     __tablename__ = "reservations"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    reservation_id = Column(Integer, primary_key=True, autoincrement=True)
+    customer_id = Column(Integer, nullable=False)
+    customer_name = Column(String(100), nullable=True)
+    table_id = Column(Integer, ForeignKey("tables.table_id"), nullable=True)
+    reservation_date = Column(DateTime, nullable=False)
+    num_guests = Column(Integer, nullable=False)
+    special_requests = Column(Text, nullable=True)
+    status = Column(String(20), nullable=False, default="Booked")  # Booked, Cancelled, Completed, No-Show
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    table = relationship("Table", back_populates="reservations")
+    bills = relationship("Billing", back_populates="reservation")
 
     def __repr__(self):
         return f"<Reservation(reservation_id={self.reservation_id}, customer_name={self.customer_name})>"
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Sales Rollup Module
+
+This module defines the `SalesRollup` model for the Restaurant Management System (RMS).
+The `SalesRollup` table holds pre-aggregated sales per day, hour and menu item, so sales
+dashboards read a few hundred rows per day instead of every order placed.
+
+Models:
+-------
+- SalesRollup: Quantity sold, revenue and number of orders for one menu item in one hour.
+
+Usage:
+------
+The rollup is maintained in the same transaction as the orders it summarizes by
+OrderController (see database/sales_rollup.py) and read by SalesReportController.
+Cancelled orders are not counted. It can be rebuilt from the order history with
+`python -m database.sales_rollup --rebuild`.
+"""
+
+from sqlalchemy import Column, Date, Integer
+from database.base import Base
+
+class SalesRollup(Base):
+    """
+    SalesRollup model stores the non-cancelled sales of one menu item in one hour of one day.
+    """
+    __tablename__ = "sales_rollup"
+    # Rows are stored in primary-key order, so a date range is one contiguous read.
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    day = Column(Date, primary_key=True)
+    hour = Column(Integer, primary_key=True)  # 0-23
+    item_id = Column(Integer, primary_key=True)
+    quantity = Column(Integer, nullable=False, default=0)
+    revenue_cents = Column(Integer, nullable=False, default=0)  # integer cents
+    order_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<SalesRollup(day={self.day}, hour={self.hour}, item_id={self.item_id}, quantity={self.quantity})>"
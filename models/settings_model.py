@@ -21,5 +21,10 @@ class Settings(Base):
     """
     __tablename__ = "settings"
 
+    setting_id = Column(Integer, primary_key=True, autoincrement=True)
+    key = Column(String(100), unique=True, nullable=False)
+    value = Column(String(255), nullable=True)
+    updated_at = Column(DateTime, nullable=False, default=datetime.now, onupdate=datetime.now)
+
     def __repr__(self):
         return f"<Setting(key={self.key}, value={self.value})>"
\ No newline at end of file
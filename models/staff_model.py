@@ -27,5 +27,13 @@ class Staff(Base):
     """
     __tablename__ = "staff"
 
+    staff_id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(100), nullable=False)
+    role = Column(String(50), nullable=False)
+    shift = Column(String(50), nullable=True)
+    salary = Column(Float, nullable=False, default=0.0)
+    contact_info = Column(String(120), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
     def __repr__(self):
         return f"<Staff(name={self.name}, staff_id={self.staff_id}, role={self.role})>"
@@ -15,7 +15,8 @@ The `Supplier` model is used to manage and track supplier information, such as c
 details, supplied items, and other related information.
 """
 
-from sqlalchemy import Column, String, Float, DateTime
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.orm import relationship
 from datetime import datetime
 from database.base import Base
 
@@ -25,6 +26,14 @@ class Supplier(Base):
     """
     __tablename__ = "suppliers"
 
+    supplier_id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(100), unique=True, nullable=False)
+    contact_email = Column(String(120), nullable=True)
+    phone = Column(String(20), nullable=True)
+    address = Column(String(255), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    inventory_items = relationship("Inventory", back_populates="supplier")
 
     def __repr__(self):
         return f"<Supplier(name={self.name}, supplier_id={self.supplier_id})>"
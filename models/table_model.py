@@ -17,6 +17,7 @@ reservations, seating capacity, and table-specific details.
 """
 
 from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy.orm import relationship
 from datetime import datetime
 from database.base import Base
 
@@ -26,5 +27,13 @@ class Table(Base):
     """
     __tablename__ = "tables"
 
+    table_id = Column(Integer, primary_key=True, autoincrement=True)
+    table_number = Column(Integer, unique=True, nullable=False)
+    capacity = Column(Integer, nullable=False)
+    status = Column(String(20), nullable=False, default="Available")  # Available, Reserved, Occupied
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    reservations = relationship("Reservation", back_populates="table")
+
     def __repr__(self):
         return f"<Table(table_id={self.table_id}, table_number={self.table_number})>"
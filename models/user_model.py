@@ -26,5 +26,12 @@ class User(Base):
     """
     __tablename__ = "users"
 
+    user_id = Column(Integer, primary_key=True, autoincrement=True)
+    username = Column(String(50), unique=True, nullable=False)
+    email = Column(String(120), unique=True, nullable=True)
+    password_hash = Column(String(128), nullable=False)
+    role = Column(String(20), nullable=False, default="staff")
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
     def __repr__(self):
         return f"<User(username={self.username}, role={self.role})>"
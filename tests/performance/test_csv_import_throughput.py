@@ -0,0 +1,70 @@
+"""
+Benchmark of the streaming inventory import on a generated supplier price list.
+
+The import reads, validates and upserts one chunk at a time, so its peak memory must not
+grow with the file: importing four times as many rows may not raise the peak by more than
+half. Throughput must reach RMS_IMPORT_ROWS_PER_SEC (default 5000 rows/s; every row also
+updates the inventory search index).
+"""
+
+import csv
+import os
+import time
+import tracemalloc
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from controllers.inventory.inventory_controller import InventoryController
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from models import Inventory
+
+MIN_ROWS_PER_SEC = float(os.getenv("RMS_IMPORT_ROWS_PER_SEC", "5000"))
+
+
+def price_list(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["name", "quantity", "price", "supplier"])
+        for i in range(rows):
+            writer.writerow([f"Product {i:07d}", i % 100, f"{1 + i % 5000 / 100:.2f}", f"Supplier {i % 20}"])
+    return str(path)
+
+
+def import_with_peak(tmp_path, rows):
+    engine = create_db_engine(str(tmp_path / f"inventory_{rows}.db"))
+    create_tables(engine)
+    path = price_list(tmp_path / f"prices_{rows}.csv", rows)
+    try:
+        with Session(bind=engine) as session:
+            tracemalloc.start()
+            start = time.perf_counter()
+            report = InventoryController(session).import_inventory_csv(path)
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert session.scalar(select(func.count()).select_from(Inventory)) == rows
+        return report, peak, seconds
+    finally:
+        engine.dispose()
+
+
+@pytest.mark.parametrize("rows", [80_000])
+def test_import_memory_stays_flat_and_runs_at_bulk_speed(tmp_path, rows):
+    _, small_peak, _ = import_with_peak(tmp_path, rows // 4)
+    report, peak, _ = import_with_peak(tmp_path, rows)
+
+    # tracemalloc slows Python down, so throughput is measured on a run without it.
+    engine = create_db_engine(str(tmp_path / "timed.db"))
+    create_tables(engine)
+    with Session(bind=engine) as session:
+        start = time.perf_counter()
+        InventoryController(session).import_inventory_csv(str(tmp_path / f"prices_{rows}.csv"))
+        rows_per_sec = rows / (time.perf_counter() - start)
+    engine.dispose()
+
+    assert (report.inserted, report.failed) == (rows, 0)
+    assert peak < small_peak * 1.5, f"peak {peak >> 20} MiB for {rows} rows vs {small_peak >> 20} MiB for {rows // 4}"
+    assert rows_per_sec > MIN_ROWS_PER_SEC, f"{rows_per_sec:.0f} rows/s is below {MIN_ROWS_PER_SEC:.0f}"
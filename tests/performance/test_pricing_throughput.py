@@ -0,0 +1,63 @@
+"""
+Throughput benchmark of repricing a day's worth of orders with the pricing engine.
+
+RMS_PRICING_ORDERS orders (default 20,000) of one to six lines are loaded and priced in one
+call; the pricing pass alone must take less than RMS_PRICING_BUDGET_MS (default 250 ms).
+"""
+
+import os
+import random
+import time
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+pytest.importorskip("numpy")
+
+from controllers.utils.pricing_engine import load_order_lines, price_orders
+from database.bulk import BulkPersistenceService
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from models import MenuItem, Order, OrderItem
+
+ORDERS = int(os.getenv("RMS_PRICING_ORDERS", "20000"))
+BUDGET_MS = float(os.getenv("RMS_PRICING_BUDGET_MS", "250"))
+
+
+@pytest.fixture(scope="module")
+def session(tmp_path_factory):
+    engine = create_db_engine(str(tmp_path_factory.mktemp("pricing") / "orders.db"))
+    create_tables(engine)
+    rng = random.Random(11)
+    with Session(bind=engine) as session:
+        BulkPersistenceService(session).bulk_insert(MenuItem, [
+            {"item_id": i, "name": f"Dish {i}", "price_cents": rng.randint(100, 4000),
+             "tax_class": rng.choice(["standard", "reduced", "exempt"]), "discountable": i % 5 != 0}
+            for i in range(1, 201)
+        ])
+        # Orders are seeded directly: only their lines matter here, not the rollup or the event log.
+        session.execute(insert(Order), [{"order_id": i, "customer_id": i % 500, "total_cents": 0} for i in range(1, ORDERS + 1)])
+        session.execute(insert(OrderItem), [
+            {"order_id": order_id, "item_id": rng.randint(1, 200), "quantity": rng.randint(1, 4), "unit_price_cents": rng.randint(100, 4000)}
+            for order_id in range(1, ORDERS + 1)
+            for _ in range(rng.randint(1, 6))
+        ])
+        session.commit()
+    session = Session(bind=engine)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_repricing_many_orders_in_one_pass(session):
+    lines = load_order_lines(session, range(1, ORDERS + 1))
+
+    start = time.perf_counter()
+    priced = price_orders(lines, service_rate=0.1)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"\npriced {len(priced)} orders ({len(lines.quantity)} lines) in {elapsed_ms:.1f} ms")
+    assert len(priced) == ORDERS
+    assert (priced.total_cents >= priced.subtotal_cents - priced.discount_cents).all()
+    assert elapsed_ms < BUDGET_MS
@@ -0,0 +1,95 @@
+"""
+Benchmark of the read-model list endpoints against ORM-backed dictionaries at 50k rows.
+
+MenuController.get_all_menu_items selects only the displayed columns and wraps them in
+frozen MenuItemRecord instances; the baseline loads tracked MenuItem instances and builds
+the same dictionaries the endpoint used to return.
+"""
+
+import time
+import tracemalloc
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from controllers.restaurant.menu_controller import MenuController
+from database.bulk import BulkPersistenceService
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database.menu_catalog import get_menu_catalog
+from models import Category, MenuItem, MenuItemRecord
+
+ROWS = 50_000
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    engine = create_db_engine(str(tmp_path_factory.mktemp("read_models") / "menu.db"))
+    create_tables(engine)
+    with Session(bind=engine) as session:
+        bulk = BulkPersistenceService(session)
+        bulk.bulk_insert(Category, [{"category_id": 1, "name": "Mains"}])
+        bulk.bulk_insert(MenuItem, [{"name": f"Dish {i:05d}", "price_cents": 950, "category_id": 1} for i in range(ROWS)])
+    yield engine
+    engine.dispose()
+
+
+def orm_dicts(session):
+    rows = session.execute(
+        select(MenuItem, Category.name).outerjoin(Category, MenuItem.category_id == Category.category_id).order_by(MenuItem.name)
+    )
+    return [
+        {"item_id": item.item_id, "name": item.name, "price_cents": item.price_cents, "category": category, "available": item.available}
+        for item, category in rows
+    ]
+
+
+def records(session):
+    # Measure the load itself, not the menu catalog serving a cached snapshot.
+    get_menu_catalog(session).invalidate()
+    return MenuController(session).get_all_menu_items()
+
+
+def best_time(engine, load, runs=2):
+    timings = []
+    for _ in range(runs):
+        with Session(bind=engine) as session:
+            start = time.perf_counter()
+            load(session)
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def peak_memory(engine, load):
+    with Session(bind=engine) as session:
+        tracemalloc.start()
+        try:
+            result = load(session)
+            return tracemalloc.get_traced_memory()[1], result
+        finally:
+            tracemalloc.stop()
+
+
+def test_records_match_orm_rows(engine):
+    with Session(bind=engine) as session:
+        items = records(session)
+
+    assert len(items) == ROWS
+    assert isinstance(items[0], MenuItemRecord)
+    assert items[0] == MenuItemRecord(1, "Dish 00000", 950, "Mains", True)
+    assert not hasattr(items[0], "__dict__")
+
+
+def test_records_use_less_memory_than_orm_instances(engine):
+    orm_peak, _ = peak_memory(engine, orm_dicts)
+    record_peak, _ = peak_memory(engine, records)
+
+    assert record_peak < orm_peak / 2, f"records peaked at {record_peak >> 10} KiB vs {orm_peak >> 10} KiB for ORM rows"
+
+
+def test_records_load_faster_than_orm_instances(engine):
+    orm_seconds = best_time(engine, orm_dicts)
+    record_seconds = best_time(engine, records)
+
+    assert record_seconds < orm_seconds, f"records took {record_seconds:.3f}s vs {orm_seconds:.3f}s for ORM rows"
@@ -0,0 +1,76 @@
+"""
+Benchmark of the streamed order report on a large order history.
+
+The report reads orders in batches and draws the PDF one page at a time, keeping only each closed
+page's compressed stream until the file is saved. Its peak memory may therefore only grow with the
+size of the PDF, never with the orders read: rendering four times as many orders may not raise the
+peak by more than four times the extra PDF bytes. RMS_REPORT_ORDERS orders (default 200,000) must render at
+RMS_REPORT_ROWS_PER_SEC (default 5,000 orders/s) or faster.
+"""
+
+import os
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+pytest.importorskip("reportlab")
+
+from controllers.restaurant.order_controller import OrderController
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from models import Order
+
+ORDERS = int(os.getenv("RMS_REPORT_ORDERS", "200000"))
+MIN_ROWS_PER_SEC = float(os.getenv("RMS_REPORT_ROWS_PER_SEC", "5000"))
+STATUSES = ("Pending", "In Progress", "Completed", "Cancelled")
+
+
+def order_db(path, orders):
+    engine = create_db_engine(str(path))
+    create_tables(engine)
+    start = datetime(2024, 1, 1)
+    with Session(bind=engine) as session:
+        # Seeded directly: the report only reads the orders table.
+        session.execute(insert(Order), [
+            {"order_id": i, "customer_id": i % 5000, "status": STATUSES[i % 4], "total_cents": 500 + i % 9000,
+             "created_at": start + timedelta(minutes=i)}
+            for i in range(1, orders + 1)
+        ])
+        session.commit()
+    return engine
+
+
+def render(engine, path, trace=False):
+    with Session(bind=engine) as session:
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        pages = OrderController(session).generate_order_report(str(path))
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace else 0
+        tracemalloc.stop()
+    engine.dispose()
+    return pages, seconds, peak
+
+
+def test_order_report_memory_follows_the_compressed_pdf(tmp_path):
+    # tracemalloc slows Python down, so memory is compared on smaller reports than the timed one.
+    small_pdf, large_pdf = tmp_path / "small.pdf", tmp_path / "large.pdf"
+    _, _, small_peak = render(order_db(tmp_path / "small.db", 10_000), small_pdf, trace=True)
+    _, _, peak = render(order_db(tmp_path / "large.db", 40_000), large_pdf, trace=True)
+    pdf_growth = large_pdf.stat().st_size - small_pdf.stat().st_size
+
+    assert peak - small_peak < 4 * pdf_growth, f"peak {peak >> 10} KiB for 40000 orders vs {small_peak >> 10} KiB for 10000, PDF {pdf_growth >> 10} KiB larger"
+
+
+def test_order_report_renders_in_linear_time(tmp_path):
+    pages, seconds, _ = render(order_db(tmp_path / "orders.db", ORDERS), tmp_path / "orders.pdf")
+    rows_per_sec = ORDERS / seconds
+
+    print(f"\nrendered {ORDERS} orders on {pages} pages at {rows_per_sec:.0f} orders/s")
+    assert pages == 1 + -(-(ORDERS - 39) // 41)  # 39 rows under the title, then 41 per page
+    assert rows_per_sec > MIN_ROWS_PER_SEC, f"{rows_per_sec:.0f} orders/s is below {MIN_ROWS_PER_SEC:.0f}"
@@ -0,0 +1,60 @@
+"""
+Latency benchmark of search-as-you-type over a 30k-item catalogue.
+
+Every prefix of each query is searched, as the POS does on each keystroke; the mean latency
+must stay below RMS_SEARCH_BUDGET_MS (default 5 ms).
+"""
+
+import os
+import random
+import time
+
+import pytest
+from sqlalchemy.orm import Session
+
+from controllers.restaurant.menu_controller import MenuController
+from database.bulk import BulkPersistenceService
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from models import Category, MenuItem
+
+ROWS = 30_000
+BUDGET_MS = float(os.getenv("RMS_SEARCH_BUDGET_MS", "5"))
+QUERIES = ("chicken burg", "noodle", "spicy tofu", "chiken", "zx")
+
+
+def catalogue_names(rows):
+    rng = random.Random(7)
+    syllables = ["ba", "ko", "ri", "mel", "sa", "tan", "do", "fu", "gri", "la", "pe", "mon", "zu", "chi", "ver", "no"]
+    words = ["".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).capitalize() for _ in range(3000)]
+    words += ["Chicken", "Burger", "Noodle", "Spicy", "Tofu", "Salad"]
+    return [" ".join(rng.choice(words) for _ in range(3)) + f" {i}" for i in range(rows)]
+
+
+@pytest.fixture(scope="module")
+def session(tmp_path_factory):
+    engine = create_db_engine(str(tmp_path_factory.mktemp("search") / "menu.db"))
+    create_tables(engine)
+    with Session(bind=engine) as session:
+        bulk = BulkPersistenceService(session)
+        bulk.bulk_insert(Category, [{"category_id": 1, "name": "Mains"}])
+        bulk.bulk_insert(MenuItem, [{"name": name, "price_cents": 950, "category_id": 1} for name in catalogue_names(ROWS)])
+        bulk.bulk_insert(MenuItem, [{"name": "Spicy Chicken Burger", "price_cents": 1250, "category_id": 1}])
+    session = Session(bind=engine)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_search_as_you_type_stays_within_budget(session):
+    menu = MenuController(session)
+    menu.get_all_menu_items()   # warm the menu catalog
+    keystrokes = [query[:end] for query in QUERIES for end in range(1, len(query) + 1)]
+
+    start = time.perf_counter()
+    results = [menu.search_menu_item_by_name(text) for text in keystrokes]
+    mean_ms = (time.perf_counter() - start) * 1000 / len(keystrokes)
+
+    assert "Chicken Burger" in results[keystrokes.index("chicken burg")][0].name
+    assert "Chicken" in results[keystrokes.index("chiken")][0].name
+    assert mean_ms < BUDGET_MS, f"mean search latency {mean_ms:.2f} ms exceeds {BUDGET_MS} ms"
@@ -0,0 +1,77 @@
+"""
+Startup benchmark for the controllers package.
+
+Each measurement runs in a fresh interpreter, so nothing imported by pytest or by other
+tests is already cached. The budgets can be tuned for slower machines through the
+RMS_IMPORT_BUDGET and RMS_READY_BUDGET environment variables (seconds).
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+IMPORT_BUDGET = float(os.getenv("RMS_IMPORT_BUDGET", "1.0"))
+READY_BUDGET = float(os.getenv("RMS_READY_BUDGET", "1.5"))
+
+# Only needed for printing, exporting and password hashing; must not load at startup.
+HEAVY_MODULES = ("reportlab", "openpyxl", "bcrypt", "win32api", "win32print")
+
+STARTUP_SCRIPT = """
+import importlib, json, pkgutil, sys, time
+
+start = time.perf_counter()
+import controllers
+for module in pkgutil.walk_packages(controllers.__path__, "controllers."):
+    importlib.import_module(module.name)
+imported = time.perf_counter()
+
+# First screen: an order-taking terminal listing the menu.
+from controllers.restaurant.menu_controller import MenuController
+from database.connection import get_session, init_engine
+from database.create_tables import create_tables
+init_engine(":memory:")
+create_tables()
+MenuController(get_session()).get_all_menu_items()
+ready = time.perf_counter()
+
+print(json.dumps({
+    "import": imported - start,
+    "ready": ready - start,
+    "loaded": sorted(name for name in HEAVY if name in sys.modules),
+}))
+"""
+
+
+def measure_startup(tmp_path):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    script = f"HEAVY = {HEAVY_MODULES!r}\n{STARTUP_SCRIPT}"
+    # Run outside the repository so import-time log files do not land in the work tree.
+    result = subprocess.run([sys.executable, "-c", script], cwd=tmp_path, env=env, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.fixture(scope="module")
+def startup(tmp_path_factory):
+    runs = [measure_startup(tmp_path_factory.mktemp("startup")) for _ in range(3)]
+    return {
+        "import": min(run["import"] for run in runs),
+        "ready": min(run["ready"] for run in runs),
+        "loaded": runs[0]["loaded"],
+    }
+
+
+def test_heavy_dependencies_are_not_imported_at_startup(startup):
+    assert startup["loaded"] == []
+
+
+def test_import_controllers_within_budget(startup):
+    assert startup["import"] <= IMPORT_BUDGET, f"importing controllers took {startup['import']:.3f}s (budget {IMPORT_BUDGET}s)"
+
+
+def test_first_screen_ready_within_budget(startup):
+    assert startup["ready"] <= READY_BUDGET, f"first screen ready after {startup['ready']:.3f}s (budget {READY_BUDGET}s)"
@@ -0,0 +1,84 @@
+"""
+Tests for the optimistic-concurrency stock updates in controllers/inventory/inventory_controller.py.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from controllers.inventory.inventory_controller import InventoryController
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from models import Inventory
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_db_engine(str(tmp_path / "live.db"))
+    create_tables(engine)
+    with Session(bind=engine) as session:
+        session.add_all([Inventory(item_id=1, name="Buns", quantity=10), Inventory(item_id=2, name="Patties", quantity=3)])
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def _stock(engine):
+    with Session(bind=engine) as session:
+        return dict(session.execute(select(Inventory.item_id, Inventory.quantity)).all())
+
+
+def test_sale_decrements_only_when_stock_suffices(engine):
+    with Session(bind=engine) as session:
+        inventory = InventoryController(session)
+
+        assert inventory.update_stock_after_sale(2, 3)
+        assert not inventory.update_stock_after_sale(2, 1)
+        assert not inventory.update_stock_after_sale(99, 1)
+
+    assert _stock(engine) == {1: 10, 2: 0}
+
+
+def test_order_decrements_all_items_or_none(engine):
+    with Session(bind=engine) as session:
+        inventory = InventoryController(session)
+
+        assert not inventory.update_stock_after_order({1: 2, 2: 4})
+        assert _stock(engine) == {1: 10, 2: 3}
+        assert inventory.update_stock_after_order({1: 2, 2: 1})
+
+    assert _stock(engine) == {1: 8, 2: 2}
+
+
+@pytest.mark.parametrize("quantities", [{1: -5}, {1: 2, 2: 0}])
+def test_quantities_below_one_are_rejected(engine, quantities):
+    with Session(bind=engine) as session:
+        with pytest.raises(ValueError, match="positive"):
+            InventoryController(session).update_stock_after_order(quantities)
+
+    assert _stock(engine) == {1: 10, 2: 3}
+
+
+def test_concurrent_sales_never_oversell(engine):
+    def sell(_):
+        with Session(bind=engine) as session:
+            return InventoryController(session).update_stock_after_order({1: 1, 2: 1})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(sell, range(20)))
+
+    assert results.count(True) == 3
+    assert _stock(engine) == {1: 7, 2: 0}
+
+
+def test_edit_of_stale_item_is_retried_on_the_fresh_row(engine):
+    # Like the application's sessions, keep loaded rows across commits.
+    with Session(bind=engine, expire_on_commit=False) as session, Session(bind=engine) as other:
+        stale = session.get(Inventory, 1)
+        session.commit()
+        InventoryController(other).update_stock_after_sale(1, 4)
+
+        assert InventoryController(session).update_item(1, price=2.5)
+        assert (stale.quantity, stale.price, stale.version) == (6, 2.5, 3)
@@ -0,0 +1,107 @@
+"""
+Tests for invoice generation in controllers/restaurant/billing_controller.py.
+"""
+
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+pytest.importorskip("reportlab")
+
+from controllers.restaurant.billing_controller import BillingController
+from controllers.restaurant.reservation_controller import ReservationController
+from controllers.utils.render_service import RenderService
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from models import Billing, MenuItem, Order, OrderItem, Reservation
+
+DAY = date(2026, 5, 1)
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(str(tmp_path / "billing.db"))
+    create_tables(engine)
+    session = Session(bind=engine, expire_on_commit=False)
+    session.add_all([
+        MenuItem(item_id=1, name="Burger", price_cents=950),
+        Order(order_id=1, customer_id=7, total_cents=1900, created_at=datetime(2026, 5, 1, 12)),
+        OrderItem(order_id=1, item_id=1, quantity=2, unit_price_cents=950),
+        Billing(bill_id=1, customer_id=7, order_id=1, subtotal_cents=1900, tax_cents=190, total_cents=2090, created_at=datetime(2026, 5, 1, 12, 30)),
+        Billing(bill_id=2, customer_id=8, subtotal_cents=500, discount_cents=50, total_cents=450, created_at=datetime(2026, 5, 1, 23, 59)),
+        Billing(bill_id=3, customer_id=9, total_cents=100, status="Cancelled", created_at=datetime(2026, 5, 1, 13)),
+        Billing(bill_id=4, customer_id=9, total_cents=100, created_at=datetime(2026, 5, 2, 0, 0)),
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def render_service():
+    service = RenderService(max_workers=2, max_pending=4)
+    yield service
+    service.stop()
+
+
+def test_invoice_lists_order_lines_and_charges(session):
+    invoices = BillingController(session).load_invoices_for_date(DAY)
+
+    assert list(invoices) == [1, 2]
+    assert invoices[1]["items"] == [
+        {"description": "2 x Burger", "price": "$19.00"},
+        {"description": "Subtotal", "price": "$19.00"},
+        {"description": "Tax", "price": "$1.90"},
+    ]
+    assert invoices[1]["total"] == "$20.90"
+    assert invoices[2]["items"] == [{"description": "Subtotal", "price": "$5.00"}, {"description": "Discount", "price": "-$0.50"}]
+
+
+def test_bill_of_an_order_lists_the_order_on_its_invoice(session):
+    session.add(Reservation(reservation_id=1, customer_id=7, reservation_date=datetime(2026, 5, 1, 12), num_guests=2))
+    session.commit()
+    billing = BillingController(session)
+
+    bill_id = billing.create_bill(7, order_id=1, reservation_id=1, service_rate=0.1)
+
+    bill = session.get(Billing, bill_id)
+    assert (bill.order_id, bill.subtotal_cents, bill.service_charge_cents, bill.tax_cents, bill.total_cents) == (1, 1900, 190, 209, 2299)
+    invoice = billing.load_invoices_for_date(bill.created_at.date())[bill_id]
+    assert [line["description"] for line in invoice["items"]] == ["2 x Burger", "Subtotal", "Service charge", "Tax"]
+    assert ReservationController(session).get_reservation_details(1)["amount_billed_cents"] == 2299
+
+
+def test_bill_needs_items_or_an_existing_order(session):
+    billing = BillingController(session)
+
+    with pytest.raises(ValueError, match="items or an order"):
+        billing.create_bill(7)
+    with pytest.raises(ValueError, match="Order 99"):
+        billing.create_bill(7, order_id=99)
+    with pytest.raises(ValueError, match="Reservation 99"):
+        billing.create_bill(7, [{"price": 1}], reservation_id=99)
+
+
+def test_invoice_is_generated_on_the_calling_thread(session, tmp_path):
+    billing = BillingController(session)
+
+    path = billing.generate_invoice(1, str(tmp_path / "invoice.pdf"))
+
+    assert path == str(tmp_path / "invoice.pdf") and (tmp_path / "invoice.pdf").read_bytes().startswith(b"%PDF-")
+    assert billing.generate_invoice(99, str(tmp_path / "missing.pdf")) is None
+
+
+def test_invoices_of_a_day_are_rendered_in_the_background(session, tmp_path, render_service):
+    billing = BillingController(session)
+
+    futures = billing.render_invoices_for_date(DAY, str(tmp_path / "invoices"), render_service=render_service)
+    submitted = billing.submit_invoice(4, str(tmp_path / "late.pdf"), render_service=render_service)
+
+    assert sorted(futures) == [1, 2]
+    for future in [*futures.values(), submitted]:
+        with open(future.result(timeout=60), "rb") as file:
+            assert file.read(5) == b"%PDF-"
+    assert sorted(path.name for path in (tmp_path / "invoices").iterdir()) == ["invoice_1.pdf", "invoice_2.pdf"]
+    assert billing.submit_invoice(99, render_service=render_service) is None
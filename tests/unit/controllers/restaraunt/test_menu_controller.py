@@ -0,0 +1,58 @@
+"""
+Tests for the menu edits in controllers/restaurant/menu_controller.py.
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from controllers.restaurant.menu_controller import MenuController
+from controllers.restaurant.order_controller import OrderController
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database.write_queue import WriteQueue
+from models import MenuItem
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(str(tmp_path / "live.db"))
+    create_tables(engine)
+    session = Session(bind=engine, expire_on_commit=False)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_menu_edits_go_through_the_write_queue(session):
+    writes = WriteQueue(session_factory=sessionmaker(bind=session.get_bind(), expire_on_commit=False))
+    queued = []
+    submit = writes.submit
+    writes.submit = lambda work: queued.append(work) or submit(work)
+    menu = MenuController(session, writes)
+
+    item_id = menu.add_menu_item("Burger", 9.5, "Mains")
+    assert menu.update_menu_item(item_id, price=10, category="Specials")
+    assert menu.update_availability(item_id, False)
+    assert not menu.update_menu_item(99, name="Ghost")
+    shake = menu.add_menu_item("Shake", 4.5, "Drinks")
+    assert menu.delete_menu_item(shake)
+    writes.stop()
+
+    assert len(queued) == 6
+    burger, = menu.get_all_menu_items()
+    assert (burger.name, burger.price_cents, burger.category, burger.available) == ("Burger", 1000, "Specials", False)
+
+
+def test_item_on_recorded_orders_is_not_deleted(session):
+    menu = MenuController(session)
+    item_id = menu.add_menu_item("Burger", 9.5, "Mains")
+    OrderController(session).create_orders([{"customer_id": 7, "items": [{"item_id": item_id}]}])
+
+    with pytest.raises(ValueError, match="unavailable"):
+        menu.delete_menu_item(item_id)
+
+    assert not session.in_transaction()
+    assert session.scalars(select(MenuItem.name)).all() == ["Burger"]
+    assert [item.item_id for item in menu.get_all_menu_items()] == [item_id]
+    assert menu.update_availability(item_id, False)
@@ -0,0 +1,146 @@
+"""
+Tests for batch order creation and the order event log in controllers/restaurant/order_controller.py.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from controllers.restaurant.order_controller import OrderController
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database.order_events import OrderStateError, transition
+from models import MenuItem, Order, OrderItem, SalesRollup
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(str(tmp_path / "orders.db"))
+    create_tables(engine)
+    session = Session(bind=engine, expire_on_commit=False)
+    session.add_all([MenuItem(item_id=1, name="Burger", price_cents=950), MenuItem(item_id=2, name="Fries", price_cents=300)])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_batch_is_created_in_input_order(session):
+    taken = datetime(2024, 5, 1, 12, 30)
+    batch = [
+        {"customer_id": 7, "items": [{"item_id": 1, "quantity": 2}]},
+        {"customer_id": 8, "items": [{"item_id": 2}, {"item_id": 1}], "total_price": 13.75, "created_at": taken},
+        {"customer_id": 9, "items": []},
+    ]
+
+    order_ids = OrderController(session).create_orders(batch)
+
+    orders = {order.order_id: order for order in session.scalars(select(Order))}
+    assert [orders[order_id].customer_id for order_id in order_ids] == [7, 8, 9]
+    assert [orders[order_id].total_cents for order_id in order_ids] == [2090, 1375, 0]  # 10% standard tax included
+    assert orders[order_ids[1]].created_at == taken
+    lines = session.execute(select(OrderItem.order_id, OrderItem.item_id, OrderItem.unit_price_cents).order_by(OrderItem.order_item_id)).all()
+    assert lines == [(order_ids[0], 1, 950), (order_ids[1], 2, 300), (order_ids[1], 1, 950)]
+    assert session.scalar(select(func.sum(SalesRollup.revenue_cents))) == 3150
+
+
+def test_batch_commits_once_with_one_insert_per_table(session):
+    statements = []
+    engine = session.get_bind()
+    capture = lambda conn, cursor, statement, *args: statements.append(statement.lstrip().split(None, 3)[:3])
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        OrderController(session).create_orders([{"customer_id": n, "items": [{"item_id": 1}, {"item_id": 2}]} for n in range(50)])
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert statements.count(["INSERT", "INTO", "orders"]) == 1
+    assert statements.count(["INSERT", "INTO", "order_items"]) == 1
+    assert session.scalar(select(func.count()).select_from(Order)) == 50
+
+
+@pytest.mark.parametrize("invalid", [
+    {"customer_id": 8, "items": [{"item_id": 99}]},
+    {"customer_id": 8, "items": [{"item_id": 1, "quantity": 0}]},
+    {"customer_id": 8, "items": [{"item_id": 1}], "total_price": 1.0},
+    {"items": [{"item_id": 1}]},
+])
+def test_invalid_order_rejects_the_whole_batch(session, invalid):
+    with pytest.raises(ValueError, match="Order 1 of the batch"):
+        OrderController(session).create_orders([{"customer_id": 7, "items": [{"item_id": 1}]}, invalid])
+    assert session.scalar(select(func.count()).select_from(Order)) == 0
+
+
+@pytest.mark.parametrize("flag, reason", [("available", "not available"), ("out_of_stock", "out of stock")])
+def test_unorderable_menu_item_rejects_the_whole_batch(session, flag, reason):
+    session.add(MenuItem(item_id=3, name="Soup", price_cents=500, **{flag: flag == "out_of_stock"}))
+    session.commit()
+
+    with pytest.raises(ValueError, match=f"Order 1 of the batch: menu item 3 is {reason}"):
+        OrderController(session).create_orders([{"customer_id": 7, "items": [{"item_id": 1}]}, {"customer_id": 8, "items": [{"item_id": 3}]}])
+    assert session.scalar(select(func.count()).select_from(Order)) == 0
+
+
+def test_stored_total_is_the_priced_total(session):
+    session.add(MenuItem(item_id=3, name="Water", price_cents=250, tax_class="exempt", discountable=False))
+    session.commit()
+    orders = OrderController(session)
+
+    order_ids = orders.create_orders([
+        {"customer_id": 7, "items": [{"item_id": 1, "quantity": 2}, {"item_id": 3}]},
+        {"customer_id": 8, "items": [{"item_id": 2}]},
+    ])
+
+    for order_id in order_ids:
+        assert orders.calculate_order_total(order_id).total_cents == session.get(Order, order_id).total_cents
+    assert session.get(Order, order_ids[0]).total_cents == 1900 + 190 + 250
+
+
+def test_single_order_goes_through_the_batch_path(session):
+    orders = OrderController(session)
+    order_id = orders.create_order(7, [{"item_id": 2, "quantity": 3}], total_price=9.9)
+    assert orders.get_order_details(order_id)["total_cents"] == 990
+    assert orders.create_orders([]) == []
+
+
+def test_status_changes_are_logged(session):
+    orders = OrderController(session)
+    order_id = orders.create_order(7, [{"item_id": 1}])
+
+    assert orders.update_order_status(order_id, "In Progress")
+    assert orders.update_order_status(order_id, "Completed")
+    assert not orders.update_order_status(99, "Completed")
+
+    assert [entry["event"] for entry in orders.get_order_history(order_id)] == ["created", "in_progress", "completed"]
+    assert orders.get_order_details(order_id)["status"] == "Completed"
+
+
+@pytest.mark.parametrize("path", [["Completed"], ["In Progress", "Pending"], ["Cancelled", "In Progress"], ["Served"]])
+def test_state_machine_rejects_invalid_transitions(session, path):
+    orders = OrderController(session)
+    order_id = orders.create_order(7, [{"item_id": 1}])
+    *allowed, rejected = path
+    for status in allowed:
+        orders.update_order_status(order_id, status)
+    before = orders.get_order_history(order_id)
+
+    with pytest.raises(OrderStateError):
+        orders.update_order_status(order_id, rejected)
+    assert orders.get_order_history(order_id) == before
+
+
+def test_open_orders_and_prep_times_come_from_the_log(session):
+    orders = OrderController(session)
+    first, second, third = orders.create_orders([{"customer_id": n, "items": [{"item_id": 1}]} for n in range(3)])
+    start = datetime(2026, 5, 1, 18, 0)
+    for order_id, minutes in ((first, 12), (second, 20)):
+        transition(session, order_id, "In Progress", at=start)
+        transition(session, order_id, "Completed", at=start + timedelta(minutes=minutes))
+    transition(session, third, "In Progress", at=start)
+    session.commit()
+
+    assert [order["order_id"] for order in orders.get_orders_by_status("In Progress")] == [third]
+    assert orders.get_prep_time_stats(start, start + timedelta(hours=1)) == {"orders": 2, "average_seconds": 960.0, "longest_seconds": 1200.0}
+    assert orders.get_prep_time_stats(start, start + timedelta(minutes=15))["orders"] == 1
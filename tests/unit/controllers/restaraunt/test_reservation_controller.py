@@ -0,0 +1,61 @@
+"""
+Tests for table assignment in controllers/restaurant/reservation_controller.py.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from controllers.restaurant.reservation_controller import ReservationController
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from models import Table
+
+EVENING = datetime(2026, 5, 1, 19)
+
+
+@pytest.fixture
+def reservations(tmp_path):
+    engine = create_db_engine(str(tmp_path / "reservations.db"))
+    create_tables(engine)
+    session = Session(bind=engine, expire_on_commit=False)
+    session.add_all([Table(table_id=1, table_number=1, capacity=2), Table(table_id=2, table_number=2, capacity=4)])
+    session.commit()
+    yield ReservationController(session)
+    session.close()
+    engine.dispose()
+
+
+def _table(reservations, reservation_id):
+    return reservations.get_reservation_details(reservation_id)["table_id"]
+
+
+def test_larger_party_is_moved_to_a_table_that_fits(reservations):
+    reservation_id = reservations.create_reservation(7, EVENING, 2)
+    assert _table(reservations, reservation_id) == 1
+
+    assert reservations.update_reservation(reservation_id, num_guests=4)
+
+    assert _table(reservations, reservation_id) == 2
+    # Table 1 is free again for the evening.
+    assert _table(reservations, reservations.create_reservation(8, EVENING, 2)) == 1
+
+
+def test_moved_reservation_keeps_its_table_and_does_not_block_itself(reservations):
+    reservation_id = reservations.create_reservation(7, EVENING, 2)
+
+    assert reservations.update_reservation(reservation_id, reservation_date=EVENING.replace(hour=20))
+
+    assert _table(reservations, reservation_id) == 1
+
+
+def test_update_without_a_free_table_is_refused(reservations):
+    reservations.create_reservation(7, EVENING, 4)
+    reservation_id = reservations.create_reservation(8, EVENING, 2)
+
+    with pytest.raises(ValueError, match="No table available"):
+        reservations.update_reservation(reservation_id, num_guests=3)
+
+    details = reservations.get_reservation_details(reservation_id)
+    assert (details["table_id"], details["num_guests"]) == (1, 2)
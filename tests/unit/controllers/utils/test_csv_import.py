@@ -0,0 +1,120 @@
+"""
+Tests for the streaming CSV import pipeline in controllers/utils/csv_import.py.
+"""
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from controllers.inventory.inventory_controller import InventoryController
+from controllers.restaurant.menu_controller import MenuController
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database.write_queue import WriteQueue
+from models import Inventory, Supplier
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(str(tmp_path / "live.db"))
+    create_tables(engine)
+    session = Session(bind=engine, expire_on_commit=False)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def write(tmp_path, text):
+    path = tmp_path / "import.csv"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_menu_import_reports_rows_and_progress(session, tmp_path):
+    menu = MenuController(session)
+    menu.add_menu_item("Burger", 9.0, "Mains")
+    path = write(tmp_path, (
+        "name,price,category,available\n"
+        "Burger,9.50,Mains,\n"
+        "Fries,3,Sides,Unavailable\n"
+        "Bad*Name,3,Sides,\n"
+        "Shake,free,Drinks,\n"
+        "Salad,-1,Mains,\n"
+        "Soup,4.25,Mains,Sold Out\n"
+        "Fries,3.25,Sides,Available\n"
+    ))
+    chunks = []
+
+    report = menu.import_menu_csv(path, chunk_size=4, progress=lambda report: chunks.append(report.rows_read))
+
+    assert chunks == [4, 7]
+    assert (report.rows_read, report.inserted, report.updated, report.failed) == (7, 1, 2, 4)
+    assert [(error.line, error.message.split()[0]) for error in report.errors] == [(4, "invalid"), (5, "price"), (6, "price"), (7, "available")]
+    items = {item.name: item for item in menu.get_all_menu_items()}
+    assert (items["Burger"].price_cents, items["Fries"].price_cents, items["Fries"].category, items["Fries"].available) == (950, 325, "Sides", True)
+
+
+def test_menu_import_writes_through_the_write_queue(session, tmp_path):
+    writes = WriteQueue(session_factory=sessionmaker(bind=session.get_bind(), expire_on_commit=False))
+    queued = []
+    submit = writes.submit
+    writes.submit = lambda work: queued.append(work) or submit(work)
+    menu = MenuController(session, writes)
+
+    report = menu.import_menu_csv(write(tmp_path, "name,price,category\nBurger,9.50,Mains\nFries,3,Sides\n"))
+    writes.stop()
+
+    assert (report.inserted, report.failed) == (2, 0)
+    assert len(queued) == 1  # the new categories and the new items in one unit
+    assert sorted(item.name for item in menu.get_all_menu_items()) == ["Burger", "Fries"]
+
+
+def test_each_menu_chunk_is_written_in_one_transaction(session, tmp_path):
+    menu = MenuController(session)
+    menu.add_menu_item("Burger", 9.0, "Mains")
+    commits = []
+    event.listen(session.get_bind(), "commit", lambda conn: commits.append(1))
+    path = write(tmp_path, "name,price,category\nBurger,9.50,Grill\nFries,3,Sides\nShake,4,Drinks\nSoup,4.25,Mains\n")
+
+    report = menu.import_menu_csv(path, chunk_size=2)
+
+    assert len(commits) == 2
+    assert (report.inserted, report.updated) == (3, 1)
+    assert {item.name: item.category for item in menu.get_all_menu_items()} == {"Burger": "Grill", "Fries": "Sides", "Shake": "Drinks", "Soup": "Mains"}
+
+
+@pytest.mark.parametrize("text", ["name,cost\nBurger,9\n", "name,cost\n", ""])
+def test_menu_import_requires_the_header_columns(session, tmp_path, text):
+    with pytest.raises(ValueError, match="price"):
+        MenuController(session).import_menu_csv(write(tmp_path, text))
+
+
+def test_prices_must_be_finite_whole_cents(session, tmp_path):
+    path = write(tmp_path, "name,price\nBurger,9.50\nFries,0.001\nShake,sNaN\nSoup,Infinity\nSalad,4.250\n")
+
+    report = MenuController(session).import_menu_csv(path)
+
+    assert (report.inserted, report.failed) == (2, 3)
+    assert [error.message for error in report.errors] == [
+        "price '0.001' is not a whole number of cents", "price 'sNaN' is not a positive amount", "price 'Infinity' is not a positive amount",
+    ]
+
+
+def test_quantities_must_be_ascii_digits(session, tmp_path):
+    path = write(tmp_path, "name,quantity\nFlour,40\nSugar,²\nSalt,٣\nYeast,-1\n")
+
+    report = InventoryController(session).import_inventory_csv(path)
+
+    assert (report.inserted, report.failed) == (1, 3)
+    assert [error.line for error in report.errors] == [3, 4, 5]
+
+
+def test_price_list_updates_prices_and_keeps_stock(session, tmp_path):
+    inventory = InventoryController(session)
+    inventory.import_inventory_csv(write(tmp_path, "name,quantity,price,supplier,expiration_date\nFlour,40,1.10,Mill Co,\nYeast,5,0.40,,2099-01-31\n"))
+
+    report = inventory.import_inventory_csv(write(tmp_path, "name,price,supplier\nFlour,1.25,Mill Co\nSugar,0.90,Sweet Ltd\nSalt,,Sweet Ltd\n"))
+
+    assert (report.inserted, report.updated, report.failed) == (1, 1, 1)
+    rows = session.execute(select(Inventory.name, Inventory.quantity, Inventory.price, Supplier.name).outerjoin(Supplier).order_by(Inventory.name)).all()
+    assert [tuple(row) for row in rows] == [("Flour", 40, 1.25, "Mill Co"), ("Sugar", 0, 0.9, "Sweet Ltd"), ("Yeast", 5, 0.4, None)]
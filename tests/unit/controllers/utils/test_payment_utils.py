@@ -0,0 +1,53 @@
+"""
+Tests for the integer-cents money functions in controllers/utils/payment_utils.py.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from controllers.utils.payment_utils import (
+    OrderTotals,
+    calculate_discount,
+    calculate_order_totals,
+    calculate_tax,
+    format_currency,
+    from_cents,
+    to_cents,
+)
+
+
+@pytest.mark.parametrize("amount, cents", [(0.1 + 0.2, 30), ("19.995", 2000), (Decimal("12.5"), 1250), (1.005, 101), (-2.5, -250)])
+def test_to_cents_converts_exactly(amount, cents):
+    assert to_cents(amount) == cents
+
+
+def test_from_cents_is_exact():
+    assert from_cents(1250) == Decimal("12.50")
+
+
+def test_rates_round_half_up_once():
+    assert calculate_tax(2885, 0.1) == 289   # 288.5
+    assert calculate_discount(3235, 0.1) == 324   # 323.5
+    assert calculate_tax(-1005, 0.1) == -101
+
+
+def test_order_totals_round_each_charge_once():
+    lines = [(995, 3), (10, 3)] * 1000
+
+    totals = calculate_order_totals(lines, tax_rate=0.0825, discount_rate=0.1, service_rate=0.125)
+
+    assert totals.subtotal_cents == 3_015_000
+    assert totals.discount_cents == 301_500
+    assert totals.service_charge_cents == 339_188   # 339_187.5
+    assert totals.tax_cents == 251_847   # 251_846.76
+    assert totals.total_cents == 3_015_000 - 301_500 + 339_188 + 251_847
+
+
+def test_fixed_discount_is_capped_at_subtotal():
+    assert calculate_order_totals([(500, 1)], discount_cents=800, tax_rate=0.1) == OrderTotals(500, 500, 0, 0, 0)
+
+
+@pytest.mark.parametrize("cents, text", [(12345, "$123.45"), (5, "$0.05"), (123456789, "$1,234,567.89"), (-250, "-$2.50")])
+def test_format_currency(cents, text):
+    assert format_currency(cents) == text
@@ -0,0 +1,108 @@
+"""
+Tests for the streamed table reports in controllers/utils/pdf_report_utils.py.
+"""
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Paragraph
+
+from controllers.utils.pdf_report_utils import generate_sales_summary_pdf, register_report_fonts, write_table_pdf
+
+HEADERS = ["Order", "Customer", "Total"]
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    """
+    Records the text drawn on each page of the reports written during the test, in drawing order.
+    """
+    drawn = [[]]
+
+    def record(draw):
+        def spy(self, x, y, text, *args, **kwargs):
+            drawn[-1].append(text)
+            return draw(self, x, y, text, *args, **kwargs)
+        return spy
+
+    def show_page(self):
+        drawn.append([])
+        return original_show_page(self)
+
+    def draw_paragraph(self, canvas, x, y, *args, **kwargs):
+        drawn[-1].append(self.getPlainText())
+        return original_draw_on(self, canvas, x, y, *args, **kwargs)
+
+    original_show_page, original_draw_on = Canvas.showPage, Paragraph.drawOn
+    monkeypatch.setattr(Canvas, "drawString", record(Canvas.drawString))
+    monkeypatch.setattr(Canvas, "drawCentredString", record(Canvas.drawCentredString))
+    monkeypatch.setattr(Canvas, "showPage", show_page)
+    monkeypatch.setattr(Paragraph, "drawOn", draw_paragraph)
+    yield drawn
+    assert drawn[-1] == []  # every page was closed with showPage()
+
+
+def test_rows_are_split_into_pages_with_repeated_headers(tmp_path, pages):
+    path = tmp_path / "orders.pdf"
+    rows = ((i, f"Customer {i}", f"${i}.00") for i in range(100))
+
+    page_count = write_table_pdf(rows, HEADERS, str(path), title="Order Report")
+
+    pages = pages[:-1]
+    assert page_count == len(pages) == 3
+    assert path.read_bytes().startswith(b"%PDF") and path.read_bytes().count(b"/Type /Page\n") == 3
+    assert pages[0][:4] == ["Order Report", *HEADERS]
+    assert all(page[:3] == HEADERS and page[-1] == f"Page {number}" for number, page in enumerate(pages[1:], start=2))
+    cells = [text for page in pages for text in page if text not in HEADERS and not text.startswith(("Page ", "Order Report"))]
+    assert cells == [str(value) for i in range(100) for value in (i, f"Customer {i}", f"${i}.00")]
+
+
+def test_full_last_page_is_not_followed_by_an_empty_one(tmp_path, pages):
+    write_table_pdf([(i, "", "") for i in range(100)], HEADERS, str(tmp_path / "probe.pdf"))
+    rows_per_page = (len(pages[0]) - len(HEADERS) - 1) // len(HEADERS)
+    pages[:] = [[]]
+
+    assert write_table_pdf([(i, "", "") for i in range(2 * rows_per_page)], HEADERS, str(tmp_path / "full.pdf")) == 2
+    assert len(pages) == 3 and pages[1][-1] == "Page 2"
+
+
+def test_empty_report_has_a_header_page(tmp_path, pages):
+    path = tmp_path / "empty.pdf"
+
+    assert write_table_pdf(iter(()), HEADERS, str(path)) == 1
+    assert pages == [[*HEADERS, "Page 1"], []]
+
+
+def test_text_is_kept_in_any_script_with_an_embedded_unicode_font(tmp_path, pages):
+    path = tmp_path / "names.pdf"
+    names = ["Grüße", "Борщ", "Ελληνικά", "Crème brûlée €5"]
+
+    write_table_pdf([(i, name, None) for i, name in enumerate(names)], HEADERS, str(path))
+
+    assert [page[4::3] for page in pages[:1]] == [names]
+    data = path.read_bytes()
+    assert b"/FontFile2" in data and b"/ToUnicode" in data  # an embedded TrueType subset
+    assert register_report_fonts() == ("ReportSans", "ReportSans-Bold")
+
+
+def test_overflowing_cells_are_truncated(tmp_path, pages):
+    path = tmp_path / "long.pdf"
+
+    write_table_pdf([(1, "Grüße " * 20, None)], HEADERS, str(path), column_widths=[50, 100, 50])
+
+    _, _, _, _, name, total, _ = pages[0]
+    assert name.startswith("Grüße Grüße") and name.endswith("…") and len(name) < 30
+    assert total == ""
+
+
+def test_sales_summary_accepts_a_generator(tmp_path, pages):
+    path = tmp_path / "sales.pdf"
+    sales = ({"date": f"2026-05-{day:02d}", "amount": f"${day}00.00", "items_sold": day} for day in range(1, 31))
+
+    generate_sales_summary_pdf(sales, str(path))
+
+    page, _ = pages
+    assert page[:4] == ["Sales Summary Report", "Date", "Amount", "Items Sold"]
+    assert page[-4:-1] == ["2026-05-30", "$3000.00", "30"]
@@ -0,0 +1,94 @@
+"""
+Tests for the vectorized order pricing in controllers/utils/pricing_engine.py.
+"""
+
+import random
+
+import pytest
+from sqlalchemy.orm import Session
+
+pytest.importorskip("numpy")
+
+from controllers.restaurant.billing_controller import BillingController
+from controllers.restaurant.order_controller import OrderController
+from controllers.utils.payment_utils import OrderTotals, calculate_order_totals
+from controllers.utils.pricing_engine import lines_from_items, price_orders
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from models import Billing, Discount, MenuItem, Order
+
+
+def test_single_tax_class_matches_calculate_order_totals():
+    rng = random.Random(3)
+    for _ in range(200):
+        items = [{"price_cents": rng.randint(1, 5000), "quantity": rng.randint(1, 9)} for _ in range(rng.randint(1, 8))]
+        rates = {"tax_rate": rng.choice([0.0, 0.05, 0.0825, 0.2]), "discount_rate": rng.choice([0.0, 0.1, 0.125]),
+                 "discount_cents": rng.choice([0, 99, 10_000]), "service_rate": rng.choice([0.0, 0.1, 0.125])}
+        expected = calculate_order_totals(((item["price_cents"], item["quantity"]) for item in items), **rates)
+
+        lines = lines_from_items(items, discount_rate=rates["discount_rate"])
+        priced = price_orders(lines, {"standard": rates["tax_rate"]}, rates["discount_cents"], rates["service_rate"])
+
+        assert priced.totals(0) == expected
+
+
+def test_tax_classes_and_discount_eligibility():
+    items = [
+        {"price_cents": 1000, "quantity": 2, "tax_class": "standard"},
+        {"price_cents": 1000, "tax_class": "reduced"},
+        {"price_cents": 500, "tax_class": "exempt", "discountable": False},
+    ]
+    priced = price_orders(lines_from_items(items, discount_rate=0.1), {"standard": 0.2, "reduced": 0.05, "exempt": 0.0})
+
+    # 10% off the 3000 discountable cents; standard is taxed on 1800, reduced on 900.
+    assert priced.totals(0) == OrderTotals(3500, 300, 0, 360 + 45, 3200 + 405)
+
+
+def test_unknown_tax_class_is_rejected():
+    with pytest.raises(ValueError, match="luxury"):
+        price_orders(lines_from_items([{"price_cents": 100, "tax_class": "luxury"}]))
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(str(tmp_path / "pricing.db"))
+    create_tables(engine)
+    session = Session(bind=engine, expire_on_commit=False)
+    session.add_all([
+        MenuItem(item_id=1, name="Burger", price_cents=950),
+        MenuItem(item_id=2, name="Water", price_cents=200, tax_class="exempt", discountable=False),
+        Discount(discount_id=1, code="TEN", percentage=10),
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_orders_are_priced_from_their_line_items(session):
+    orders = OrderController(session)
+    plain, discounted, empty = orders.create_orders([
+        {"customer_id": 7, "items": [{"item_id": 1, "quantity": 2}, {"item_id": 2}]},
+        {"customer_id": 8, "items": [{"item_id": 1}, {"item_id": 2}]},
+        {"customer_id": 9, "items": []},
+    ])
+    session.get(Order, discounted).discount_id = 1
+    session.get(MenuItem, 1).price_cents = 1000
+    session.commit()
+
+    priced = orders.price_orders([plain, discounted, empty, 99])
+
+    assert set(priced) == {plain, discounted, empty}
+    assert priced[plain] == OrderTotals(2100, 0, 0, 190, 2290)
+    assert priced[discounted] == OrderTotals(1150, 95, 0, 86, 1141)
+    assert priced[empty] == OrderTotals(0, 0, 0, 0, 0)
+    assert orders.price_orders([plain], use_menu_prices=True)[plain].subtotal_cents == 2200
+    assert orders.calculate_order_total(plain) == priced[plain]
+    assert orders.calculate_order_total(99) is None
+
+
+def test_bill_uses_the_pricing_engine(session):
+    bill_id = BillingController(session).create_bill(7, [{"price": 9.5, "quantity": 2}, {"price_cents": 200, "tax_class": "exempt"}], tax_rate=0.2, discount=1)
+    bill = session.get(Billing, bill_id)
+    # The 100 cent discount is split 91/9 between the classes, so 20% tax is due on 1809.
+    assert (bill.subtotal_cents, bill.discount_cents, bill.tax_cents, bill.total_cents) == (2100, 100, 362, 2362)
@@ -0,0 +1,99 @@
+"""
+Tests for the process-pool document rendering in controllers/utils/render_service.py.
+"""
+
+import os
+import queue
+import signal
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from controllers.utils.render_service import RenderService
+
+INVOICE = {"logo": None, "header": "Invoice #1", "items": [{"description": "1 x Burger", "price": "$9.50"}], "total": "$9.50"}
+RECEIPT = {
+    "order_code": "A-1",
+    "customer": {"name": "Sam", "address": "1 Main St", "phone": "555-0100"},
+    "items": [{"description": "Burger", "price": "$9.50"}],
+    "payment_method": "Cash",
+    "total_amount": "$9.50",
+}
+
+
+@pytest.fixture
+def service():
+    service = RenderService(max_workers=2, max_pending=2)
+    yield service
+    service.stop()
+
+
+def test_documents_are_rendered_in_worker_processes(service, tmp_path):
+    invoice = service.submit("invoice", 1, INVOICE, str(tmp_path / "invoice.pdf"))
+    receipt = service.submit("receipt", 1, RECEIPT, str(tmp_path / "receipt.pdf"))
+
+    for future in (invoice, receipt):
+        path = future.result(timeout=60)
+        with open(path, "rb") as file:
+            assert file.read(5) == b"%PDF-"
+
+
+def test_pending_document_of_a_bill_is_not_queued_twice(service, tmp_path):
+    # The workers take a moment to start, so the first request is still pending.
+    first = service.submit("invoice", 1, INVOICE, str(tmp_path / "first.pdf"))
+    again = service.submit("invoice", 1, INVOICE, str(tmp_path / "first.pdf"))
+
+    assert again is first
+    assert first.result(timeout=60).endswith("first.pdf")
+    # Once rendered, the invoice can be rendered again.
+    assert service.submit("invoice", 1, INVOICE, str(tmp_path / "first.pdf")).result(timeout=60).endswith("first.pdf")
+
+
+def test_same_document_for_another_file_is_rendered_too(service, tmp_path):
+    first = service.submit("invoice", 1, INVOICE, str(tmp_path / "first.pdf"))
+    second = service.submit("invoice", 1, INVOICE, str(tmp_path / "second.pdf"))
+
+    assert second is not first
+    assert first.result(timeout=60).endswith("first.pdf") and second.result(timeout=60).endswith("second.pdf")
+    assert (tmp_path / "first.pdf").exists() and (tmp_path / "second.pdf").exists()
+
+
+def test_full_backlog_blocks_until_a_slot_frees(service, tmp_path):
+    futures = [service.submit("invoice", bill_id, INVOICE, str(tmp_path / f"{bill_id}.pdf")) for bill_id in (1, 2)]
+
+    with pytest.raises(queue.Full):
+        service.submit("invoice", 3, INVOICE, str(tmp_path / "3.pdf"), timeout=0.01)
+    # A request for a pending document needs no slot.
+    assert service.submit("invoice", 2, INVOICE, str(tmp_path / "2.pdf"), timeout=0.01) is futures[1]
+    assert service.submit("invoice", 3, INVOICE, str(tmp_path / "3.pdf")).result(timeout=60).endswith("3.pdf")
+
+
+def test_failed_render_frees_its_slot(service, tmp_path):
+    broken = service.submit("invoice", 1, {"items": []}, str(tmp_path / "broken.pdf"))
+
+    with pytest.raises(KeyError):
+        broken.result(timeout=60)
+    many = service.render_many([
+        *(("invoice", bill_id, INVOICE, str(tmp_path / f"{bill_id}.pdf")) for bill_id in range(2, 6)),
+        ("receipt", 2, RECEIPT, str(tmp_path / "receipt_2.pdf")),
+    ])
+    assert sorted(many) == [("invoice", 2), ("invoice", 3), ("invoice", 4), ("invoice", 5), ("receipt", 2)]
+    assert all(future.result(timeout=60) for future in many.values())
+
+
+def test_pool_is_replaced_after_a_worker_dies(service, tmp_path):
+    lost = service.submit("invoice", 1, INVOICE, str(tmp_path / "lost.pdf"))
+    for worker in list(service._pool._processes.values()):
+        os.kill(worker.pid, signal.SIGKILL)
+
+    with pytest.raises(BrokenProcessPool):
+        lost.result(timeout=60)
+    assert service.submit("invoice", 1, INVOICE, str(tmp_path / "again.pdf")).result(timeout=60).endswith("again.pdf")
+    assert service.submit("receipt", 2, RECEIPT, str(tmp_path / "receipt.pdf")).result(timeout=60).endswith("receipt.pdf")
+
+
+def test_unknown_document_kind_is_rejected(service, tmp_path):
+    with pytest.raises(ValueError, match="menu"):
+        service.submit("menu", 1, {}, str(tmp_path / "menu.pdf"))
@@ -0,0 +1,19 @@
+"""
+Tests for the menu input checks in controllers/validation/menu_validation.py.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from controllers.validation.menu_validation import validate_price
+
+
+@pytest.mark.parametrize("price", [9.99, 3, Decimal("0.01")])
+def test_positive_prices_are_valid(price):
+    assert validate_price(price)
+
+
+@pytest.mark.parametrize("price", [0, -5.0, float("nan"), float("inf"), Decimal("NaN"), Decimal("sNaN"), Decimal("-Infinity"), True, "9.99"])
+def test_other_prices_are_invalid(price):
+    assert not validate_price(price)
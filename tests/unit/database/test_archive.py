@@ -0,0 +1,111 @@
+"""
+Tests for hot/cold archival in database/archive.py.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from controllers.restaurant.billing_controller import BillingController
+from controllers.restaurant.order_controller import OrderController
+from database.archive import archive_old_records, archived_orders
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from models import Billing, MenuItem, Order, OrderEvent, OrderItem, Reservation, Table
+
+OLD = datetime.now() - timedelta(days=400)
+RECENT = datetime.now() - timedelta(days=3)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_db_engine(str(tmp_path / "live.db"))
+    create_tables(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    session = Session(bind=engine)
+    session.add_all([
+        MenuItem(item_id=1, name="Burger", price_cents=950),
+        Table(table_id=1, table_number=1, capacity=4),
+        # Closed, old and paid: moves to the archive together with its bill, line items and events.
+        Order(order_id=1, customer_id=7, status="Completed", total_cents=950, created_at=OLD),
+        OrderItem(order_id=1, item_id=1, quantity=1, unit_price_cents=950),
+        OrderEvent(order_id=1, event="created", created_at=OLD),
+        OrderEvent(order_id=1, event="completed", created_at=OLD),
+        Billing(bill_id=1, customer_id=7, order_id=1, total_cents=950, status="Paid", created_at=OLD),
+        # Old but still unpaid: the bill and its order stay live.
+        Order(order_id=2, customer_id=7, status="Completed", total_cents=1900, created_at=OLD),
+        Billing(bill_id=2, customer_id=7, order_id=2, total_cents=1900, status="Unpaid", created_at=OLD),
+        # Recent: stays live.
+        Order(order_id=3, customer_id=7, status="Completed", total_cents=500, created_at=RECENT),
+        Reservation(reservation_id=1, customer_id=7, table_id=1, reservation_date=OLD, num_guests=2),
+        Reservation(reservation_id=2, customer_id=7, table_id=1, reservation_date=RECENT, num_guests=2),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_archive_moves_closed_old_records(session, tmp_path):
+    moved = archive_old_records(session, 365, str(tmp_path / "archive.db"))
+
+    assert moved == {"billing": 1, "order_items": 1, "order_events": 2, "orders": 1, "reservations": 1}
+    assert [order["order_id"] for order in OrderController(session).get_customer_orders(7)] == [3, 2]
+    assert [bill["bill_id"] for bill in BillingController(session).get_billing_history(7)] == [2]
+
+
+def test_history_includes_archive_on_request(session, tmp_path):
+    archive_old_records(session, 365, str(tmp_path / "archive.db"))
+
+    orders = OrderController(session).get_customer_orders(7, include_archive=True)
+    bills = BillingController(session).get_billing_history(7, include_archive=True)
+
+    assert sorted(order["order_id"] for order in orders) == [1, 2, 3]
+    assert orders[0]["order_id"] == 3 and isinstance(orders[0]["created_at"], datetime)
+    assert sorted(bill["bill_id"] for bill in bills) == [1, 2]
+
+
+def test_rerunning_archive_is_a_no_op(session, tmp_path):
+    archive_old_records(session, 365, str(tmp_path / "archive.db"))
+
+    assert archive_old_records(session, 365, str(tmp_path / "archive.db")) == {"billing": 0, "order_items": 0, "order_events": 0, "orders": 0, "reservations": 0}
+
+
+def test_history_without_archive_file_reads_live_tables_only(session):
+    orders = OrderController(session).get_customer_orders(7, include_archive=True)
+
+    assert sorted(order["order_id"] for order in orders) == [1, 2, 3]
+
+
+def test_archived_ids_are_not_reused(session, tmp_path):
+    archive = str(tmp_path / "archive.db")
+    archive_old_records(session, 0, archive)  # moves the newest order, 3
+
+    new_id, = OrderController(session).create_orders([{"customer_id": 8, "items": [{"item_id": 1}]}])
+    assert new_id == 4
+    session.query(Order).filter(Order.order_id == new_id).update({"status": "Completed", "created_at": OLD})
+    session.commit()
+    archive_old_records(session, 0, archive)
+
+    orders = OrderController(session).get_customer_orders(8, include_archive=True)
+    assert [(order["order_id"], order["total_cents"]) for order in orders] == [(4, 1045)]
+    assert [order["order_id"] for order in OrderController(session).get_customer_orders(7, include_archive=True)] == [3, 2, 1]
+
+
+def test_live_row_reusing_an_archived_id_is_not_lost(session, tmp_path):
+    archive = str(tmp_path / "archive.db")
+    archive_old_records(session, 365, archive)
+    # A database created before AUTOINCREMENT could hand out an archived id again.
+    session.execute(archived_orders.update().where(archived_orders.c.order_id == 1).values(order_id=3, customer_id=9))
+    session.commit()
+
+    with pytest.raises(ValueError, match="reuse ids"):
+        archive_old_records(session, 0, archive)
+
+    assert session.get(Order, 3) is not None
+    assert session.get(Billing, 2) is not None
@@ -0,0 +1,72 @@
+"""
+Tests for the bulk loads in database/bulk.py.
+"""
+
+import gzip
+import json
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from controllers.restaurant.menu_controller import MenuController
+from database.bulk import BulkPersistenceService
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database.menu_publisher import get_menu_publisher
+from models import Inventory, MenuItem, Order, OrderEvent, OrderItem
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(str(tmp_path / "bulk.db"))
+    create_tables(engine)
+    session = Session(bind=engine)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_upsert_counts_inserted_and_updated_rows(session):
+    bulk = BulkPersistenceService(session, batch_size=2)
+    bulk.bulk_insert(Inventory, [{"name": "Buns", "quantity": 40}])
+
+    counts = bulk.bulk_upsert(Inventory, [{"name": "Buns", "quantity": 10}, {"name": "Lettuce", "quantity": 5}, {"name": "Onions", "quantity": 8}])
+
+    assert counts == {"inserted": 2, "updated": 1}
+    assert dict(session.execute(select(Inventory.name, Inventory.quantity).order_by(Inventory.name)).all()) == {"Buns": 10, "Lettuce": 5, "Onions": 8}
+
+
+@pytest.mark.parametrize("model, row", [
+    (Order, {"order_id": 1, "customer_id": 7, "total_cents": 950}),
+    (OrderItem, {"order_id": 1, "item_id": 1, "quantity": 1, "unit_price_cents": 950}),
+])
+def test_orders_must_be_created_through_the_order_controller(session, model, row):
+    bulk = BulkPersistenceService(session)
+
+    for load in (bulk.bulk_insert, bulk.bulk_upsert):
+        with pytest.raises(ValueError, match="OrderController.create_orders"):
+            load(model, [row])
+
+    assert session.scalar(select(func.count()).select_from(model)) == 0
+    assert session.scalar(select(func.count()).select_from(OrderEvent)) == 0
+
+
+def test_menu_loads_republish_the_menu_and_recompute_stock(session, tmp_path):
+    session.add(Inventory(item_id=1, name="Buns", quantity=0))
+    session.commit()
+    menu = MenuController(session)
+    burger = menu.add_menu_item("Burger", 9.5, "Mains")
+    menu.set_recipe(burger, {1: 1})
+    publisher = get_menu_publisher(session)
+    publisher.output_dir = str(tmp_path / "public")
+    publisher.publish(session)
+
+    BulkPersistenceService(session).bulk_upsert(MenuItem, [
+        {"item_id": burger, "name": "Burger", "price_cents": 1000, "out_of_stock": False},
+        {"item_id": burger + 1, "name": "Fries", "price_cents": 300, "out_of_stock": True},
+    ])
+
+    assert dict(session.execute(select(MenuItem.name, MenuItem.out_of_stock)).all()) == {"Burger": True, "Fries": False}
+    published = json.loads(gzip.decompress((tmp_path / "public" / "menu.json.gz").read_bytes()))
+    assert published["items"] == [[burger, "Burger", 1000, "Mains", False], [burger + 1, "Fries", 300, None, True]]
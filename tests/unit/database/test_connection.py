@@ -0,0 +1,110 @@
+"""
+Tests for the engines and session registries in database/connection.py.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from controllers.reports.sales_report_controller import SalesReportController
+from controllers.restaurant.order_controller import OrderController
+from database import connection
+from database.connection import close_readonly_session, close_session, get_engine, get_readonly_session, get_session, init_engine
+from database.create_tables import create_tables
+from models import MenuItem
+
+
+@pytest.fixture
+def app_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(connection, "_engine", None)
+    monkeypatch.setattr(connection, "_readonly_engine", None)
+    engine = init_engine(str(tmp_path / "app.db"))
+    create_tables(engine)
+    session = get_session()
+    session.add(MenuItem(item_id=1, name="Burger", price_cents=950))
+    session.commit()
+    yield session
+    close_readonly_session()
+    close_session()
+    connection.get_readonly_engine().dispose()
+    engine.dispose()
+
+
+def _place(session, placed_at):
+    OrderController(session).create_orders([{"customer_id": 7, "items": [{"item_id": 1}], "created_at": placed_at}])
+
+
+def test_each_report_reads_newly_committed_orders(app_db):
+    reports = SalesReportController()
+    day = (datetime(2026, 3, 1), datetime(2026, 3, 2))
+
+    _place(app_db, datetime(2026, 3, 1, 12, 15))
+    assert reports.get_total_sales(*day) == 950
+    _place(app_db, datetime(2026, 3, 1, 13, 15))
+    assert reports.get_total_sales(*day) == 1900
+    assert reports.get_top_selling_items()[0]["quantity"] == 2
+    # The report's read transaction is over, so a checkpoint can reset the whole WAL.
+    with get_engine().connect() as conn:
+        busy, _, _ = conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)").one()
+    assert busy == 0
+
+
+def test_caller_session_is_left_open(app_db):
+    session = get_readonly_session()
+
+    SalesReportController(session).get_total_sales(datetime(2026, 3, 1), datetime(2026, 3, 2))
+
+    assert session.in_transaction() and get_readonly_session() is session
+
+
+def test_report_session_rejects_writes(app_db):
+    with pytest.raises(OperationalError, match="readonly"):
+        get_readonly_session().execute(text("INSERT INTO menu_items (name, price_cents) VALUES ('Fries', 300)"))
+
+
+def test_pragmas_are_applied_to_every_connection(app_db):
+    with get_engine().connect() as conn:
+        pragmas = {name: conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in ("journal_mode", "busy_timeout", "foreign_keys", "synchronous")}
+    with connection.get_readonly_engine().connect() as conn:
+        query_only = conn.exec_driver_sql("PRAGMA query_only").scalar()
+
+    assert pragmas == {"journal_mode": "wal", "busy_timeout": 5000, "foreign_keys": 1, "synchronous": 1}
+    assert query_only == 1
+
+
+@pytest.mark.parametrize("begin, locked", [("IMMEDIATE", True), ("DEFERRED", False)])
+def test_sqlite_begin_option_chooses_the_transaction_type(app_db, begin, locked):
+    engine = get_engine().execution_options(sqlite_begin=begin)
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SELECT 1")
+        # A second writer can only start while the first transaction holds no write lock.
+        other = get_engine().raw_connection()
+        try:
+            other.execute("PRAGMA busy_timeout=0")
+            if locked:
+                with pytest.raises(sqlite3.OperationalError, match="locked"):
+                    other.execute("BEGIN IMMEDIATE")
+            else:
+                other.execute("BEGIN IMMEDIATE")
+                other.rollback()
+        finally:
+            other.close()
+        conn.rollback()
+
+
+def test_readonly_session_is_scoped_to_the_thread(app_db):
+    session = get_readonly_session()
+    other_thread = []
+    thread = threading.Thread(target=lambda: other_thread.append(get_readonly_session()))
+    thread.start()
+    thread.join()
+
+    assert get_readonly_session() is session
+    assert other_thread[0] is not session
+    assert session.get_bind() is connection.get_readonly_engine() is not get_engine()
+    close_readonly_session()
+    assert get_readonly_session() is not session
@@ -0,0 +1,122 @@
+"""
+Tests for the keyset-paginated and streamed customer history in database/history.py.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from controllers.restaurant.billing_controller import BillingController
+from controllers.restaurant.order_controller import OrderController
+from database.archive import archive_old_records
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database.history import decode_cursor, encode_cursor
+from models import Billing, Order
+
+NOW = datetime(2026, 5, 1, 19, 0)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_db_engine(str(tmp_path / "history.db"))
+    create_tables(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    session = Session(bind=engine)
+    # Orders 1-30 of customer 7, three at each instant, so pages end in the middle of ties.
+    session.add_all([
+        Order(order_id=order_id, customer_id=7, status="Completed", total_cents=100, created_at=NOW - timedelta(hours=order_id // 3))
+        for order_id in range(1, 31)
+    ])
+    session.add_all([Order(order_id=31, customer_id=8, total_cents=100, created_at=NOW)])
+    session.add_all([
+        Billing(bill_id=bill_id, customer_id=7, total_cents=100, status="Paid", created_at=NOW - timedelta(days=bill_id))
+        for bill_id in range(1, 6)
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def _newest_first(session):
+    orders = session.query(Order).filter(Order.customer_id == 7)
+    return [order.order_id for order in sorted(orders, key=lambda order: (order.created_at, order.order_id), reverse=True)]
+
+
+def _all_pages(fetch, limit):
+    ids, cursor, pages = [], None, 0
+    while True:
+        page = fetch(cursor, limit)
+        ids += [item.get("order_id", item.get("bill_id")) for item in page.items]
+        pages += 1
+        if page.next_cursor is None:
+            return ids, pages
+        cursor = page.next_cursor
+
+
+def test_pages_cover_the_history_once_across_ties(session):
+    orders = OrderController(session)
+
+    ids, pages = _all_pages(lambda cursor, limit: orders.get_customer_orders_page(7, cursor, limit), 4)
+
+    assert ids == _newest_first(session)
+    assert pages == 8
+    assert [order["order_id"] for order in orders.get_customer_orders(7)] == ids
+
+
+def test_last_page_has_no_cursor(session):
+    page = OrderController(session).get_customer_orders_page(7, limit=30)
+
+    assert len(page.items) == 30 and page.next_cursor is None
+
+
+def test_pages_do_not_use_offset(engine, session):
+    orders = OrderController(session)
+    first = orders.get_customer_orders_page(7, limit=5)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, parameters, *args: statements.append(parameters))
+
+    orders.get_customer_orders_page(7, first.next_cursor, limit=5)
+
+    # SQLite renders "LIMIT ? OFFSET ?"; the page starts from the cursor, so no rows are skipped.
+    assert [parameters[-2:] for parameters in statements] == [(6, 0)]
+
+
+def test_pages_merge_the_archive(session, tmp_path):
+    session.query(Order).filter(Order.order_id > 20, Order.customer_id == 7).update({"created_at": NOW - timedelta(days=400)})
+    session.query(Billing).filter(Billing.bill_id > 3).update({"created_at": NOW - timedelta(days=400)})
+    session.commit()
+    expected = _newest_first(session)
+    archive_old_records(session, 365, str(tmp_path / "archive.db"))
+    orders, bills = OrderController(session), BillingController(session)
+
+    live, _ = _all_pages(lambda cursor, limit: orders.get_customer_orders_page(7, cursor, limit), 7)
+    merged, _ = _all_pages(lambda cursor, limit: orders.get_customer_orders_page(7, cursor, limit, include_archive=True), 7)
+    billed, _ = _all_pages(lambda cursor, limit: bills.get_billing_history_page(7, cursor, limit, include_archive=True), 2)
+
+    assert live == expected[:20]
+    assert merged == expected
+    assert billed == [1, 2, 3, 5, 4]  # 4 and 5 were created at the same instant
+
+
+def test_streaming_yields_the_full_history(session):
+    orders, bills = OrderController(session), BillingController(session)
+
+    assert [order["order_id"] for order in orders.iter_customer_orders(7, batch_size=4)] == _newest_first(session)
+    assert [bill["bill_id"] for bill in bills.iter_billing_history(7, batch_size=2)] == [1, 2, 3, 4, 5]
+
+
+def test_cursor_round_trip_and_invalid_input(session):
+    assert decode_cursor(encode_cursor(NOW, 12)) == (NOW, 12)
+    orders = OrderController(session)
+    with pytest.raises(ValueError, match="cursor"):
+        orders.get_customer_orders_page(7, "not-a-cursor")
+    with pytest.raises(ValueError, match="limit"):
+        orders.get_customer_orders_page(7, limit=0)
@@ -0,0 +1,155 @@
+"""
+Tests for the kitchen queue in database/kitchen_queue.py.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from controllers.restaurant.order_controller import OrderController
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database import kitchen_queue
+from database.kitchen_queue import PROMISE_MINUTES, get_kitchen_queue
+from models import MenuItem
+
+NOW = datetime(2026, 5, 1, 19, 0)
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(str(tmp_path / "kitchen.db"))
+    create_tables(engine)
+    session = Session(bind=engine, expire_on_commit=False)
+    session.add_all([MenuItem(item_id=1, name="Soup", price_cents=500), MenuItem(item_id=2, name="Steak", price_cents=2400)])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _order(promised_minutes, *courses):
+    return {
+        "customer_id": 7,
+        "created_at": NOW,
+        "promised_at": NOW + timedelta(minutes=promised_minutes),
+        "items": [{"item_id": course, "course": course} for course in courses],
+    }
+
+
+def _keys(tickets):
+    return [(ticket.order_id, ticket.course) for ticket in tickets]
+
+
+def test_tickets_are_ordered_by_promised_time_then_course(session):
+    orders = OrderController(session)
+    late, early = orders.create_orders([_order(30, 1, 2), _order(10, 2, 1)])
+    default, = orders.create_orders([{"customer_id": 8, "created_at": NOW, "items": [{"item_id": 1, "quantity": 2}]}])
+
+    tickets = get_kitchen_queue(session).tickets(session=session)
+
+    assert _keys(tickets) == [(early, 1), (early, 2), (default, 1), (late, 1), (late, 2)]
+    assert tickets[2].promised_at == NOW + timedelta(minutes=PROMISE_MINUTES)
+    assert tickets[2].items == (("Soup", 2),)
+    assert _keys(get_kitchen_queue(session).tickets(limit=2)) == [(early, 1), (early, 2)]
+
+
+def test_controller_changes_update_the_loaded_queue(session):
+    orders = OrderController(session)
+    kitchen = get_kitchen_queue(session)
+    first, = orders.create_orders([_order(10, 1)])
+    kitchen.load(session)
+
+    second, = orders.create_orders([_order(5, 1)])
+    orders.update_order_status(first, "In Progress")
+    assert [(ticket.order_id, ticket.status) for ticket in kitchen.tickets()] == [(second, "Pending"), (first, "In Progress")]
+
+    orders.update_order_status(first, "Completed")
+    orders.cancel_order(second)
+    assert kitchen.tickets() == []
+
+
+def test_older_read_is_never_applied_over_a_newer_one(session, monkeypatch):
+    engine = session.get_bind()
+    order_id, = OrderController(session).create_orders([_order(10, 1)])
+    kitchen = get_kitchen_queue(session)
+    kitchen.load(session)
+    read, release = threading.Event(), threading.Event()
+    load_tickets = kitchen_queue.load_tickets
+
+    def slow_load_tickets(session, order_ids=None):
+        tickets = load_tickets(session, order_ids)
+        if threading.current_thread().name == "stale":
+            read.set()
+            release.wait(5)
+        return tickets
+
+    def refresh():
+        with Session(bind=engine) as reading:
+            kitchen.refresh(reading, [order_id])
+
+    def cancel():
+        with Session(bind=engine) as cancelling:
+            OrderController(cancelling).cancel_order(order_id)
+
+    monkeypatch.setattr(kitchen_queue, "load_tickets", slow_load_tickets)
+    stale = threading.Thread(target=refresh, name="stale")
+    stale.start()
+    read.wait(5)
+    # The cancellation commits after the stale read and must win, whichever refresh ends first.
+    cancelling = threading.Thread(target=cancel)
+    cancelling.start()
+    time.sleep(0.2)
+    release.set()
+    for thread in (stale, cancelling):
+        thread.join(5)
+
+    assert kitchen.tickets() == []
+
+
+def test_subscribers_receive_a_snapshot_then_deltas(session):
+    orders = OrderController(session)
+    first, = orders.create_orders([_order(10, 1)])
+
+    async def screen():
+        kitchen = get_kitchen_queue(session)
+        subscription = kitchen.subscribe(session=session)
+        received = [await subscription.__anext__()]
+        # Order changes arrive from other threads, such as the write queue or a POS terminal.
+        await asyncio.to_thread(orders.create_orders, [_order(5, 1, 2)])
+        await asyncio.to_thread(orders.cancel_order, first)
+        received += [await subscription.__anext__(), await subscription.__anext__()]
+        subscription.close()
+        received += [delta async for delta in subscription]
+        return received
+
+    snapshot, added, removed = asyncio.run(screen())
+
+    assert snapshot.kind == "snapshot" and _keys(snapshot.tickets) == [(first, 1)]
+    assert added.kind == "upsert" and [ticket.course for ticket in added.tickets] == [1, 2]
+    assert removed.kind == "remove" and _keys(removed.tickets) == [(first, 1)]
+    assert snapshot.version < added.version < removed.version
+
+
+def test_slow_subscriber_is_resynced_with_a_snapshot(session):
+    orders = OrderController(session)
+    kitchen = get_kitchen_queue(session)
+    kitchen.load(session)
+
+    async def screen():
+        subscription = kitchen.subscribe(max_backlog=2)
+        await subscription.__anext__()
+        for minutes in range(5):
+            orders.create_orders([_order(minutes, 1)])
+        await asyncio.sleep(0)  # let the loop run the deliveries
+        delta = await subscription.__anext__()
+        subscription.close()
+        return delta
+
+    delta = asyncio.run(screen())
+
+    assert delta.kind == "snapshot" and len(delta.tickets) == 5
@@ -0,0 +1,115 @@
+"""
+Tests for the in-memory menu catalog in database/menu_catalog.py.
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from controllers.restaurant.menu_controller import MenuController
+from controllers.validation.order_validation import validate_menu_item
+from database.bulk import BulkPersistenceService
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database import menu_catalog
+from database.menu_catalog import get_menu_catalog
+from models import MenuItem
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(str(tmp_path / "live.db"))
+    create_tables(engine)
+    session = Session(bind=engine, expire_on_commit=False)
+    menu = MenuController(session)
+    menu.add_menu_item("Burger", 9.5, "Mains")
+    menu.add_menu_item("Fries", 3, "Sides")
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def queries(session):
+    statements = []
+    engine = session.get_bind()
+    capture = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def test_reads_are_served_from_memory_after_the_first_load(session, queries):
+    menu = MenuController(session)
+    menu.get_all_menu_items()
+    queries.clear()
+
+    assert [item.name for item in menu.get_all_menu_items()] == ["Burger", "Fries"]
+    assert [item.name for item in menu.get_menu_items_by_category("Sides")] == ["Fries"]
+    assert validate_menu_item("1", session) and not validate_menu_item("99", session) and not validate_menu_item("x", session)
+    assert queries == []
+
+
+def test_menu_changes_patch_the_catalog(session):
+    menu = MenuController(session)
+    before = get_menu_catalog(session).snapshot(session)
+
+    menu.update_menu_item(1, price=10.25, category="Specials")
+    menu.update_availability(2, False)
+    item_id = menu.add_menu_item("Shake", 4.5, "Drinks")
+    menu.delete_menu_item(item_id)
+
+    after = get_menu_catalog(session).snapshot(session)
+    assert after.version > before.version and [item.name for item in before.items] == ["Burger", "Fries"]
+    assert after.by_id[1].price_cents == 1025 and list(after.by_category) == ["Specials", "Sides"]
+    assert after.available == (after.by_id[1],)
+    assert not validate_menu_item("2", session)
+
+
+def test_bulk_loads_invalidate_the_catalog(session):
+    menu = MenuController(session)
+    menu.get_all_menu_items()
+
+    BulkPersistenceService(session).bulk_insert(MenuItem, [{"name": "Salad", "price_cents": 700}])
+
+    assert [item.name for item in menu.get_all_menu_items()] == ["Burger", "Fries", "Salad"]
+
+
+def test_older_read_is_never_applied_over_a_newer_one(session, monkeypatch):
+    engine = session.get_bind()
+    catalog = get_menu_catalog(session)
+    catalog.snapshot(session)
+    read, release = threading.Event(), threading.Event()
+    load_menu_items = menu_catalog.load_menu_items
+
+    def slow_load_menu_items(session, *criteria):
+        items = load_menu_items(session, *criteria)
+        if threading.current_thread().name == "stale":
+            read.set()
+            release.wait(5)
+        return items
+
+    def refresh():
+        with Session(bind=engine) as reading:
+            catalog.refresh(reading, [1])
+
+    def reprice():
+        with Session(bind=engine, expire_on_commit=False) as writing:
+            MenuController(writing).update_menu_item(1, price=12)
+
+    monkeypatch.setattr(menu_catalog, "load_menu_items", slow_load_menu_items)
+    stale = threading.Thread(target=refresh, name="stale")
+    stale.start()
+    read.wait(5)
+    # The new price commits after the stale read and must win, whichever refresh ends first.
+    repricing = threading.Thread(target=reprice)
+    repricing.start()
+    time.sleep(0.2)
+    release.set()
+    for thread in (stale, repricing):
+        thread.join(5)
+
+    assert catalog.snapshot().by_id[1].price_cents == 1200
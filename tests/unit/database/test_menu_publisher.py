@@ -0,0 +1,66 @@
+"""
+Tests for the published menu document in database/menu_publisher.py.
+"""
+
+import gzip
+import json
+
+import pytest
+from sqlalchemy.orm import Session
+
+from controllers.restaurant.menu_controller import MenuController
+from database.bulk import BulkPersistenceService
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database.menu_catalog import get_menu_catalog
+from database.menu_publisher import get_menu_publisher
+from models import MenuItem
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(str(tmp_path / "live.db"))
+    create_tables(engine)
+    session = Session(bind=engine, expire_on_commit=False)
+    get_menu_publisher(session).output_dir = str(tmp_path / "public")
+    menu = MenuController(session)
+    menu.add_menu_item("Burger", 9.5, "Mains")
+    menu.add_menu_item("Fries", 3, "Sides", available=False)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_menu_is_served_compressed_and_revalidated_with_etag(session, tmp_path):
+    publisher = get_menu_publisher(session)
+
+    status, headers, body = publisher.respond(session=session)
+    document = json.loads(gzip.decompress(body))
+
+    assert status == 200 and headers["Content-Encoding"] == "gzip"
+    assert document["categories"] == ["Mains", "Sides"]
+    assert document["items"] == [[1, "Burger", 950, "Mains", True], [2, "Fries", 300, "Sides", False]]
+    assert publisher.respond(headers["ETag"], session) == (304, {"ETag": headers["ETag"], "Cache-Control": "no-cache"}, b"")
+    assert (tmp_path / "public" / "menu.json.gz").read_bytes() == body
+    assert (tmp_path / "public" / "menu.etag").read_text() == headers["ETag"]
+
+
+def test_menu_changes_publish_a_new_etag(session):
+    publisher = get_menu_publisher(session)
+    etag = publisher.respond(session=session)[1]["ETag"]
+
+    MenuController(session).update_availability(2, True)
+
+    assert publisher.respond(etag, session)[0] == 200
+    assert json.loads(gzip.decompress((publisher.respond(session=session)[2])))["items"][1][4] is True
+
+
+def test_reload_without_changes_keeps_the_etag(session):
+    publisher = get_menu_publisher(session)
+    etag = publisher.respond(session=session)[1]["ETag"]
+
+    get_menu_catalog(session).invalidate()
+    assert publisher.respond(etag, session)[0] == 304
+
+    BulkPersistenceService(session).bulk_insert(MenuItem, [{"name": "Salad", "price_cents": 700}])
+    assert publisher.respond(etag, session)[0] == 200
@@ -0,0 +1,66 @@
+"""
+Tests for the slow-query log in database/query_log.py.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import bindparam, create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from database.query_log import SlowQueryLog, summarize
+
+
+@pytest.fixture
+def slow_log(tmp_path):
+    engine = create_engine("sqlite://")
+    log = SlowQueryLog(str(tmp_path / "slow.jsonl"), threshold_ms=0)
+    log.install(engine)
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        yield log, conn
+    log.uninstall(engine)
+    log.close()
+    engine.dispose()
+
+
+def _records(log):
+    with open(log.log_path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_statement_is_recorded_with_caller_and_plan(slow_log):
+    log, conn = slow_log
+
+    conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": 1})
+
+    record = _records(log)[-1]
+    assert record["shape"] == "SELECT name FROM items WHERE id = ?"
+    assert record["parameters"] == [1]
+    assert record["caller"].endswith("test_statement_is_recorded_with_caller_and_plan")
+    assert record["plan"] and "items" in record["plan"][0]
+
+
+def test_failed_statements_leave_no_timing_behind(slow_log):
+    log, conn = slow_log
+    recorded = len(_records(log))
+
+    for _ in range(3):
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT missing FROM items"))
+    conn.execute(text("SELECT name FROM items"))
+
+    assert [record["statement"] for record in _records(log)[recorded:]] == ["SELECT name FROM items"]
+    assert not [key for key in conn.info if key.startswith("rms")]
+
+
+def test_summary_groups_statements_by_shape(slow_log):
+    log, conn = slow_log
+
+    for ids in ([1], [1, 2], [1, 2, 3]):
+        conn.execute(text("SELECT name FROM items WHERE id IN :ids").bindparams(bindparam("ids", expanding=True)), {"ids": ids})
+    conn.execute(text("SELECT count(*) FROM items"))
+
+    summary = {entry["shape"]: entry for entry in summarize(log.log_path)}
+    assert summary["SELECT name FROM items WHERE id IN (...)"]["count"] == 3
+    assert summary["SELECT count(*) FROM items"]["count"] == 1
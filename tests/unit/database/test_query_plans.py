@@ -0,0 +1,127 @@
+"""
+Query-plan regression tests for the index plan in database/create_tables.py.
+
+Each test runs a controller query against a freshly created schema, captures the SQL it
+issues and fails if SQLite's EXPLAIN QUERY PLAN reports a full scan of any table.
+"""
+
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from controllers.inventory.inventory_controller import InventoryController
+from controllers.reports.sales_report_controller import SalesReportController
+from controllers.restaurant.billing_controller import BillingController
+from controllers.restaurant.menu_controller import MenuController
+from controllers.restaurant.order_controller import OrderController
+from controllers.restaurant.reservation_controller import ReservationController
+from controllers.staff.attendence_controller import AttendanceController
+from controllers.staff.staff_controller import StaffController
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database.history import encode_cursor
+from database.kitchen_queue import load_tickets
+from models import Billing, Inventory, MenuItem, Order, OrderItem, RecipeIngredient, Reservation, Staff, Table
+from sqlalchemy.orm import Session
+
+FULL_SCAN = re.compile(r"^SCAN (?!CONSTANT ROW)")
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_db_engine(str(tmp_path / "plans.db"))
+    create_tables(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    session = Session(bind=engine)
+    now = datetime.now()
+    session.add_all([
+        MenuItem(item_id=1, name="Burger", price_cents=950),
+        Table(table_id=1, table_number=1, capacity=4),
+        Staff(staff_id=1, name="Sam", role="Chef"),
+        Inventory(item_id=1, name="Buns", quantity=3),
+        RecipeIngredient(menu_item_id=1, inventory_item_id=1, quantity=2),
+        Order(order_id=1, customer_id=7, total_cents=1900, created_at=now),
+        OrderItem(order_id=1, item_id=1, quantity=2, unit_price_cents=950),
+        Reservation(reservation_id=1, customer_id=7, table_id=1, reservation_date=now, num_guests=2),
+        Billing(bill_id=1, customer_id=7, reservation_id=1, order_id=1, total_cents=1900),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def captured(engine):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def assert_no_full_scans(engine, statements):
+    assert statements, "the controller call issued no queries"
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            scans = [row[3] for row in plan if FULL_SCAN.match(row[3])]
+            assert not scans, f"full table scan {scans} in:\n{statement}"
+
+
+CONTROLLER_QUERIES = {
+    "orders_by_date_range": lambda s: SalesReportController(s).get_total_sales(datetime.now() - timedelta(days=1), datetime.now()),
+    "orders_sales_trends": lambda s: SalesReportController(s).get_sales_trends(30),
+    "orders_by_customer": lambda s: OrderController(s).get_customer_orders(7),
+    "orders_by_customer_page": lambda s: OrderController(s).get_customer_orders_page(7, encode_cursor(datetime.now(), 1)),
+    "order_details": lambda s: OrderController(s).get_order_details(1),
+    "menu_item_update": lambda s: MenuController(s).update_availability(1, False),
+    "inventory_search_prefix": lambda s: InventoryController(s).search_item_by_name("bu"),
+    "order_status_update": lambda s: OrderController(s).update_order_status(1, "In Progress"),
+    "orders_by_status": lambda s: OrderController(s).get_orders_by_status("In Progress"),
+    "order_history": lambda s: OrderController(s).get_order_history(1),
+    "kitchen_open_orders": lambda s: load_tickets(s),
+    "kitchen_changed_orders": lambda s: load_tickets(s, [1]),
+    "order_pricing": lambda s: OrderController(s).price_orders([1]),
+    "order_prep_times": lambda s: OrderController(s).get_prep_time_stats(datetime.now() - timedelta(days=1), datetime.now()),
+    "reservation_availability": lambda s: ReservationController(s).check_availability(datetime.now(), 2),
+    "reservations_by_customer": lambda s: ReservationController(s).get_customer_reservations(7),
+    "reservation_details": lambda s: ReservationController(s).get_reservation_details(1),
+    "billing_history": lambda s: BillingController(s).get_billing_history(7),
+    "billing_history_page": lambda s: BillingController(s).get_billing_history_page(7, encode_cursor(datetime.now(), 1)),
+    "billing_invoices_for_date": lambda s: BillingController(s).load_invoices_for_date(datetime.now().date()),
+    "attendance_status": lambda s: AttendanceController(s).get_attendance_status(1, datetime.now()),
+    "attendance_clock_in": lambda s: AttendanceController(s).record_clock_in(1),
+    "staff_by_role": lambda s: StaffController(s).get_staff_by_role("Chef"),
+    "inventory_low_stock": lambda s: InventoryController(s).check_low_stock(5),
+    "inventory_stock_after_sale": lambda s: InventoryController(s).update_stock_after_sale(1, 1),
+    "inventory_stock_after_order": lambda s: InventoryController(s).update_stock_after_order({1: 1, 2: 1}),
+    "inventory_stock_for_dishes": lambda s: InventoryController(s).update_stock_for_dishes({1: 1}),
+}
+
+
+@pytest.mark.parametrize("query", CONTROLLER_QUERIES.values(), ids=CONTROLLER_QUERIES.keys())
+def test_controller_query_uses_an_index(engine, session, captured, query):
+    query(session)
+    assert_no_full_scans(engine, captured)
+
+
+def test_create_tables_adds_missing_indexes_to_existing_database(engine):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_orders_customer_created")
+
+    create_tables(engine)
+
+    with engine.connect() as conn:
+        names = {row[1] for row in conn.exec_driver_sql("PRAGMA index_list(orders)")}
+    assert "ix_orders_customer_created" in names
@@ -0,0 +1,117 @@
+"""
+Tests for the recipe-derived menu availability in database/recipes.py.
+"""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from controllers.inventory.inventory_controller import InventoryController
+from controllers.restaurant.menu_controller import MenuController
+from controllers.validation.order_validation import validate_menu_item
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database.menu_catalog import get_menu_catalog
+from models import Inventory, MenuItem
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(str(tmp_path / "recipes.db"))
+    create_tables(engine)
+    session = Session(bind=engine, expire_on_commit=False)
+    session.add_all([
+        Inventory(item_id=1, name="Buns", quantity=3),
+        Inventory(item_id=2, name="Patties", quantity=10),
+        Inventory(item_id=3, name="Potatoes", quantity=10),
+    ])
+    session.commit()
+    menu = MenuController(session)
+    menu.add_menu_item("Burger", 9.5, "Mains")       # 1
+    menu.add_menu_item("Double Burger", 12, "Mains")  # 2
+    menu.add_menu_item("Fries", 3, "Sides")          # 3
+    menu.set_recipe(1, {1: 1, 2: 1})
+    menu.set_recipe(2, {1: 1, 2: 2})
+    menu.set_recipe(3, {3: 2})
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def available(session):
+    return [item.name for item in get_menu_catalog(session).snapshot(session).available]
+
+
+def test_recipe_round_trip(session):
+    menu = MenuController(session)
+    assert menu.get_recipe(2) == {1: 1, 2: 2}
+    assert menu.set_recipe(2, {})
+    assert menu.get_recipe(2) == {}
+    assert not menu.set_recipe(99, {1: 1})
+
+
+def test_dishes_consume_their_ingredients(session):
+    inventory = InventoryController(session)
+    assert inventory.update_stock_for_dishes({1: 1, 3: 2})
+    assert session.get(Inventory, 1, populate_existing=True).quantity == 2
+    assert session.get(Inventory, 2, populate_existing=True).quantity == 9
+    assert session.get(Inventory, 3, populate_existing=True).quantity == 6
+
+    # Four buns are needed, two are left: nothing is consumed.
+    assert not inventory.update_stock_for_dishes({1: 4})
+    assert session.get(Inventory, 1, populate_existing=True).quantity == 2
+
+
+def test_running_out_flips_only_the_dishes_using_the_ingredient(session):
+    menu = MenuController(session)
+    get_menu_catalog(session).snapshot(session)
+    InventoryController(session).update_stock_after_order({1: 3})
+
+    assert available(session) == ["Fries"]
+    assert not validate_menu_item(1, session) and not validate_menu_item(2, session)
+    assert [item.available for item in menu.get_all_menu_items()] == [False, False, True]
+    # The switch set by staff is left alone.
+    assert session.get(MenuItem, 1, populate_existing=True).available
+
+
+def test_restocking_puts_dishes_back_on_the_menu(session):
+    inventory = InventoryController(session)
+    inventory.update_stock_after_order({1: 3, 2: 9})
+    assert available(session) == ["Fries"]
+
+    inventory.update_item(1, quantity=5)
+    assert available(session) == ["Burger", "Fries"]
+    inventory.update_item(2, quantity=2)
+    assert available(session) == ["Burger", "Double Burger", "Fries"]
+
+
+def test_only_affected_dishes_are_recomputed(session):
+    statements = []
+    engine = session.get_bind()
+    capture = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        InventoryController(session).update_stock_after_order({3: 1})
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    # Fries is still in stock, so no menu item is written and the catalog is not reloaded.
+    assert not any(statement.lstrip().startswith("SELECT menu_items") for statement in statements)
+
+
+def test_switched_off_dishes_stay_off_after_restock(session):
+    MenuController(session).update_availability(3, False)
+    inventory = InventoryController(session)
+    inventory.update_stock_after_order({3: 9})
+    inventory.update_item(3, quantity=20)
+    assert available(session) == ["Burger", "Double Burger"]
+
+
+def test_import_recomputes_every_dish(session, tmp_path):
+    InventoryController(session).update_stock_after_order({1: 3})
+    path = tmp_path / "stock.csv"
+    path.write_text("name,quantity\nBuns,50\nPotatoes,1\n")
+
+    report = InventoryController(session).import_inventory_csv(str(path))
+
+    assert report.updated == 2
+    assert available(session) == ["Burger", "Double Burger"]
@@ -0,0 +1,84 @@
+"""
+Tests for the incrementally maintained sales rollup in database/sales_rollup.py.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from controllers.reports.sales_report_controller import SalesReportController
+from controllers.restaurant.order_controller import OrderController
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database.sales_rollup import rebuild_sales_rollup
+from models import MenuItem, Order, SalesRollup
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(str(tmp_path / "live.db"))
+    create_tables(engine)
+    session = Session(bind=engine)
+    session.add_all([MenuItem(item_id=1, name="Burger", price_cents=950), MenuItem(item_id=2, name="Fries", price_cents=300)])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _rollup(session):
+    return session.execute(select(SalesRollup).order_by(SalesRollup.day, SalesRollup.hour, SalesRollup.item_id)).scalars().all()
+
+
+def _place(session, placed_at, items):
+    return OrderController(session).create_orders([{"customer_id": 7, "items": items, "created_at": placed_at}])[0]
+
+
+def test_incremental_rollup_matches_rebuild(session):
+    _place(session, datetime(2026, 3, 1, 12, 15), [{"item_id": 1, "quantity": 2}, {"item_id": 2}])
+    _place(session, datetime(2026, 3, 1, 12, 40), [{"item_id": 1}])
+    cancelled = _place(session, datetime(2026, 3, 2, 9, 5), [{"item_id": 2, "quantity": 4}])
+    OrderController(session).cancel_order(cancelled)
+
+    incremental = [(row.day, row.hour, row.item_id, row.quantity, row.revenue_cents, row.order_count) for row in _rollup(session)]
+    rebuild_sales_rollup(session, include_archive=False)
+    rebuilt = [(row.day, row.hour, row.item_id, row.quantity, row.revenue_cents, row.order_count) for row in _rollup(session)]
+
+    assert [row for row in incremental if row[3]] == rebuilt
+    assert rebuilt[0][1:] == (12, 1, 3, 2850, 2)
+
+
+def test_total_sales_adds_partial_hours_from_orders(session):
+    _place(session, datetime(2026, 3, 1, 11, 50), [{"item_id": 1}])
+    _place(session, datetime(2026, 3, 1, 12, 30), [{"item_id": 2}])
+    _place(session, datetime(2026, 3, 2, 8, 10), [{"item_id": 1, "quantity": 2}])
+    _place(session, datetime(2026, 3, 2, 8, 50), [{"item_id": 2}])
+    reports = SalesReportController(session)
+
+    assert reports.get_total_sales(datetime(2026, 3, 1, 11, 45), datetime(2026, 3, 2, 8, 30)) == 950 + 300 + 1900
+    assert reports.get_total_sales(datetime(2026, 3, 1, 11, 55), datetime(2026, 3, 1, 12, 45)) == 300
+    assert reports.get_total_sales(datetime(2026, 3, 1), datetime(2026, 3, 3)) == 950 + 300 + 1900 + 300
+    assert reports.get_top_selling_items(1) == [{"item_id": 1, "name": "Burger", "quantity": 3, "revenue_cents": 2850}]
+
+
+def test_partial_hours_are_measured_like_the_rollup(session):
+    order_id = _place(session, datetime(2026, 3, 1, 12, 15), [{"item_id": 1, "quantity": 2}])
+    # The order total carries tax, which the rollup does not count.
+    assert session.get(Order, order_id).total_cents == 2090
+    reports = SalesReportController(session)
+
+    assert reports.get_total_sales(datetime(2026, 3, 1, 12), datetime(2026, 3, 1, 13)) == 1900
+    assert reports.get_total_sales(datetime(2026, 3, 1, 12, 10), datetime(2026, 3, 1, 12, 20)) == 1900
+
+
+def test_sales_trends_have_one_bucket_per_day(session):
+    today = datetime.now().replace(hour=0, minute=30, second=0, microsecond=0)
+    for days_ago, item_id in ((0, 1), (2, 2), (3, 1)):
+        _place(session, today - timedelta(days=days_ago), [{"item_id": item_id}])
+
+    trends = SalesReportController(session).get_sales_trends(3)
+
+    assert [day["date"] for day in trends] == [(today - timedelta(days=n)).date().isoformat() for n in (2, 1, 0)]
+    assert [day["revenue_cents"] for day in trends] == [300, 0, 950]
@@ -0,0 +1,68 @@
+"""
+Tests for the FTS5 name search in database/search.py.
+"""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from controllers.inventory.inventory_controller import InventoryController
+from controllers.restaurant.menu_controller import MenuController
+from database.bulk import BulkPersistenceService
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from models import Inventory
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(str(tmp_path / "live.db"))
+    create_tables(engine)
+    session = Session(bind=engine, expire_on_commit=False)
+    menu = MenuController(session)
+    for name in ("Cheeseburger", "Veggie Burger", "Burrito Bowl", "Caesar Salad"):
+        menu.add_menu_item(name, 9.5, "Mains")
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def names(items):
+    return [item.name for item in items]
+
+
+def test_substring_search_ranks_and_ignores_case(session):
+    menu = MenuController(session)
+
+    assert sorted(names(menu.search_menu_item_by_name("BURG"))) == ["Cheeseburger", "Veggie Burger"]
+    assert names(menu.search_menu_item_by_name("salad")) == ["Caesar Salad"]
+    assert names(menu.search_menu_item_by_name('"; DROP')) == []
+
+
+def test_typos_fall_back_to_trigram_overlap(session):
+    assert names(MenuController(session).search_menu_item_by_name("burritto"))[0] == "Burrito Bowl"
+
+
+def test_short_queries_match_name_prefixes(session):
+    assert names(MenuController(session).search_menu_item_by_name("ca")) == ["Caesar Salad"]
+
+
+def test_triggers_follow_renames_deletes_and_bulk_loads(session):
+    menu = MenuController(session)
+    menu.update_menu_item(4, name="Greek Salad")
+    menu.delete_menu_item(3)
+    BulkPersistenceService(session).bulk_insert(Inventory, [{"name": "Burger Buns", "quantity": 40}, {"name": "Lettuce", "quantity": 5}])
+
+    assert names(menu.search_menu_item_by_name("greek")) == ["Greek Salad"]
+    assert names(menu.search_menu_item_by_name("caesar")) == []
+    assert names(menu.search_menu_item_by_name("burrito")) == []
+    assert InventoryController(session).search_item_by_name("buns") == [{"item_id": 1, "name": "Burger Buns", "quantity": 40, "price": 0.0}]
+
+
+def test_create_tables_indexes_existing_rows(session):
+    engine = session.get_bind()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE menu_items_fts")
+
+    create_tables(engine)
+
+    assert sorted(names(MenuController(session).search_menu_item_by_name("burger"))) == ["Cheeseburger", "Veggie Burger"]
@@ -0,0 +1,138 @@
+"""
+Tests for the single-writer group-commit queue in database/write_queue.py.
+"""
+
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from database import connection
+from database.connection import create_db_engine
+from database.create_tables import create_tables
+from database.write_queue import WriteQueue, end_read
+from models import MenuItem
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    # Give up on a locked database quickly.
+    monkeypatch.setitem(connection.SQLITE_PRAGMAS, "busy_timeout", 50)
+    engine = create_db_engine(str(tmp_path / "writes.db"))
+    create_tables(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def commits(engine):
+    count = []
+    event.listen(engine, "commit", lambda conn: count.append(1))
+    return count
+
+
+def _queue(engine, **options):
+    factory = sessionmaker(bind=engine.execution_options(sqlite_begin="IMMEDIATE"), autoflush=False, expire_on_commit=False)
+    return WriteQueue(session_factory=factory, **options)
+
+
+def _add(name, fail=False):
+    def work(session):
+        item = MenuItem(name=name, price_cents=100)
+        session.add(item)
+        session.flush()
+        if fail:
+            raise ValueError(name)
+        return item.item_id
+    return work
+
+
+def _names(engine):
+    with Session(bind=engine) as session:
+        return session.scalars(select(MenuItem.name).order_by(MenuItem.item_id)).all()
+
+
+def test_units_are_committed_together(engine, commits):
+    writes = _queue(engine, max_wait=0.5)
+
+    futures = [writes.submit(_add(f"Item {i}")) for i in range(10)]
+    ids = [future.result(timeout=10) for future in futures]
+    writes.stop()
+
+    assert ids == list(range(1, 11))
+    assert len(commits) == 1
+    assert _names(engine) == [f"Item {i}" for i in range(10)]
+
+
+def test_failing_unit_is_rolled_back_alone(engine):
+    writes = _queue(engine, max_wait=0.5)
+
+    burger, broken, fries = (writes.submit(work) for work in (_add("Burger"), _add("Broken", fail=True), _add("Fries")))
+    writes.stop()
+
+    with pytest.raises(ValueError, match="Broken"):
+        broken.result(timeout=10)
+    assert burger.result(timeout=10) and fries.result(timeout=10)
+    assert _names(engine) == ["Burger", "Fries"]
+
+
+def test_failed_commit_fails_every_unit_of_the_batch(engine):
+    def dangling_category(session):
+        # Deferred foreign keys are only checked when the batch commits.
+        session.execute(text("PRAGMA defer_foreign_keys=ON"))
+        session.add(MenuItem(name="Orphan", price_cents=100, category_id=99))
+        session.flush()
+
+    writes = _queue(engine, max_wait=0.5)
+
+    futures = [writes.submit(work) for work in (_add("Burger"), dangling_category, _add("Fries"))]
+    for future in futures:
+        with pytest.raises(IntegrityError, match="FOREIGN KEY"):
+            future.result(timeout=10)
+    writes.stop()
+    assert _names(engine) == []
+
+
+def test_batch_that_cannot_take_the_write_lock_fails_every_unit(engine):
+    writes = _queue(engine, max_wait=0.5)
+    holder = engine.raw_connection()
+    holder.execute("BEGIN IMMEDIATE")
+    try:
+        futures = [writes.submit(_add(f"Item {i}")) for i in range(3)]
+        for future in futures:
+            with pytest.raises(OperationalError, match="locked"):
+                future.result(timeout=10)
+    finally:
+        holder.rollback()
+        holder.close()
+
+    # The writer thread survives the failed batch.
+    assert writes.submit(_add("Burger")).result(timeout=10)
+    writes.stop()
+    assert _names(engine) == ["Burger"]
+
+
+def test_stop_commits_pending_work(engine):
+    writes = _queue(engine, batch_size=2)
+
+    futures = [writes.submit(_add(f"Item {i}")) for i in range(5)]
+    writes.stop(timeout=10)
+
+    assert all(future.done() for future in futures)
+    assert len(_names(engine)) == 5
+    # A stopped queue starts again on the next submit.
+    assert writes.submit(_add("Late")).result(timeout=10) == 6
+    writes.stop()
+
+
+def test_end_read_releases_the_snapshot(engine):
+    with Session(bind=engine) as reader, Session(bind=engine) as writer:
+        assert reader.scalars(select(MenuItem.name)).all() == []
+        writer.add(MenuItem(name="Burger", price_cents=950))
+        writer.commit()
+
+        end_read(reader)
+        end_read(reader)  # nothing to end
+
+        assert not reader.in_transaction()
+        assert reader.scalars(select(MenuItem.name)).all() == ["Burger"]